@@ -1,5 +1,6 @@
 # Flask 앱 초기화
 
+import os
 from flask import Flask, Blueprint
 from flask_caching import Cache
 from flask_migrate import Migrate
@@ -21,12 +22,15 @@ def create_app():
     """
     app = Flask(__name__)
 
-    # Flask-Caching 설정
-    app.config['CACHE_TYPE'] = 'RedisCache'
+    # Flask-Caching 설정 (Redis 앞에 프로세스 내 LRU 캐시를 둔 2단계 캐시)
+    app.config['CACHE_TYPE'] = 'app.layered_cache.LayeredRedisCache'
     app.config['CACHE_REDIS_HOST'] = 'redis_container'  # Redis 서버 호스트
     app.config['CACHE_REDIS_PORT'] = 6379               # Redis 서버 포트
     app.config['CACHE_REDIS_DB'] = 1                    # Redis DB 인덱스 (기본: 0)
     app.config['CACHE_DEFAULT_TIMEOUT'] = 1000          # 캐싱 데이터의 기본 유효 기간 (초)
+    app.config['CACHE_LOCAL_MAX_BYTES'] = int(os.getenv('CACHE_LOCAL_MAX_BYTES', 64 * 1024 * 1024))  # 프로세스 내 캐시 최대 크기
+    app.config['CACHE_LOCAL_TTL'] = float(os.getenv('CACHE_LOCAL_TTL', 60))  # 프로세스 내 캐시 유효 기간 (초)
+    app.config['CACHE_LOCAL_ENABLED'] = os.getenv('CACHE_LOCAL_ENABLED', 'true').lower() == 'true'
 
     # 캐싱 초기화
     cache.init_app(app)
@@ -3,9 +3,13 @@
 import logging
 import time
 from contextlib import contextmanager
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 from sqlalchemy.exc import OperationalError
 from app.db.session_manager import Session
 
+# 한 번의 INSERT 문에 담을 최대 행 수
+UPSERT_BATCH_SIZE = 1000
+
 
 def retry_query(session, query, retries=3, delay=5):
     """
@@ -32,6 +36,68 @@ def retry_query(session, query, retries=3, delay=5):
                 return None
 
 
+def retry_execute(session, statement, params=None, retries=3, delay=5):
+    """
+    Core select 문을 재시도하며 실행하는 함수 (ORM 객체를 만들지 않고 Row 튜플을 반환)
+
+    Args:
+        session: SQLAlchemy 세션
+        statement: 실행할 select 문
+        params (dict): 바인드 파라미터
+        retries: 재시도 횟수
+        delay: 재시도 전 대기 시간 (초 단위)
+
+    Returns:
+        Row 리스트 또는 예외 발생 시 None 반환
+    """
+    for i in range(retries):
+        try:
+            return session.execute(statement, params or {}).all()
+        except OperationalError as e:
+            if i < retries - 1:
+                logging.warning(f"Query failed with error: {e}. Retrying in {delay} seconds...")
+                time.sleep(delay)
+            else:
+                logging.error(f"All retries failed for query: {e}")
+                return None
+
+
+def bulk_upsert(session, table, rows, key_columns, update_columns, batch_size=UPSERT_BATCH_SIZE):
+    """
+    여러 행을 다중 행 INSERT 문으로 일괄 삽입하고, 키가 중복되는 행은 갱신하는 함수.
+    MariaDB/MySQL은 ON DUPLICATE KEY UPDATE, SQLite/PostgreSQL은 ON CONFLICT DO UPDATE를 사용한다.
+
+    Args:
+        session: SQLAlchemy 세션
+        table (Table): 대상 테이블 (key_columns에 대한 고유 제약 조건 필요)
+        rows (list): 삽입할 행 딕셔너리 리스트
+        key_columns (list): 중복 판단 기준 컬럼 이름 리스트
+        update_columns (list): 중복 시 갱신할 컬럼 이름 리스트
+        batch_size (int): INSERT 문 하나에 담을 최대 행 수
+
+    Returns:
+        int: 처리한 행 수
+    """
+    dialect_name = session.get_bind().dialect.name
+
+    if dialect_name in ('mysql', 'mariadb'):
+        stmt = mysql.insert(table)
+        stmt = stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in update_columns})
+    elif dialect_name in ('sqlite', 'postgresql'):
+        dialect_module = sqlite if dialect_name == 'sqlite' else postgresql
+        stmt = dialect_module.insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=key_columns,
+            set_={column: stmt.excluded[column] for column in update_columns}
+        )
+    else:
+        raise ValueError(f"Unsupported database dialect for upsert: {dialect_name}")
+
+    for start in range(0, len(rows), batch_size):
+        session.execute(stmt.values(rows[start:start + batch_size]))  # 배치당 다중 행 INSERT 한 번
+    return len(rows)
+
+
 @contextmanager
 def get_session():
     """
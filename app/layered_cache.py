@@ -0,0 +1,334 @@
+# layered_cache.py
+# Redis 앞에 프로세스 내 LRU 캐시를 두는 Flask-Caching 백엔드 (CACHE_TYPE = 'app.layered_cache.LayeredRedisCache')
+
+import os
+import json
+import time
+import uuid
+import logging
+import threading
+from collections import OrderedDict
+from flask_caching.backends.rediscache import RedisCache
+
+# memoize가 함수별 버전 키에 붙이는 접미사 (함수별 통계 집계에 사용)
+MEMOIZE_VERSION_SUFFIX = "_memver"
+
+# 무효화 채널 구독이 끊겼을 때 다시 연결하기까지 대기 시간 (초)
+SUBSCRIBER_RECONNECT_DELAY = 1.0
+
+# 로컬 캐시 한 항목의 최대 크기 (전체 최대 크기 대비 비율) - 큰 항목 하나가 캐시를 모두 밀어내지 않도록 함
+LOCAL_MAX_ENTRY_RATIO = 0.25
+
+
+class LayeredRedisCache(RedisCache):
+    """
+    Redis 캐시 앞에 크기 제한과 유효 시간이 있는 프로세스 내 LRU 캐시를 두는 백엔드.
+
+    - 로컬 적중 시 네트워크 왕복 없이 로컬에 둔 직렬화 바이트를 역직렬화해 반환한다.
+      (요청마다 새 객체를 받으므로 호출부가 결과를 수정해도 다른 요청에 영향이 없음)
+    - 항목 크기는 Redis에 저장된 직렬화 바이트 수로 계산하며, 총 크기를 넘으면 가장 오래 사용하지 않은 항목부터 제거한다.
+    - 로컬 유효 시간은 CACHE_LOCAL_TTL과 Redis에 남은 유효 시간 중 짧은 쪽이다.
+    - 쓰기/삭제는 Redis pub/sub으로 다른 워커 프로세스에 알려 해당 로컬 항목을 지우며,
+      구독이 끊긴 동안에는 변경을 놓칠 수 있으므로 로컬 캐시를 사용하지 않는다.
+    """
+
+    def __init__(self, *args, local_max_bytes=64 * 1024 * 1024, local_ttl=60, local_enabled=True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.local_max_bytes = local_max_bytes
+        self.local_ttl = local_ttl
+        self.local_enabled = local_enabled
+        self.invalidation_channel = f"{self.key_prefix}cache_invalidation"
+
+        # 로컬 항목 {키: (만료 시각(monotonic), 직렬화된 값, 크기)} - 사용 순서대로 유지
+        self._local = OrderedDict()
+        self._local_bytes = 0
+        self._local_lock = threading.Lock()
+        # 무효화가 일어날 때마다 증가 (Redis에서 읽는 동안 무효화된 값을 로컬에 저장하지 않도록 비교)
+        self._generation = 0
+
+        # 함수별 통계 {함수 이름: {"local_hits", "redis_hits", "misses"}}
+        self._function_stats = {}
+        self._evictions = 0
+        self._invalidations = 0
+        # 현재 스레드에서 조회 중인 memoize 함수 이름 (버전 키 조회 직후 값 조회가 이어짐)
+        self._lookup = threading.local()
+
+        self._instance_id = uuid.uuid4().hex
+        self._subscribed = False
+        self._subscriber_pid = None
+        self._subscriber_lock = threading.Lock()
+
+    @classmethod
+    def factory(cls, app, config, args, kwargs):
+        kwargs.update(
+            local_max_bytes=int(config.get("CACHE_LOCAL_MAX_BYTES", 64 * 1024 * 1024)),
+            local_ttl=float(config.get("CACHE_LOCAL_TTL", 60)),
+            local_enabled=bool(config.get("CACHE_LOCAL_ENABLED", True))
+        )
+        return super().factory(app, config, args, kwargs)
+
+    # ----- 무효화 구독 -----
+
+    def _ensure_subscriber(self):
+        """
+        현재 프로세스에서 무효화 채널 구독 스레드를 한 번만 시작하는 함수 (포크된 워커에서도 새로 시작)
+        """
+        pid = os.getpid()
+        if not self.local_enabled or self._subscriber_pid == pid:
+            return
+        with self._subscriber_lock:
+            if self._subscriber_pid == pid:
+                return
+            self._subscriber_pid = pid
+            self._subscribed = False
+            self._clear_local()
+            threading.Thread(target=self._listen_invalidations, name="cache-invalidation", daemon=True).start()
+
+    def _listen_invalidations(self):
+        while True:
+            try:
+                pubsub = self._read_client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.invalidation_channel)
+                # 구독 전의 변경은 받지 못했으므로 로컬 캐시를 비운 뒤 사용 시작
+                self._clear_local()
+                self._subscribed = True
+                for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._apply_invalidation(message["data"])
+            except Exception as e:
+                logging.warning(f"Cache invalidation subscriber disconnected: {e}")
+            finally:
+                self._subscribed = False
+                self._clear_local()
+            time.sleep(SUBSCRIBER_RECONNECT_DELAY)
+
+    def _apply_invalidation(self, data):
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if message.get("source") == self._instance_id:
+            return  # 자기 프로세스에서 보낸 메시지는 이미 반영됨
+        keys = message.get("keys")
+        if keys is None:
+            self._clear_local()
+        else:
+            self._discard_local(keys)
+
+    def _invalidate(self, keys):
+        """
+        로컬 항목을 지우고 다른 프로세스에 무효화를 알리는 함수
+
+        Args:
+            keys (list): 무효화할 키 리스트 (None이면 전체)
+        """
+        if not self.local_enabled:
+            return
+        if keys is None:
+            self._clear_local()
+        else:
+            self._discard_local(keys)
+        try:
+            self._write_client.publish(self.invalidation_channel,
+                                       json.dumps({"source": self._instance_id, "keys": keys}))
+        except Exception as e:
+            logging.warning(f"Failed to publish cache invalidation: {e}")
+
+    # ----- 로컬 캐시 -----
+
+    def _local_get(self, key):
+        """
+        Returns:
+            tuple: (로컬 적중 여부, 직렬화된 값)
+        """
+        if not (self.local_enabled and self._subscribed):
+            return False, None
+        with self._local_lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return False, None
+            expires_at, raw, size = entry
+            if expires_at <= time.monotonic():
+                del self._local[key]
+                self._local_bytes -= size
+                return False, None
+            self._local.move_to_end(key)
+            return True, raw
+
+    def _local_store(self, key, raw, ttl_ms, generation):
+        size = len(raw)
+        # 남은 유효 시간: -1은 만료 없음, -2는 키 없음
+        ttl = self.local_ttl if ttl_ms == -1 else min(self.local_ttl, ttl_ms / 1000)
+        if not (self.local_enabled and self._subscribed) or ttl <= 0 \
+                or size > self.local_max_bytes * LOCAL_MAX_ENTRY_RATIO:
+            return
+        with self._local_lock:
+            if generation != self._generation:
+                return  # Redis에서 읽는 동안 무효화됨
+            previous = self._local.pop(key, None)
+            if previous is not None:
+                self._local_bytes -= previous[2]
+            self._local[key] = (time.monotonic() + ttl, raw, size)
+            self._local_bytes += size
+            while self._local_bytes > self.local_max_bytes:
+                _, (_, _, evicted_size) = self._local.popitem(last=False)
+                self._local_bytes -= evicted_size
+                self._evictions += 1
+
+    def _discard_local(self, keys):
+        with self._local_lock:
+            self._generation += 1
+            self._invalidations += 1
+            for key in keys:
+                entry = self._local.pop(key, None)
+                if entry is not None:
+                    self._local_bytes -= entry[2]
+
+    def _clear_local(self):
+        with self._local_lock:
+            self._generation += 1
+            self._local.clear()
+            self._local_bytes = 0
+
+    def _fetch(self, keys):
+        """
+        Redis에서 값과 남은 유효 시간을 한 번의 왕복(파이프라인)으로 가져오는 함수
+
+        Returns:
+            list: (직렬화된 값 또는 None, 남은 유효 시간(ms)) 튜플 리스트
+        """
+        pipe = self._read_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.get(self.key_prefix + key)
+            pipe.pttl(self.key_prefix + key)
+        results = pipe.execute()
+        return list(zip(results[::2], results[1::2]))
+
+    def _count(self, function_name, outcome):
+        with self._local_lock:
+            counts = self._function_stats.setdefault(function_name or "other",
+                                                     {"local_hits": 0, "redis_hits": 0, "misses": 0})
+            counts[outcome] += 1
+
+    # ----- 캐시 인터페이스 -----
+
+    def get(self, key):
+        self._ensure_subscriber()
+        function_name = getattr(self._lookup, "function", None)
+        self._lookup.function = None
+
+        found, raw = self._local_get(key)
+        if found:
+            self._count(function_name, "local_hits")
+            return self.serializer.loads(raw)
+
+        generation = self._generation
+        raw, ttl_ms = self._fetch([key])[0]
+        if raw is None:
+            self._count(function_name, "misses")
+            return None
+
+        self._count(function_name, "redis_hits")
+        self._local_store(key, raw, ttl_ms, generation)
+        return self.serializer.loads(raw)
+
+    def get_many(self, *keys):
+        self._ensure_subscriber()
+        # memoize는 값 조회 전에 함수별 버전 키를 먼저 조회하므로 이어지는 get을 해당 함수로 집계
+        if keys and keys[0].endswith(MEMOIZE_VERSION_SUFFIX):
+            self._lookup.function = keys[0][:-len(MEMOIZE_VERSION_SUFFIX)]
+
+        values = []
+        missing = []
+        for index, key in enumerate(keys):
+            found, raw = self._local_get(key)
+            values.append(self.serializer.loads(raw) if found else None)
+            if not found:
+                missing.append(index)
+
+        if missing:
+            generation = self._generation
+            for index, (raw, ttl_ms) in zip(missing, self._fetch([keys[index] for index in missing])):
+                if raw is not None:
+                    values[index] = self.serializer.loads(raw)
+                    self._local_store(keys[index], raw, ttl_ms, generation)
+        return values
+
+    def has(self, key):
+        self._ensure_subscriber()
+        found, _ = self._local_get(key)
+        return found or super().has(key)
+
+    def set(self, key, value, timeout=None):
+        result = super().set(key, value, timeout)
+        self._invalidate([key])
+        return result
+
+    def add(self, key, value, timeout=None):
+        result = super().add(key, value, timeout)
+        if result:
+            self._invalidate([key])
+        return result
+
+    def set_many(self, mapping, timeout=None):
+        result = super().set_many(mapping, timeout)
+        self._invalidate(list(mapping))
+        return result
+
+    def delete(self, key):
+        result = super().delete(key)
+        self._invalidate([key])
+        return result
+
+    def delete_many(self, *keys):
+        result = super().delete_many(*keys)
+        self._invalidate(list(keys))
+        return result
+
+    def unlink(self, *keys):
+        result = super().unlink(*keys)
+        self._invalidate(list(keys))
+        return result
+
+    def inc(self, key, delta=1):
+        result = super().inc(key, delta)
+        self._invalidate([key])
+        return result
+
+    def dec(self, key, delta=1):
+        result = super().dec(key, delta)
+        self._invalidate([key])
+        return result
+
+    def clear(self):
+        result = super().clear()
+        self._invalidate(None)
+        return result
+
+    def get_local_stats(self):
+        """
+        프로세스 내 캐시의 크기와 함수별 적중/미적중 건수를 반환하는 함수
+
+        Returns:
+            dict: 로컬 캐시 통계
+        """
+        with self._local_lock:
+            functions = {name: dict(counts) for name, counts in self._function_stats.items()}
+            stats = {
+                "enabled": self.local_enabled,
+                "subscribed": self._subscribed,
+                "entries": len(self._local),
+                "bytes": self._local_bytes,
+                "max_bytes": self.local_max_bytes,
+                "ttl": self.local_ttl,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations
+            }
+        for counts in functions.values():
+            lookups = counts["local_hits"] + counts["redis_hits"] + counts["misses"]
+            counts["local_hit_rate"] = round(counts["local_hits"] / lookups, 3) if lookups else 0.0
+        stats["functions"] = functions
+        return stats
+
+
+__all__ = ['LayeredRedisCache']
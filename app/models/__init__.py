@@ -1,5 +1,7 @@
 # models/__init__.py
 
-from .planet_raw_data import PlanetRawData
+from .planet_raw_data import PlanetRawData, PlanetEphemeris
 from .meteor_shower_raw_data import MeteorShowerInfo
-
+from .opposition_event import OppositionEvent
+from .comet_record import CometRecord
+from .comet_elements import CometElements
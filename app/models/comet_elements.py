@@ -0,0 +1,25 @@
+# models/comet_elements.py
+
+from .. import db
+
+
+class CometElements(db.Model):
+    """
+    혜성 고유 번호별 태양 중심 접촉 궤도 요소 (황도 J2000, Horizons ELEMENTS 결과).
+    로컬 혜성 위치 계산에 사용하며 Horizons는 궤도 요소 갱신에만 사용한다.
+    """
+    __tablename__ = 'comet_elements'
+
+    designation = db.Column(db.String(20), primary_key=True)
+    record_number = db.Column(db.String(20), nullable=False)
+    epoch_jd = db.Column(db.Double, nullable=False)  # 궤도 요소 기준 시각 (TDB 율리우스일)
+    eccentricity = db.Column(db.Double, nullable=False)  # EC
+    perihelion_distance_au = db.Column(db.Double, nullable=False)  # QR
+    inclination_degrees = db.Column(db.Double, nullable=False)  # IN
+    longitude_of_ascending_node_degrees = db.Column(db.Double, nullable=False)  # OM
+    argument_of_perihelion_degrees = db.Column(db.Double, nullable=False)  # W
+    perihelion_time_jd = db.Column(db.Double, nullable=False)  # Tp (TDB 율리우스일)
+    updated_at = db.Column(db.DateTime, nullable=False)  # 마지막 갱신 시각 (UTC)
+
+    def __repr__(self):
+        return f"<CometElements {self.designation} - epoch {self.epoch_jd}>"
@@ -0,0 +1,19 @@
+# models/comet_record.py
+
+from .. import db
+
+
+class CometRecord(db.Model):
+    """
+    혜성 고유 번호(예: 1P)별 Horizons 최신 궤도 레코드 번호 저장 테이블.
+    혜성 요청마다 레코드 번호 조회 요청을 보내지 않도록 주기적으로 갱신해 재사용한다.
+    """
+    __tablename__ = 'comet_records'
+
+    designation = db.Column(db.String(20), primary_key=True)
+    record_number = db.Column(db.String(20), nullable=False)
+    epoch_year = db.Column(db.Integer, nullable=False)
+    updated_at = db.Column(db.DateTime, nullable=False)  # 마지막 갱신 시각 (UTC)
+
+    def __repr__(self):
+        return f"<CometRecord {self.designation} - {self.record_number} ({self.epoch_year})>"
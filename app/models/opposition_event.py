@@ -0,0 +1,21 @@
+# models/opposition_event.py
+
+from .. import db
+
+
+class OppositionEvent(db.Model):
+    """
+    적재 시 일별 원시 데이터에서 찾아둔 행성 이벤트 인덱스 테이블.
+    (planet_name, event_date, event_type) 기본 키 범위 조회로 여러 해의 이벤트를 한 번에 읽는다.
+    """
+    __tablename__ = 'opposition_events'
+
+    planet_name = db.Column(db.String(50), primary_key=True)
+    event_date = db.Column(db.Date, primary_key=True)
+    event_type = db.Column(db.String(30), primary_key=True)  # closest_approach / opposition / greatest_elongation
+    event_time = db.Column(db.DateTime, nullable=False)  # 이벤트 시각 (UTC)
+    distance = db.Column(db.Float, nullable=False)
+    s_o_t = db.Column(db.Float, nullable=False)
+
+    def __repr__(self):
+        return f"<OppositionEvent {self.planet_name} - {self.event_type} {self.event_time}>"
@@ -13,19 +13,14 @@ class PlanetRawData(db.Model):
     s_o_t = db.Column(db.Float, nullable=False)
 
 
-def get_planet_raw_data_model(year):
+class PlanetEphemeris(db.Model):
     """
-    연도에 따라 동적으로 테이블을 매핑하는 함수
+    모든 행성/연도의 일별 원시 데이터를 저장하는 단일 테이블.
+    (planet_name, reg_date) 복합 기본 키로 조회하며, MariaDB에서는 연도별 RANGE 파티션으로 나뉜다.
     """
+    __tablename__ = 'planet_ephemeris'
 
-    class PlanetRawDataYear(db.Model):
-        __tablename__ = f'planet_raw_data_{year}'
-        __table_args__ = {'extend_existing': True}
-
-        id = db.Column(db.Integer, primary_key=True, autoincrement=True)
-        planet_name = db.Column(db.String(50), nullable=False)
-        reg_date = db.Column(db.Date, nullable=False)
-        distance = db.Column(db.Float, nullable=False)
-        s_o_t = db.Column(db.Float, nullable=False)
-
-    return PlanetRawDataYear
+    planet_name = db.Column(db.String(50), primary_key=True)
+    reg_date = db.Column(db.Date, primary_key=True)
+    distance = db.Column(db.Float, nullable=False)
+    s_o_t = db.Column(db.Float, nullable=False)
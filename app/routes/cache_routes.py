@@ -0,0 +1,33 @@
+# cache_routes.py
+
+from flask import Blueprint
+from flask_restx import Api, Resource, Namespace
+from app import cache
+
+# Namespace 생성 - 캐시 운영 정보
+ns = Namespace('api/cache', description='Cache operations')
+
+
+@ns.route('/stats')
+class CacheStatsResource(Resource):
+    @staticmethod
+    @ns.response(200, 'Success')
+    @ns.response(404, 'Local cache tier is not configured')
+    def get():
+        """
+        현재 워커 프로세스의 프로세스 내 캐시 통계를 반환하는 API 엔드포인트
+
+        반환값:
+            JSON: 항목 수와 크기(바이트), 제거/무효화 건수, 함수별 로컬 적중/Redis 적중/미적중 건수와 로컬 적중률.
+        """
+        get_local_stats = getattr(cache.cache, 'get_local_stats', None)
+        if get_local_stats is None:
+            return {"error": "Local cache tier is not configured."}, 404
+        return get_local_stats(), 200
+
+
+# Blueprint와 API 설정
+cache_blueprint = Blueprint('cache', __name__)
+api = Api(cache_blueprint, version='1.0', title='Cache API',
+          description='API Documentation for Cache Operations', doc='/api/docs')
+api.add_namespace(ns)
@@ -8,7 +8,7 @@ from flask_restx import Api, Resource, Namespace
 
 from app.utils import get_validated_params
 from app.services.constellation.constellation_service import get_constellations_for_date_range
-from app.services.constellation.constellation_visibility_service import calculate_visibility_for_constellations_parallel
+from app.services.constellation.constellation_visibility_service import calculate_visibility_for_constellations_batched
 
 # Namespace 생성 - Constellation 관련으로 명확하게 변경
 ns = Namespace('api/constellations', description='Constellation-related operations')
@@ -74,8 +74,8 @@ class ConstellationsResource(Resource):
 
         try:
             constellation_data = get_constellations_for_date_range(latitude, longitude, start_date, end_date)
-            constellation_data = calculate_visibility_for_constellations_parallel(constellation_data, latitude,
-                                                                                  longitude)
+            constellation_data = calculate_visibility_for_constellations_batched(constellation_data, latitude,
+                                                                                 longitude)
             response_data = {
                 "location": {"latitude": latitude, "longitude": longitude},
                 "start_date": start_date.strftime('%Y-%m-%d'),
@@ -0,0 +1,44 @@
+# horizons_routes.py
+
+from flask import Blueprint
+from flask_restx import Api, Resource, Namespace
+from app.services.horizons_service import get_horizons_metrics
+from app.services.horizons_cache_service import get_horizons_cache_stats
+
+# Namespace 생성 - Horizons API 클라이언트 운영 정보
+ns = Namespace('api/horizons', description='Horizons API client operations')
+
+
+@ns.route('/metrics')
+class HorizonsMetricsResource(Resource):
+    @staticmethod
+    @ns.response(200, 'Success')
+    def get():
+        """
+        현재 워커 프로세스의 Horizons API 호출 지표를 반환하는 API 엔드포인트
+
+        반환값:
+            JSON: 진행 중/성공/실패/재시도/타임아웃/거절 건수와 평균·최대 지연 시간(ms).
+        """
+        return get_horizons_metrics(), 200
+
+
+@ns.route('/cache_stats')
+class HorizonsCacheStatsResource(Resource):
+    @staticmethod
+    @ns.response(200, 'Success')
+    def get():
+        """
+        Horizons 응답 디스크 캐시 통계를 반환하는 API 엔드포인트
+
+        반환값:
+            JSON: 적중/미적중/저장/삭제 건수, 적중률, 항목 수와 총 크기(바이트).
+        """
+        return get_horizons_cache_stats(), 200
+
+
+# Blueprint와 API 설정
+horizons_blueprint = Blueprint('horizons', __name__)
+api = Api(horizons_blueprint, version='1.0', title='Horizons API',
+          description='API Documentation for Horizons Client Operations', doc='/api/docs')
+api.add_namespace(ns)
@@ -4,7 +4,7 @@ from datetime import datetime
 from flask import Blueprint, request
 from flask_restx import Api, Resource, Namespace, fields
 
-from app.services.moon_phase_service import get_moon_phase_for_date
+from app.services.moon_phase_service import get_moon_phase_for_date, get_moon_phase_for_date_range
 
 # Namespace 생성
 ns = Namespace('api/moon', description='Operations related to moon phase calculations.')
@@ -19,26 +19,57 @@ moon_phase_response_model = ns.model('MoonPhaseResponse', {
 # Moon Phase Resource 정의
 @ns.route('/phase')
 class MoonPhaseResource(Resource):
-    @ns.param('date', 'The date for which you want to calculate the moon phase in YYYY-MM-DD format', required=True)
+    @ns.param('date', 'The date for which you want to calculate the moon phase in YYYY-MM-DD format', required=False)
+    @ns.param('start_date', 'Start date of the moon phase range in YYYY-MM-DD format (used when date is omitted)',
+              required=False)
+    @ns.param('end_date', 'End date of the moon phase range in YYYY-MM-DD format (optional, max 365 days)',
+              required=False)
     @ns.response(200, 'Success', moon_phase_response_model)
     @ns.response(400, 'Invalid input format.')
     @ns.response(500, 'Internal server error.')
     def get(self):
         """
-        특정 날짜와 위치에 대한 달의 위상을 계산하는 엔드포인트
+        특정 날짜 또는 날짜 범위에 대한 달의 위상을 계산하는 엔드포인트
 
         Query Params:
             date (str): 날짜 (YYYY-MM-DD 형식)
+            start_date (str): 범위 시작 날짜 (YYYY-MM-DD 형식, date가 없을 때 사용)
+            end_date (str, 선택): 범위 종료 날짜 (YYYY-MM-DD 형식, 기본값은 start_date)
 
         Returns:
             JSON: 달의 위상 정보 또는 오류 메시지
         """
         # 쿼리 매개변수 가져오기
         date_str = request.args.get('date')
+        start_date_str = request.args.get('start_date')
+        end_date_str = request.args.get('end_date')
+
+        # 날짜 범위 요청 처리
+        if not date_str and start_date_str:
+            try:
+                start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
+                end_date = datetime.strptime(end_date_str, '%Y-%m-%d') if end_date_str else start_date
+            except ValueError:
+                return {"error": "Invalid date format. Use YYYY-MM-DD."}, 400
+
+            if start_date > end_date or (end_date - start_date).days > 365:
+                return {"error": "Invalid date range."}, 400
+
+            try:
+                moon_phase_data = get_moon_phase_for_date_range(start_date, end_date)
+                if "error" in moon_phase_data:
+                    return moon_phase_data, 500
+                return {
+                    "start_date": start_date.strftime('%Y-%m-%d'),
+                    "end_date": end_date.strftime('%Y-%m-%d'),
+                    "moon_phases": moon_phase_data
+                }, 200
+            except Exception as e:
+                return {"error": f"Failed to calculate moon phase: {str(e)}"}, 500
 
         # 필수 매개변수 체크
         if not date_str:
-            return {"error": "Missing required parameter: 'date'."}, 400
+            return {"error": "Missing required parameter: 'date' or 'start_date'."}, 400
 
         # 날짜 문자열을 datetime 객체로 변환
         try:
@@ -9,7 +9,8 @@ from flask_restx import Api, Resource, Namespace
 
 from app.services.planets.planet_opposition_service import predict_opposition_events
 from app.services.planets.planet_visibility_service import calculate_planet_info
-from app.services.planets.planet_event_storage_service import update_raw_data
+from app.services.planets.planet_event_storage_service import update_raw_data, get_raw_data_year_range, \
+    RAW_DATA_MAX_YEARS
 
 # Namespace 생성
 ns = Namespace('api/planets', description='Planet-related operations')
@@ -101,6 +102,11 @@ class OppositionEventResource(Resource):
             'description': 'Year for predicting the opposition event (required)',
             'required': True,
             'example': 2024
+        },
+        'years': {
+            'description': 'Number of years to return events for, starting at year (optional, 1-50)',
+            'required': False,
+            'example': 10
         }
     })
     @ns.response(200, 'Success')
@@ -115,6 +121,8 @@ class OppositionEventResource(Resource):
                            Example: Jupiter
             - year (int): Year for predicting the opposition event.
                           Example: 2024
+            - years (int, optional): Number of years to return events for, starting at year (1-50).
+                          Example: 10
 
         Returns:
             JSON: Planet opposition event information or an error message.
@@ -122,13 +130,16 @@ class OppositionEventResource(Resource):
         try:
             planet_name = request.args.get('planet')
             year = request.args.get('year', type=int)
+            years = request.args.get('years', default=1, type=int)
 
             # 필수 매개변수 검증
             if not planet_name or not year:
                 return {"error": "Missing required parameters."}, 400
+            if not 1 <= years <= 50:
+                return {"error": "years must be between 1 and 50."}, 400
 
             # 대접근 이벤트 예측 호출
-            result = predict_opposition_events(planet_name, year)
+            result = predict_opposition_events(planet_name, year, years=years)
 
             return result, 200
 
@@ -143,14 +154,44 @@ class OppositionEventResource(Resource):
 @ns.route('/update_raw_data')
 class UpdateRawDataResource(Resource):
     @staticmethod
+    @ns.doc(params={
+        'start_year': {
+            'description': 'First year to (re)build raw data for (optional)',
+            'required': False,
+            'example': 2026
+        },
+        'end_year': {
+            'description': 'Last year to (re)build raw data for (optional, defaults to start_year, span of 1-50 years)',
+            'required': False,
+            'example': 2030
+        }
+    })
     @ns.response(200, 'Opposition events data update started successfully.')
+    @ns.response(400, 'Invalid input format.')
     @ns.response(500, 'Internal server error.')
     def post():
         """
         행성의 대접근 이벤트 데이터를 업데이트하는 API 엔드포인트
+
+        Query Parameters:
+            - start_year (int, 선택): 업데이트할 시작 연도. 생략 시 기본 연도(2년 후, 3년 후)를 업데이트
+            - end_year (int, 선택): 업데이트할 종료 연도. 생략 시 start_year와 동일 (최대 50년, 천체력 범위 안)
         """
         try:
-            update_raw_data()
+            start_year = request.args.get('start_year', type=int)
+            end_year = request.args.get('end_year', type=int) or start_year
+            years = None
+            if start_year is not None:
+                if end_year < start_year:
+                    return {"error": "end_year must be greater than or equal to start_year."}, 400
+                if end_year - start_year + 1 > RAW_DATA_MAX_YEARS:
+                    return {"error": f"The year range must span at most {RAW_DATA_MAX_YEARS} years."}, 400
+                first_year, last_year = get_raw_data_year_range()
+                if start_year < first_year or end_year > last_year:
+                    return {"error": f"Years must be between {first_year} and {last_year} (ephemeris coverage)."}, 400
+                years = list(range(start_year, end_year + 1))
+
+            update_raw_data(years)
             return {"message": "Opposition events data update started successfully."}, 200
         except Exception as e:
             logging.error(f"Failed to update opposition events data: {str(e)}")
@@ -10,6 +10,9 @@ from app.routes.constellations_routes import constellation_blueprint, ns as cons
 from app.routes.meteor_shower_routes import meteor_shower_blueprint, ns as meteor_ns
 from app.routes.moon_phase_routes import moon_phase_blueprint, ns as moon_ns
 from app.routes.planet_routes import planet_blueprint, ns as planet_ns
+from app.routes.sky_routes import sky_blueprint, ns as sky_ns
+from app.routes.horizons_routes import horizons_blueprint, ns as horizons_ns
+from app.routes.cache_routes import cache_blueprint, ns as cache_ns
 from app.routes.sunrise_sunset_routes import sunrise_sunset_blueprint, ns as sunrise_ns
 
 # from app.routes.db_test_routes import db_test_ns, db_test_blueprint
@@ -41,6 +44,15 @@ print(f"Blueprint {planet_blueprint.name} registered with URL prefix '/api/plane
 main.register_blueprint(sunrise_sunset_blueprint, url_prefix='/api/sunrise_sunset')
 print(f"Blueprint {sunrise_sunset_blueprint.name} registered with URL prefix '/api/sunrise_sunset'")
 
+main.register_blueprint(sky_blueprint, url_prefix='/api/sky')
+print(f"Blueprint {sky_blueprint.name} registered with URL prefix '/api/sky'")
+
+main.register_blueprint(horizons_blueprint, url_prefix='/api/horizons')
+print(f"Blueprint {horizons_blueprint.name} registered with URL prefix '/api/horizons'")
+
+main.register_blueprint(cache_blueprint, url_prefix='/api/cache')
+print(f"Blueprint {cache_blueprint.name} registered with URL prefix '/api/cache'")
+
 # main.register_blueprint(db_test_blueprint, url_prefix='/perform')  # 추가
 # print(f"Blueprint {db_test_blueprint.name} registered with URL prefix '/perform'")
 
@@ -51,6 +63,9 @@ api.add_namespace(meteor_ns)
 api.add_namespace(moon_ns)
 api.add_namespace(planet_ns)
 api.add_namespace(sunrise_ns)
+api.add_namespace(sky_ns)
+api.add_namespace(horizons_ns)
+api.add_namespace(cache_ns)
 
 # api.add_namespace(db_test_ns, path='/api/db_test')
 
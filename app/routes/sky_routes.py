@@ -0,0 +1,78 @@
+# sky_routes.py
+
+import logging
+from flask import Blueprint
+from flask_restx import Api, Resource, Namespace
+
+from app.utils import get_validated_params
+from app.services.sky_tonight_service import get_sky_tonight
+
+# Namespace 생성 - 밤하늘 요약 관련
+ns = Namespace('api/sky', description='Whole-sky summary operations')
+
+
+@ns.route('/tonight')
+class SkyTonightResource(Resource):
+    @staticmethod
+    @ns.doc(params={
+        'lat': {
+            'description': 'Latitude of the observation location (required)',
+            'required': True,
+            'example': 37.5665
+        },
+        'lon': {
+            'description': 'Longitude of the observation location (required)',
+            'required': True,
+            'example': 126.9780
+        },
+        'date': {
+            'description': 'Local date of the night in YYYY-MM-DD format (optional, defaults to today)',
+            'required': False,
+            'example': '2025-01-16'
+        }
+    })
+    @ns.response(200, 'Success')
+    @ns.response(400, 'Invalid input format or missing parameters.')
+    @ns.response(500, 'Internal server error.')
+    def get():
+        """
+        오늘 밤하늘 요약 API 엔드포인트
+
+        일몰부터 다음 날 일출까지 모든 행성과 달의 최고 고도, 관측 시각, 방향, 별자리와
+        천정의 별자리를 한 번의 요청으로 반환합니다.
+
+        Query Parameters:
+            - lat (float): 관측 위치의 위도 (필수).
+                           예시: 37.5665
+            - lon (float): 관측 위치의 경도 (필수).
+                           예시: 126.9780
+            - date (str): 관측 날짜 (선택, 기본값: 오늘).
+                          형식: YYYY-MM-DD
+                          예시: 2025-01-16
+
+        Returns:
+            JSON: 밤하늘 요약 정보 또는 오류 메시지.
+        """
+        params, error_response, status_code = get_validated_params()
+        if error_response:
+            return error_response, status_code
+
+        # 날짜 미지정 시 오늘 날짜 (캐시 키가 현재 시각에 따라 달라지지 않도록 자정으로 맞춤)
+        latitude, longitude, date = params[:3]
+        date = date.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        try:
+            result = get_sky_tonight(latitude, longitude, date)
+            if "error" in result:
+                return result, 500
+            return result, 200
+        except Exception as e:
+            logging.error(f"Failed to calculate tonight's sky: {str(e)}")
+            return {"error": f"Failed to calculate tonight's sky: {str(e)}"}, 500
+
+
+# Blueprint와 API 설정
+sky_blueprint = Blueprint('sky', __name__)
+api = Api(sky_blueprint, version='1.0', title='Sky API', description='API Documentation for Whole-Sky Operations',
+          doc='/api/docs')
+api.add_namespace(ns)
@@ -71,13 +71,14 @@ class SunriseSunsetResource(Resource):
         try:
             timezone_info = get_timezone_info(latitude, longitude, int(start_date.timestamp()))
             offset_sec = timezone_info['rawOffset'] + timezone_info.get('dstOffset', 0)
+            timezone_id = timezone_info.get('timeZoneId')
         except Exception as e:
             return {"error": f"Failed to get time zone information: {str(e)}"}, 500
 
-        # 일출 및 일몰 시간 계산 (여러 날짜에 대해 한 번에)
+        # 일출 및 일몰 시간 계산 (여러 날짜에 대해 한 번에, 날짜별 오프셋은 시간대 ID로 계산)
         try:
             sunrise_sunset_data = calculate_sunrise_sunset_for_range(latitude, longitude, start_date, end_date,
-                                                                     offset_sec)
+                                                                     offset_sec, timezone_id)
             return {
                 "location": {"latitude": latitude, "longitude": longitude},
                 "start_date": start_date.strftime('%Y-%m-%d'),
@@ -1,3 +1,5 @@
-from .commet_utils import analyze_comet_data, parse_ra_dec, detect_closing_or_receding, calculate_altitude_azimuth
+from .commet_utils import analyze_comet_data, parse_ra_dec, detect_closing_or_receding, calculate_altitude_azimuth, \
+    calculate_altitude_azimuth_series, parse_comet_series, analyze_comet_series
 
-__all__ = ['analyze_comet_data', 'parse_ra_dec', 'detect_closing_or_receding', 'calculate_altitude_azimuth']
+__all__ = ['analyze_comet_data', 'parse_ra_dec', 'detect_closing_or_receding', 'calculate_altitude_azimuth',
+           'calculate_altitude_azimuth_series', 'parse_comet_series', 'analyze_comet_series']
@@ -0,0 +1,143 @@
+# services/comets/comet_elements_service.py
+
+import os
+import time
+import atexit
+import logging
+import threading
+from datetime import datetime
+from apscheduler.schedulers.background import BackgroundScheduler
+from sqlalchemy import select
+from app.models.comet_elements import CometElements
+from app.data.data import COMET_CODES
+from app.db.db_utils import get_session, retry_execute, bulk_upsert
+from app.services.horizons_service import get_comet_elements_from_horizons
+
+_comet_elements = CometElements.__table__
+
+ELEMENT_COLUMNS = ['record_number', 'epoch_jd', 'eccentricity', 'perihelion_distance_au', 'inclination_degrees',
+                   'longitude_of_ascending_node_degrees', 'argument_of_perihelion_degrees', 'perihelion_time_jd']
+
+COMET_ELEMENTS_SELECT = select(_comet_elements.c.designation, *(_comet_elements.c[name] for name in ELEMENT_COLUMNS))
+
+# DB 적재 실패 후 다시 시도하기까지 대기 시간 (초) - DB 장애 중 요청마다 재시도 대기가 반복되지 않도록 함
+COMET_ELEMENTS_RETRY_INTERVAL = float(os.getenv('COMET_ELEMENTS_RETRY_INTERVAL', 60))
+
+# 프로세스 내 궤도 요소 맵 {혜성 고유 번호: 궤도 요소 딕셔너리} (최초 조회 시 DB 전체를 한 번에 적재)
+_elements = {}
+_elements_loaded = False
+_elements_retry_at = 0.0  # 적재 실패 시 다음 시도 가능 시각 (monotonic)
+_elements_lock = threading.Lock()
+
+
+def load_comet_elements():
+    """
+    DB에 저장된 모든 혜성 궤도 요소를 프로세스 내 맵으로 적재하는 함수 (최초 한 번만 조회).
+    적재에 실패하면 COMET_ELEMENTS_RETRY_INTERVAL 동안 DB를 조회하지 않고 현재 맵만 반환한다.
+
+    Returns:
+        dict: {혜성 고유 번호: 궤도 요소 딕셔너리}
+    """
+    global _elements_loaded, _elements_retry_at
+    if _elements_loaded or time.monotonic() < _elements_retry_at:
+        return _elements
+
+    with _elements_lock:
+        if not _elements_loaded and time.monotonic() >= _elements_retry_at:
+            rows = None
+            try:
+                with get_session() as session:
+                    rows = retry_execute(session, COMET_ELEMENTS_SELECT)
+            except Exception as e:
+                logging.warning(f"Failed to load comet elements: {e}")
+            if rows is not None:
+                _elements.update({row.designation: dict(row._mapping) for row in rows})
+                _elements_loaded = True
+            else:
+                _elements_retry_at = time.monotonic() + COMET_ELEMENTS_RETRY_INTERVAL
+    return _elements
+
+
+def store_comet_elements(elements_list):
+    """
+    궤도 요소를 DB에 upsert하고 프로세스 내 맵을 갱신하는 함수
+
+    Args:
+        elements_list (list): get_comet_elements_from_horizons 결과 딕셔너리 리스트
+    """
+    if not elements_list:
+        return
+
+    now = datetime.utcnow()
+    rows = [dict(elements, updated_at=now) for elements in elements_list]
+    try:
+        with get_session() as session:
+            try:
+                bulk_upsert(session, _comet_elements, rows, ['designation'], ELEMENT_COLUMNS + ['updated_at'])
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+    except Exception as e:
+        logging.warning(f"Failed to store comet elements: {e}")
+
+    # DB 저장 실패 시에도 현재 프로세스에서는 재사용
+    with _elements_lock:
+        _elements.update({elements["designation"]: dict(elements) for elements in elements_list})
+
+
+def get_comet_elements(comet_name):
+    """
+    혜성의 궤도 요소를 반환하는 함수 (프로세스 내 맵 → DB → Horizons 순으로 조회, Horizons 결과는 저장)
+
+    Args:
+        comet_name (str): 혜성 이름
+
+    Returns:
+        dict: 궤도 요소 딕셔너리 또는 에러 메시지
+    """
+    designation = COMET_CODES.get(comet_name)
+    if not designation:
+        return {"error": "Invalid comet name."}
+
+    elements = load_comet_elements().get(designation)
+    if elements:
+        return elements
+
+    elements = get_comet_elements_from_horizons(comet_name, datetime.utcnow())
+    if "error" in elements:
+        return elements
+
+    store_comet_elements([elements])
+    return elements
+
+
+def refresh_comet_elements():
+    """
+    모든 혜성의 궤도 요소를 현재 날짜 기준으로 Horizons에서 다시 가져와 저장하는 함수
+    (행성 섭동으로 접촉 궤도 요소가 변하므로 주기적으로 기준 시각을 옮김)
+    """
+    epoch = datetime.utcnow()
+    elements_list = []
+    for comet_name in COMET_CODES:
+        elements = get_comet_elements_from_horizons(comet_name, epoch)
+        if "error" in elements:
+            logging.warning(f"Failed to refresh elements for {comet_name}: {elements['error']}")
+            continue
+        elements_list.append(elements)
+
+    store_comet_elements(elements_list)
+    logging.info(f"Refreshed orbital elements for {len(elements_list)} comets.")
+
+
+# 스케줄러 설정 - 매월 1일 새벽 4시에 궤도 요소 갱신
+scheduler = BackgroundScheduler()
+scheduler.add_job(refresh_comet_elements, 'cron', day='1', hour='4', minute='0')
+scheduler.start()
+
+# 앱이 종료될 때 스케줄러도 같이 종료되도록 설정
+atexit.register(lambda: scheduler.shutdown())
+
+
+__all__ = ['get_comet_elements', 'store_comet_elements', 'load_comet_elements', 'refresh_comet_elements',
+           'COMET_ELEMENTS_SELECT']
@@ -0,0 +1,158 @@
+# services/comets/comet_ephemeris_service.py
+
+import os
+import threading
+import numpy as np
+import pandas as pd
+from skyfield.data import mpc
+from skyfield.constants import GM_SUN_Pitjeva_2005_km3_s2 as GM_SUN, AU_KM, DAY_S
+from skyfield.errors import EphemerisRangeError
+from app.global_resources import ts, earth, sun  # 전역 리소스 임포트
+from app.services.comets.comet_elements_service import get_comet_elements
+
+# 궤도 요소 기준 시각 전후로 로컬 계산을 허용하는 기간 (년)
+# 단일 접촉 궤도 요소는 행성 섭동을 반영하지 않으므로 이 기간을 벗어난 날짜는 Horizons 천체력을 사용
+COMET_ELEMENTS_VALID_YEARS = float(os.getenv('COMET_ELEMENTS_VALID_YEARS', 2))
+
+HORIZONS_MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+# 궤도 요소별로 만든 Skyfield 궤도 객체 {(혜성 고유 번호, 기준 시각, 근일점 시각): sun + 궤도}
+_comet_orbits = {}
+_comet_orbits_lock = threading.Lock()
+
+
+def get_comet_orbit(elements):
+    """
+    궤도 요소로 태양 중심 케플러 궤도 객체를 만드는 함수 (같은 궤도 요소는 재사용)
+
+    Args:
+        elements (dict): 궤도 요소 딕셔너리
+
+    Returns:
+        VectorSum: sun + 혜성 궤도 (earth.at(t).observe()에 바로 사용 가능)
+    """
+    key = (elements["designation"], elements["epoch_jd"], elements["perihelion_time_jd"])
+    comet = _comet_orbits.get(key)
+    if comet is not None:
+        return comet
+
+    year, month, day, hour, minute, second = ts.tdb_jd(elements["perihelion_time_jd"]).tt_calendar()
+    row = pd.Series({
+        "designation": elements["designation"],
+        "perihelion_year": year,
+        "perihelion_month": month,
+        "perihelion_day": day + (hour + minute / 60 + second / 3600) / 24,
+        "perihelion_distance_au": elements["perihelion_distance_au"],
+        "eccentricity": elements["eccentricity"],
+        "inclination_degrees": elements["inclination_degrees"],
+        "longitude_of_ascending_node_degrees": elements["longitude_of_ascending_node_degrees"],
+        "argument_of_perihelion_degrees": elements["argument_of_perihelion_degrees"]
+    })
+    comet = sun + mpc.comet_orbit(row, ts, GM_SUN)
+
+    with _comet_orbits_lock:
+        _comet_orbits[key] = comet
+    return comet
+
+
+def format_sexagesimal(values, scale, decimals, signed):
+    """
+    각도 배열을 Horizons 형식의 "DD MM SS.ss" 문자열 리스트로 변환하는 함수 (반올림 후 자리 올림 처리)
+
+    Args:
+        values (ndarray): 시 또는 도 단위 값 배열
+        scale (int): 초 단위 소수 자릿수에 해당하는 배율 (예: 100 → 0.01초)
+        decimals (int): 초 단위 소수 자릿수
+        signed (bool): 부호 표시 여부 (적위)
+
+    Returns:
+        list: 문자열 리스트
+    """
+    ticks = np.rint(np.abs(values) * 3600 * scale).astype(np.int64)
+    whole_seconds, fraction = np.divmod(ticks, scale)
+    minutes_total, seconds = np.divmod(whole_seconds, 60)
+    degrees, minutes = np.divmod(minutes_total, 60)
+    signs = np.where(values < 0, '-', '+') if signed else [''] * len(values)
+    return [
+        f"{sign}{d:02d} {m:02d} {s:02d}.{f:0{decimals}d}"
+        for sign, d, m, s, f in zip(signs, degrees, minutes, seconds, fraction)
+    ]
+
+
+def calculate_comet_series(comet_name, date, range_days):
+    """
+    저장된 궤도 요소와 de440으로 혜성의 일별 지구 중심 위치를 한 번에(벡터화) 계산하는 함수.
+    get_comet_approach_events와 같은 범위와 형식의 행을 반환한다.
+
+    Args:
+        comet_name (str): 혜성 이름
+        date (datetime): 시작 날짜
+        range_days (int): 조회 일수 (시작 날짜부터 range_days일 뒤까지 포함)
+
+    Returns:
+        dict: {"data": 날짜순 행 리스트, "columns": parse_horizons_ephemeris와 같은 열 배열} 또는 에러 메시지
+              (delta: 지구 거리(AU), deldot: 지구 거리 변화율(km/s), s-o-t: 태양-관측자-혜성 각도(도)).
+              조회 기간이 궤도 요소 기준 시각 ± COMET_ELEMENTS_VALID_YEARS를 벗어나면 에러 메시지
+    """
+    elements = get_comet_elements(comet_name)
+    if "error" in elements:
+        return elements
+
+    day_offsets = np.arange(max(range_days, 1) + 1)
+    t = ts.utc(date.year, date.month, date.day + day_offsets)
+
+    valid_days = COMET_ELEMENTS_VALID_YEARS * 365.25
+    if abs(t.tdb[0] - elements["epoch_jd"]) > valid_days or abs(t.tdb[-1] - elements["epoch_jd"]) > valid_days:
+        return {"error": f"Date range is outside the validity window of the orbital elements for {comet_name}."}
+
+    comet = get_comet_orbit(elements)
+
+    try:
+        earth_at = earth.at(t)
+        astrometric = earth_at.observe(comet)
+        sun_position = earth_at.observe(sun).position.au
+    except EphemerisRangeError as e:
+        return {"error": f"Date range is outside the local ephemeris: {e}"}
+
+    ra, dec, distance = astrometric.radec()
+    position = astrometric.position.au
+    velocity = astrometric.velocity.au_per_d
+    delta = distance.au
+    deldot = np.einsum('ij,ij->j', position, velocity) / delta * AU_KM / DAY_S  # 시선 방향 속도 (km/s)
+
+    cos_elongation = np.einsum('ij,ij->j', position, sun_position) / (delta * np.linalg.norm(sun_position, axis=0))
+    elongation = np.degrees(np.arccos(np.clip(cos_elongation, -1.0, 1.0)))
+
+    ra_strings = format_sexagesimal(ra.hours, 100, 2, signed=False)
+    dec_strings = format_sexagesimal(dec.degrees, 10, 1, signed=True)
+    days = t.utc_datetime()
+
+    # 분석에는 문자열을 다시 읽지 않도록 계산한 값을 그대로 열 배열로 함께 반환
+    columns = {
+        "time": (np.datetime64(date.date()) + day_offsets).astype('datetime64[m]'),
+        "ra": ra.hours,
+        "dec": dec.degrees,
+        "delta": delta,
+        "deldot": deldot,
+        "s-o-t": elongation,
+        "skipped": 0
+    }
+
+    rows = [
+        {
+            "comet_name": comet_name,
+            "time": f"{day.year}-{HORIZONS_MONTHS[day.month - 1]}-{day.day:02d} 00:00",
+            "ra": ra_string,
+            "dec": dec_string,
+            "delta": f"{delta_au:.12f}",
+            "deldot": f"{deldot_km_s:.7f}",
+            "s-o-t": f"{elongation_deg:.4f}"
+        }
+        for day, ra_string, dec_string, delta_au, deldot_km_s, elongation_deg
+        in zip(days, ra_strings, dec_strings, delta, deldot, elongation)
+    ]
+
+    return {"data": rows, "columns": columns}
+
+
+__all__ = ['calculate_comet_series', 'get_comet_orbit']
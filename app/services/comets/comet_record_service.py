@@ -0,0 +1,99 @@
+# services/comets/comet_record_service.py
+
+import os
+import time
+import logging
+import threading
+from datetime import datetime
+from sqlalchemy import select
+from app.models.comet_record import CometRecord
+from app.db.db_utils import get_session, retry_execute, bulk_upsert
+
+_comet_records = CometRecord.__table__
+
+COMET_RECORDS_SELECT = select(
+    _comet_records.c.designation, _comet_records.c.record_number, _comet_records.c.epoch_year
+)
+
+# DB 적재 실패 후 다시 시도하기까지 대기 시간 (초) - DB 장애 중 요청마다 재시도 대기가 반복되지 않도록 함
+COMET_RECORDS_RETRY_INTERVAL = float(os.getenv('COMET_RECORDS_RETRY_INTERVAL', 60))
+
+# 프로세스 내 레코드 번호 맵 {혜성 고유 번호: 레코드 번호} (최초 조회 시 DB 전체를 한 번에 적재)
+_record_numbers = {}
+_record_numbers_loaded = False
+_record_numbers_retry_at = 0.0  # 적재 실패 시 다음 시도 가능 시각 (monotonic)
+_record_numbers_lock = threading.Lock()
+
+
+def load_comet_record_numbers():
+    """
+    DB에 저장된 모든 혜성 레코드 번호를 프로세스 내 맵으로 적재하는 함수 (최초 한 번만 조회).
+    적재에 실패하면 COMET_RECORDS_RETRY_INTERVAL 동안 DB를 조회하지 않고 현재 맵만 반환한다.
+
+    Returns:
+        dict: {혜성 고유 번호: 레코드 번호}
+    """
+    global _record_numbers_loaded, _record_numbers_retry_at
+    if _record_numbers_loaded or time.monotonic() < _record_numbers_retry_at:
+        return _record_numbers
+
+    with _record_numbers_lock:
+        if not _record_numbers_loaded and time.monotonic() >= _record_numbers_retry_at:
+            rows = None
+            try:
+                with get_session() as session:
+                    rows = retry_execute(session, COMET_RECORDS_SELECT)
+            except Exception as e:
+                logging.warning(f"Failed to load comet record numbers: {e}")
+            if rows is not None:
+                _record_numbers.update({row.designation: row.record_number for row in rows})
+                _record_numbers_loaded = True
+            else:
+                _record_numbers_retry_at = time.monotonic() + COMET_RECORDS_RETRY_INTERVAL
+    return _record_numbers
+
+
+def get_stored_comet_record_number(designation):
+    """
+    저장된 혜성 레코드 번호를 반환하는 함수 (프로세스 내 맵 → DB 순으로 조회)
+
+    Args:
+        designation (str): 혜성 고유 번호 (예: 1P)
+
+    Returns:
+        str: 레코드 번호 또는 None (저장된 값이 없을 때)
+    """
+    return load_comet_record_numbers().get(designation)
+
+
+def store_comet_record_numbers(records):
+    """
+    Horizons에서 조회한 레코드 번호를 DB에 upsert하고 프로세스 내 맵을 갱신하는 함수
+
+    Args:
+        records (list): {"designation", "record_number", "epoch_year"} 딕셔너리 리스트
+    """
+    if not records:
+        return
+
+    now = datetime.utcnow()
+    rows = [dict(record, updated_at=now) for record in records]
+    try:
+        with get_session() as session:
+            try:
+                bulk_upsert(session, _comet_records, rows, ['designation'],
+                            ['record_number', 'epoch_year', 'updated_at'])
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+    except Exception as e:
+        logging.warning(f"Failed to store comet record numbers: {e}")
+
+    # DB 저장 실패 시에도 현재 프로세스에서는 재사용
+    with _record_numbers_lock:
+        _record_numbers.update({record["designation"]: record["record_number"] for record in records})
+
+
+__all__ = ['get_stored_comet_record_number', 'store_comet_record_numbers', 'load_comet_record_numbers',
+           'COMET_RECORDS_SELECT']
@@ -0,0 +1,138 @@
+# services/comets/comet_series_service.py
+
+import os
+import logging
+import threading
+import numpy as np
+from datetime import datetime, timedelta
+from app.services.horizons_service import get_comet_approach_events
+from app.services.comets.comet_ephemeris_service import calculate_comet_series
+
+# 혜성 위치 계산 방식: "elements" (저장된 궤도 요소로 로컬 계산, 기본값) 또는 "horizons" (Horizons 천체력)
+COMET_EPHEMERIS_SOURCE = os.getenv('COMET_EPHEMERIS_SOURCE', 'elements').lower()
+
+# 혜성별로 보관할 최대 일수 (초과 시 해당 혜성의 저장분을 비우고 다시 채움)
+COMET_SERIES_MAX_DAYS = int(os.getenv('COMET_SERIES_MAX_DAYS', 20000))
+
+# 일별로 저장하는 열 배열 값 (parse_horizons_ephemeris 결과의 열 이름)
+SERIES_COLUMNS = ['time', 'ra', 'dec', 'delta', 'deldot', 's-o-t']
+
+# 혜성별 일별 행 저장소 {혜성 이름: {date: (행 딕셔너리, 열 값 튜플) 또는 None(Horizons가 반환하지 않은 날)}}
+_comet_series = {}
+_comet_series_lock = threading.Lock()
+
+
+def find_missing_ranges(covered_days, start_date, end_date):
+    """
+    날짜 범위에서 아직 가져오지 않은 연속 구간들을 찾는 함수
+
+    Args:
+        covered_days (dict): 이미 가져온 날짜를 키로 가진 딕셔너리
+        start_date (date): 시작 날짜
+        end_date (date): 종료 날짜 (포함)
+
+    Returns:
+        list: (구간 시작 날짜, 구간 종료 날짜) 튜플 리스트
+    """
+    missing_ranges = []
+    run_start = None
+    day = start_date
+    while day <= end_date:
+        if day not in covered_days:
+            if run_start is None:
+                run_start = day
+        elif run_start is not None:
+            missing_ranges.append((run_start, day - timedelta(days=1)))
+            run_start = None
+        day += timedelta(days=1)
+
+    if run_start is not None:
+        missing_ranges.append((run_start, end_date))
+    return missing_ranges
+
+
+def get_comet_approach_series(comet_name, date, range_days):
+    """
+    혜성의 일별 접근 데이터를 반환하는 함수 (get_comet_approach_events와 같은 범위와 형식).
+    기본적으로 저장된 궤도 요소로 로컬 계산하며, Horizons를 사용할 때는 이미 가져온 날짜를 저장소에서 재사용하고
+    빠진 구간만 요청한 뒤 날짜순으로 이어 붙인다.
+
+    Args:
+        comet_name (str): 혜성 이름
+        date (datetime): 시작 날짜
+        range_days (int): 조회 일수 (시작 날짜부터 range_days일 뒤까지 포함)
+
+    Returns:
+        dict: {"data": 날짜순 행 리스트, "columns": 같은 순서의 열 배열 (SERIES_COLUMNS)} 또는 에러 메시지
+    """
+    if isinstance(date, float):
+        date = datetime.fromtimestamp(date)
+
+    # 궤도 요소로 로컬 계산 (궤도 요소를 얻지 못하면 Horizons 천체력으로 대체)
+    if COMET_EPHEMERIS_SOURCE == 'elements':
+        series = calculate_comet_series(comet_name, date, range_days)
+        if "error" not in series:
+            return series
+        logging.warning(f"Local comet engine unavailable for {comet_name}: {series['error']}. Falling back to Horizons.")
+
+    start_date = date.date()
+    end_date = start_date + timedelta(days=max(range_days, 1))
+
+    with _comet_series_lock:
+        series = _comet_series.setdefault(comet_name, {})
+        missing_ranges = find_missing_ranges(series, start_date, end_date)
+
+    fetched_rows = {}
+    for range_start, range_end in missing_ranges:
+        # Horizons는 시작과 종료가 같은 요청을 받지 않으므로 최소 하루 범위로 요청
+        fetched = get_comet_approach_events(comet_name, datetime.combine(range_start, datetime.min.time()),
+                                            max((range_end - range_start).days, 1))
+        if not fetched or "error" in fetched:
+            return fetched or {"error": "No comet approach data available."}
+
+        # 파서가 만든 시각 배열로 날짜 키를 만들고 (행마다 strptime을 호출하지 않음) 행과 열 값을 함께 저장
+        columns = fetched['columns']
+        range_rows = dict(zip(columns['time'].astype('datetime64[D]').tolist(),
+                              zip(fetched.get('data', []), zip(*(columns[name] for name in SERIES_COLUMNS)))))
+        fetched_rows.update(range_rows)
+
+        with _comet_series_lock:
+            if len(series) + len(range_rows) > COMET_SERIES_MAX_DAYS:
+                series.clear()
+            # 요청한 구간에서 행이 없던 날도 기록해 다시 요청하지 않음
+            day = range_start
+            while day <= range_end:
+                series.setdefault(day, None)
+                day += timedelta(days=1)
+            series.update(range_rows)
+
+    # 저장소가 도중에 비워져도 이번 요청에서 가져온 행으로 이어 붙임
+    with _comet_series_lock:
+        entries = []
+        for offset in range((end_date - start_date).days + 1):
+            day = start_date + timedelta(days=offset)
+            entry = fetched_rows.get(day) or series.get(day)
+            if entry is not None:
+                entries.append(entry)
+
+    # 호출부에서 행을 수정하므로 복사본 반환
+    values = [value for _, value in entries]
+    columns = {
+        name: np.array([value[index] for value in values], dtype='datetime64[m]' if name == 'time' else float)
+        for index, name in enumerate(SERIES_COLUMNS)
+    }
+    return {"data": [dict(row) for row, _ in entries], "columns": columns}
+
+
+def get_comet_series_stats():
+    """
+    혜성별로 저장된 일수를 반환하는 함수
+
+    Returns:
+        dict: {혜성 이름: 저장된 일수}
+    """
+    with _comet_series_lock:
+        return {comet_name: len(series) for comet_name, series in _comet_series.items()}
+
+
+__all__ = ['get_comet_approach_series', 'find_missing_ranges', 'get_comet_series_stats']
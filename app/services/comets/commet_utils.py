@@ -1,7 +1,8 @@
 # commet_utils.py
-from datetime import datetime
+import numpy as np
 
 from app.global_resources import ts, load, earth
+from app.services.horizons_utils import HORIZONS_MONTH_NUMBERS
 from skyfield.api import Topos, Star
 from math import radians
 
@@ -46,42 +47,159 @@ def calculate_altitude_azimuth(ra_str, dec_str, delta, latitude, longitude, elev
     return alt.degrees, az.degrees
 
 
-def analyze_comet_data(data):
+def calculate_altitude_azimuth_series(ra_str, dec_str, latitude, longitude, elevation, times):
     """
-    혜성 접근 이벤트 데이터를 정리하고 분석하는 함수.
+    여러 관측 시각에 대한 고도와 방위각을 한 번의 벡터화 계산으로 구하는 함수
 
     Args:
-        data (list): 혜성 접근 이벤트 데이터 리스트.
+        ra_str (str): 적경 문자열 (시 분 초)
+        dec_str (str): 적위 문자열 (도 분 초)
+        latitude (float): 위도
+        longitude (float): 경도
+        elevation (float): 관측자 고도 (m)
+        times (Time): 관측 시각 Time 배열
 
     Returns:
-        dict: 정렬된 접근 이벤트 리스트와 가장 가까운 접근 이벤트 정보.
+        tuple: (고도 배열, 방위각 배열) (도 단위)
     """
-    try:
-        if not data:
-            return {"error": "No data available for analysis."}
+    ra_hours, dec_degrees = parse_ra_dec(ra_str, dec_str)
 
-        # 접근 이벤트를 시간 순으로 정렬
-        sorted_data = sorted(data, key=lambda x: datetime.strptime(x['time'], '%Y-%b-%d %H:%M'))
+    observer_location = Topos(latitude_degrees=latitude, longitude_degrees=longitude, elevation_m=elevation)
+    comet_position = Star(ra_hours=ra_hours, dec_degrees=dec_degrees)
+    observer = earth + observer_location
 
-        if not sorted_data:
-            return {"error": "Sorted data is empty."}
+    # 모든 관측 시각에서 한 번에 관측
+    alt, az, distance = observer.at(times).observe(comet_position).apparent().altaz()
+    return alt.degrees, az.degrees
+
+
+def parse_comet_series(data):
+    """
+    Horizons 형식의 혜성 접근 행들을 한 번에 읽어 열(column) 배열로 변환하는 함수.
+    get_comet_approach_series가 열 배열을 함께 주지 않는 행 리스트(API 입력 등)에만 사용한다.
+    시각은 월 이름 표로 직접 변환하여 행마다 strptime을 호출하지 않는다.
+
+    Args:
+        data (list): 혜성 접근 이벤트 데이터 리스트 (time, ra, dec, delta, deldot 키 포함)
+
+    Returns:
+        dict: {"data": 행 리스트, "columns": {"time": datetime64[m] 배열, "ra": 적경(시) 배열,
+               "dec": 적위(도) 배열, "delta": 거리(AU) 배열, "deldot": 거리 변화율(km/s) 배열}}
+    """
+    times, ra_fields, dec_fields, dec_signs = [], [], [], []
+    for row in data:
+        # "2024-Oct-01 00:00" → "2024-10-01T00:00"
+        day, clock = row['time'].split()
+        year, month, day_of_month = day.split('-')
+        times.append(f"{year}-{HORIZONS_MONTH_NUMBERS[month]}-{day_of_month}T{clock}")
+        ra_fields.append(row['ra'].split())
+        dec_str = row['dec']
+        dec_signs.append(-1.0 if dec_str[0] == '-' else 1.0)
+        dec_fields.append(dec_str.lstrip('+-').split())
+
+    # 문자열 열을 한 번에 실수/시각 배열로 변환
+    ra_parts = np.array(ra_fields, dtype=float).reshape(-1, 3)
+    dec_parts = np.array(dec_fields, dtype=float).reshape(-1, 3)
+    sexagesimal = np.array([1.0, 1 / 60, 1 / 3600])
+
+    return {
+        "data": data,
+        "columns": {
+            "time": np.array(times, dtype='datetime64[m]'),
+            "ra": ra_parts @ sexagesimal,
+            "dec": np.array(dec_signs) * (dec_parts @ sexagesimal),
+            "delta": np.array([row['delta'] for row in data], dtype=float),
+            "deldot": np.array([row['deldot'] for row in data], dtype=float)
+        }
+    }
+
+
+def analyze_comet_series(series):
+    """
+    혜성 접근 데이터의 열 배열에서 최근접 시점과 접근/후퇴 상태를 한 번에(벡터화) 구하는 함수.
+    반환하는 접근 이벤트 행에는 열 배열의 적경/적위 값을 converted_ra, converted_dec로 함께 넣는다.
+
+    Args:
+        series (dict): {"data": 행 리스트, "columns": 열 배열} (get_comet_approach_series 또는 parse_comet_series 결과)
+
+    Returns:
+        dict: {"sorted_data", "closest_approach", "detection": detect_closing_or_receding과 같은 형식} 또는 에러 메시지
+    """
+    try:
+        rows = series.get("data")
+        if not rows:
+            return {"error": "No data available for analysis."}
 
-        # 지구와 가장 가까운 접근 이벤트 찾기
-        closest_approach = min(sorted_data, key=lambda x: float(x['delta']))
+        columns = series["columns"]
+
+        # 시간순 정렬 (같은 시각은 입력 순서를 유지, sorted와 동일)
+        order = np.argsort(columns["time"], kind='stable')
+        delta = columns["delta"][order]
+        deldot = columns["deldot"][order]
+        sorted_data = [rows[i] for i in order]
+
+        def approach_row(index):
+            # 호출부에서 상태 등을 덧붙이므로 복사본에 변환된 좌표를 넣음
+            return dict(sorted_data[index], converted_ra=float(columns["ra"][order[index]]),
+                        converted_dec=float(columns["dec"][order[index]]))
+
+        # 지구와 가장 가까운 접근 이벤트 (같은 거리면 먼저 나온 행, min과 동일)
+        closest_index = int(np.argmin(delta))
+
+        if deldot[closest_index] > 0:  # 현재 멀어지고 있는 경우
+            # 이후 다시 가까워지는 첫 시점
+            approaching = np.flatnonzero(deldot[closest_index + 1:] < 0)
+            if approaching.size:
+                detection = {
+                    "status": "receding",
+                    "next_closest_approach": approach_row(closest_index + 1 + int(approaching[0])),
+                    "message": "Comet is getting closer again."
+                }
+            else:
+                detection = {
+                    "status": "receding",
+                    "message": "Comet continues to recede."
+                }
+        else:
+            detection = {
+                "status": "closing",
+                "message": "Comet is continuously approaching."
+            }
 
-        # 정렬된 접근 이벤트 리스트와 가장 가까운 접근 이벤트 반환
         return {
             "sorted_data": sorted_data,
-            "closest_approach": closest_approach
+            "closest_approach": approach_row(closest_index),
+            "detection": detection
         }
     except Exception as e:
         return {"error": f"Failed to analyze comet data: {str(e)}"}
 
 
+def analyze_comet_data(data):
+    """
+    혜성 접근 이벤트 행 리스트를 정리하고 분석하는 함수.
+    열 배열이 있는 get_comet_approach_series 결과는 analyze_comet_series로 바로 분석한다.
+
+    Args:
+        data (list): 혜성 접근 이벤트 데이터 리스트.
+
+    Returns:
+        dict: 정렬된 접근 이벤트 리스트, 가장 가까운 접근 이벤트 정보, 접근/후퇴 판정 결과(detection).
+    """
+    try:
+        if not data:
+            return {"error": "No data available for analysis."}
+
+        return analyze_comet_series(parse_comet_series(data))
+    except Exception as e:
+        return {"error": f"Failed to analyze comet data: {str(e)}"}
+
+
 def detect_closing_or_receding(sorted_data):
     """
     정렬된 혜성 접근 데이터를 분석하여 멀어짐의 변화를 감지하고, 가까워지는 시점을 찾는 함수.
     접근 이벤트를 분석하여 혜성이 멀어지는지, 아니면 가까워지는지 판단한다.
+    (analyze_comet_data 결과의 detection과 같으므로, 이미 분석한 데이터라면 그 값을 사용)
 
     Args:
         sorted_data (list): 정렬된 혜성 접근 이벤트 데이터 리스트.
@@ -93,36 +211,13 @@ def detect_closing_or_receding(sorted_data):
         if not sorted_data:
             return {"error": "No sorted data available for analysis."}
 
-        # 지구와 가장 가까운 접근 이벤트 찾기
-        closest_approach = min(sorted_data, key=lambda x: float(x['delta']))
-        closest_index = sorted_data.index(closest_approach)
-
-        # 현재 접근 이벤트가 멀어지고 있는지 감지
-        deldot = float(closest_approach['deldot'])
-        if deldot > 0:  # 현재 멀어지고 있는 경우
-            # 멀어지고 있다면 이후 다시 가까워지는 시점을 찾는다.
-            for event in sorted_data[closest_index + 1:]:
-                if float(event['deldot']) < 0:  # 다시 가까워지는 시점 발견
-                    return {
-                        "status": "receding",
-                        "next_closest_approach": event,
-                        "message": "Comet is getting closer again."
-                    }
-
-            # 계속 멀어지고 있는 경우
-            return {
-                "status": "receding",
-                "message": "Comet continues to recede."
-            }
-
-        # 멀어지지 않고 계속 가까워지는 경우
-        return {
-            "status": "closing",
-            "message": "Comet is continuously approaching."
-        }
-
+        analyzed = analyze_comet_series(parse_comet_series(sorted_data))
+        if "error" in analyzed:
+            return analyzed
+        return analyzed["detection"]
     except Exception as e:
         return {"error": f"Failed to detect closing or receding status: {str(e)}"}
 
 
-__all__ = ['analyze_comet_data', 'detect_closing_or_receding', 'parse_ra_dec', 'calculate_altitude_azimuth']
+__all__ = ['analyze_comet_data', 'detect_closing_or_receding', 'parse_comet_series', 'analyze_comet_series',
+           'parse_ra_dec', 'calculate_altitude_azimuth', 'calculate_altitude_azimuth_series']
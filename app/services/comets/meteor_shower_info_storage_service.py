@@ -6,6 +6,7 @@ from app.models.meteor_shower_raw_data import MeteorShowerInfo
 from app.services.comets.meteor_shower_info import get_meteor_shower_info
 from app.data.data import METEOR_SHOWERS
 from app.db.db_utils import get_session, retry_query
+from app.services.horizons_service import fetch_concurrently
 import atexit
 
 
@@ -39,41 +40,44 @@ def save_meteor_shower_info(session, shower_info):
 def update_meteor_shower_data():
     """
     앞으로 3년간의 유성우 데이터를 모든 혜성에 대해 저장하는 함수.
+    혜성 × 연도별 조회는 서로 독립적이므로 동시에 가져온 뒤 원래 순서대로 저장한다.
     """
     comet_names = ["Halley", "Swift-Tuttle", "Tuttle"]
     current_year = datetime.now().year
+    range_days = 365  # 1년씩 데이터 조회
+
+    # 3년치 데이터를 가져오기 위한 (혜성, 시작 날짜) 조합
+    targets = [(comet_name, f"{current_year + year_offset}-01-01")
+               for comet_name in comet_names for year_offset in range(3)]
 
     with get_session() as session:
         try:
-            for comet_name in comet_names:
-                for year_offset in range(3):  # 3년치 데이터를 가져오기 위해 반복
-                    year = current_year + year_offset
-                    start_date = f"{year}-01-01"
-                    range_days = 365  # 1년씩 데이터 조회
-
-                    # 유성우 정보 가져오기
-                    shower_info_list = get_meteor_shower_info(comet_name, start_date, range_days)
-
-                    if isinstance(shower_info_list, list):
-                        for shower_info in shower_info_list:
-                            # 중복 데이터 확인 후 저장
-                            query = session.query(MeteorShowerInfo).filter(
-                                MeteorShowerInfo.comet_name == shower_info["comet_name"],
-                                MeteorShowerInfo.peak_start_date == datetime.strptime(
-                                    shower_info["peak_start_date"], '%Y-%m-%d').date()
-                            )
-
-                            existing_info = retry_query(session, query)
-
-                            if not existing_info:
-                                save_meteor_shower_info(session, shower_info)
-
-                        # 변경사항 커밋
-                        session.commit()
-                    else:
-                        error_message = shower_info_list.get('error', "Unknown error")
-                        print(f"Error updating data for {comet_name}: {error_message}")
-                        raise Exception(f"Error updating data for {comet_name}: {error_message}")
+            # 유성우 정보 가져오기
+            results = fetch_concurrently([
+                (get_meteor_shower_info, comet_name, start_date, range_days) for comet_name, start_date in targets
+            ])
+
+            for (comet_name, start_date), shower_info_list in zip(targets, results):
+                if isinstance(shower_info_list, list):
+                    for shower_info in shower_info_list:
+                        # 중복 데이터 확인 후 저장
+                        query = session.query(MeteorShowerInfo).filter(
+                            MeteorShowerInfo.comet_name == shower_info["comet_name"],
+                            MeteorShowerInfo.peak_start_date == datetime.strptime(
+                                shower_info["peak_start_date"], '%Y-%m-%d').date()
+                        )
+
+                        existing_info = retry_query(session, query)
+
+                        if not existing_info:
+                            save_meteor_shower_info(session, shower_info)
+
+                    # 변경사항 커밋
+                    session.commit()
+                else:
+                    error_message = shower_info_list.get('error', "Unknown error")
+                    print(f"Error updating data for {comet_name}: {error_message}")
+                    raise Exception(f"Error updating data for {comet_name}: {error_message}")
         except Exception as e:
             session.rollback()
             print(f"Failed to update meteor shower data: {e}")
@@ -2,12 +2,14 @@
 
 from app.models.meteor_shower_raw_data import MeteorShowerInfo
 from datetime import datetime, timedelta
-from app.services.comets.commet_utils import calculate_altitude_azimuth  # 고도 계산에 사용할 유틸리티 함수
+import numpy as np
+from app.services.comets.commet_utils import calculate_altitude_azimuth_series  # 고도 계산에 사용할 유틸리티 함수
 from app.services.directions_utils import azimuth_to_direction  # 동서남북 변환 함수 import
 from app.services.moon_phase_service import get_moon_phase_for_date, get_phase_description
 from app.db.db_utils import retry_query, get_session  # get_session 함수 import
 from app.services.sunrise_sunset_service import get_single_day_sunrise_sunset
 from app import cache
+from app.global_resources import ts
 
 
 @cache.memoize(timeout=30 * 24 * 60 * 60)  # 한 달 동안 캐시
@@ -72,7 +74,6 @@ def find_best_peak_date(start_date, end_date, ra, dec, distance, latitude, longi
     # Peak Period 중앙값 계산
     mid_date = start_date + (end_date - start_date) / 2
 
-    best_date = start_date
     best_time = None
     best_conditions = {
         "altitude": -1,
@@ -83,64 +84,62 @@ def find_best_peak_date(start_date, end_date, ra, dec, distance, latitude, longi
         "score": -1  # 점수를 추가로 평가
     }
 
-    current_date = start_date
-    while current_date <= end_date:
-        for hour in range(0, 24):
-            observation_time = current_date + timedelta(hours=hour)
-
-            # 고도와 방위각 계산
-            altitude, azimuth = calculate_altitude_azimuth(ra, dec, distance, latitude, longitude, 0, observation_time)
-
-            # 방위각 -> 방향 변환
-            direction = azimuth_to_direction(azimuth)
-
-            # 달의 위상 정보 가져오기
-            moon_phase_info = get_moon_phase_for_date(observation_time)
-            if "error" in moon_phase_info:
-                continue  # 오류가 있는 경우 건너뜀
-
-            # `moon_phase_info`의 데이터를 그대로 사용
-            moon_phase = moon_phase_info["moon_phase"]
-            illumination = moon_phase_info["illumination"]
-            phase_description = moon_phase_info["phase_description"]
-
-            # 위상 가중치 계산
-            phase_weight = preferred_phases.get(phase_description, 0)
-
-            # 조명률에 따른 추가 점수 (0에 가까울수록 높은 점수)
-            illumination_weight = max(0, (1 - illumination) * 10)  # 0 ~ 10 범위
-
-            # 고도에 따른 추가 가중치
-            altitude_weight = 0
-            if altitude > 60:
-                altitude_weight = 15  # 고도가 60° 이상이면 추가 점수
-            elif altitude > 50:
-                altitude_weight = 10  # 고도가 50~60° 사이면 보통 점수
-            elif altitude > 30:
-                altitude_weight = 5  # 고도가 30~50° 사이면 낮은 점수
-
-            # 중앙값 날짜와의 거리 가중치
-            days_from_mid = abs((current_date - mid_date).days)
-            mid_date_weight = max(0, 10 - days_from_mid)  # 중앙 날짜에 가까울수록 높은 점수 (최대 10점)
-
-            # 최종 점수 계산
-            score = altitude + phase_weight + illumination_weight + altitude_weight + mid_date_weight
-
-            # 조건 평가 (고도와 점수 기준)
-            if score > best_conditions["score"]:
-                best_date = current_date
-                best_time = observation_time
-                best_conditions = {
-                    "altitude": altitude,
-                    "moon_phase": moon_phase,
-                    "illumination": illumination,
-                    "phase_description": phase_description,
-                    "direction": direction,
-                    "score": score  # 점수 저장
-                }
-                # print(f"Updated Best Conditions: {best_conditions}")
-
-        current_date += timedelta(days=1)
+    # 관측 시각(1시간 간격)을 하나의 Time 배열로 구성
+    num_days = (end_date - start_date).days + 1
+    if num_days <= 0:
+        return {"best_date": best_time, "conditions": best_conditions}
+
+    hour_offsets = np.arange(num_days * 24)
+    observation_times = ts.utc(start_date.year, start_date.month, start_date.day,
+                               start_date.hour + hour_offsets, start_date.minute)
+
+    # 모든 관측 시각의 고도와 방위각을 한 번에 계산
+    altitudes, azimuths = calculate_altitude_azimuth_series(ra, dec, latitude, longitude, 0, observation_times)
+
+    # 달의 위상은 날짜 단위로 결정되므로 하루에 한 번만 계산
+    day_phase_weights = np.zeros(num_days)
+    day_illumination_weights = np.zeros(num_days)
+    day_mid_date_weights = np.zeros(num_days)
+    day_valid = np.zeros(num_days, dtype=bool)
+    day_moon_info = []
+    for day in range(num_days):
+        current_date = start_date + timedelta(days=day)
+        moon_phase_info = get_moon_phase_for_date(current_date)
+        day_moon_info.append(moon_phase_info)
+        if "error" in moon_phase_info:
+            continue  # 오류가 있는 날짜는 건너뜀
+
+        day_valid[day] = True
+        # 위상 가중치 계산
+        day_phase_weights[day] = preferred_phases.get(moon_phase_info["phase_description"], 0)
+        # 조명률에 따른 추가 점수 (0에 가까울수록 높은 점수, 0 ~ 10 범위)
+        day_illumination_weights[day] = max(0, (1 - moon_phase_info["illumination"]) * 10)
+        # 중앙값 날짜와의 거리 가중치 (중앙 날짜에 가까울수록 높은 점수, 최대 10점)
+        days_from_mid = abs((current_date - mid_date).days)
+        day_mid_date_weights[day] = max(0, 10 - days_from_mid)
+
+    # 고도에 따른 추가 가중치
+    altitude_weights = np.select([altitudes > 60, altitudes > 50, altitudes > 30], [15, 10, 5], default=0)
+
+    # 최종 점수 계산 (날짜별 값은 시간 축으로 확장)
+    day_index = hour_offsets // 24
+    scores = (altitudes + day_phase_weights[day_index] + day_illumination_weights[day_index]
+              + altitude_weights + day_mid_date_weights[day_index])
+    scores = np.where(day_valid[day_index], scores, -np.inf)
+
+    # 가장 먼저 나타나는 최고 점수를 선택 (기존 순차 비교와 동일한 결과)
+    best_index = int(np.argmax(scores))
+    if scores[best_index] > best_conditions["score"]:
+        moon_phase_info = day_moon_info[best_index // 24]
+        best_time = start_date + timedelta(hours=best_index)
+        best_conditions = {
+            "altitude": float(altitudes[best_index]),
+            "moon_phase": moon_phase_info["moon_phase"],
+            "illumination": moon_phase_info["illumination"],
+            "phase_description": moon_phase_info["phase_description"],
+            "direction": azimuth_to_direction(azimuths[best_index]),
+            "score": float(scores[best_index])  # 점수 저장
+        }
 
     # print(f"Best Date and Time: {best_time}, Final Conditions: {best_conditions}")
     return {"best_date": best_time, "conditions": best_conditions}
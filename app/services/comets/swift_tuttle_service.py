@@ -1,10 +1,8 @@
 # # services/comets/swift_tuttle_service.py
 
 from datetime import datetime, timedelta
-from app.services.horizons_service import get_comet_approach_events
-from app.services.comets import analyze_comet_data
-from app.services.comets import parse_ra_dec
-from app.services.comets import detect_closing_or_receding
+from app.services.comets.comet_series_service import get_comet_approach_series
+from app.services.comets import analyze_comet_series
 
 
 def get_swift_tuttle_approach_data(start_date, range_days=365):
@@ -18,24 +16,21 @@ def get_swift_tuttle_approach_data(start_date, range_days=365):
             range_days = 365
 
         # 혜성 접근 이벤트 데이터 가져오기
-        raw_data = get_comet_approach_events('Swift-Tuttle', start_date_obj, range_days)
+        raw_data = get_comet_approach_series('Swift-Tuttle', start_date_obj, range_days)
 
         if not raw_data or "error" in raw_data or not raw_data.get('data'):
             return {"error": "No comet approach data available."}
 
         # 접근 이벤트 데이터 분석
-        analyzed_data = analyze_comet_data(raw_data['data'])
+        analyzed_data = analyze_comet_series(raw_data)
         if "error" in analyzed_data:
             return analyzed_data
 
-        sorted_data = analyzed_data['sorted_data']
         closest_approach = analyzed_data['closest_approach']
 
         # 혜성이 지구에서 멀어지고 있는지 판단
-        detection_result = detect_closing_or_receding(sorted_data)
+        detection_result = analyzed_data['detection']
         print(f"[DEBUG] Detection result: {detection_result}")
-        if "error" in detection_result:
-            return detection_result
 
         if detection_result["status"] == "receding":
             # 멀어지고 있는 경우, 이후 가까워지는 접근 이벤트가 있다면 그 데이터를 사용
@@ -53,13 +48,13 @@ def get_swift_tuttle_approach_data(start_date, range_days=365):
                     f"[DEBUG] Next August date set to (after adjustment if needed): {next_august} (Type: {type(next_august)})")
 
                 # 다음 8월로 접근 데이터를 가져오기
-                raw_data = get_comet_approach_events('Swift-Tuttle', next_august, range_days)
+                raw_data = get_comet_approach_series('Swift-Tuttle', next_august, range_days)
 
                 if not raw_data or "error" in raw_data or not raw_data.get('data'):
                     return {"error": "No comet approach data available for the adjusted date."}
 
                 # 다시 접근 이벤트 데이터 분석
-                analyzed_data = analyze_comet_data(raw_data['data'])
+                analyzed_data = analyze_comet_series(raw_data)
                 if "error" in analyzed_data:
                     return analyzed_data
 
@@ -74,28 +69,18 @@ def get_swift_tuttle_approach_data(start_date, range_days=365):
             if not (peak_period_start <= closest_approach_time <= peak_period_end):
                 print(
                     f"[DEBUG] Closest approach is not within peak period, adjusting date to peak period start: {peak_period_start}")
-                raw_data = get_comet_approach_events('Swift-Tuttle', peak_period_start, range_days)
+                raw_data = get_comet_approach_series('Swift-Tuttle', peak_period_start, range_days)
 
                 if not raw_data or "error" in raw_data or not raw_data.get('data'):
                     return {"error": "No comet approach data available for the peak period date."}
 
                 # 다시 접근 이벤트 데이터 분석
-                analyzed_data = analyze_comet_data(raw_data['data'])
+                analyzed_data = analyze_comet_series(raw_data)
                 if "error" in analyzed_data:
                     return analyzed_data
 
                 closest_approach = analyzed_data['closest_approach']
 
-        # 좌표 변환 처리
-        ra_str = closest_approach['ra']
-        dec_str = closest_approach['dec']
-        print(f"[DEBUG] RA string: {ra_str}, DEC string: {dec_str}")
-        converted_ra, converted_dec = parse_ra_dec(ra_str, dec_str)
-        print(f"[DEBUG] Converted RA: {converted_ra}, Converted DEC: {converted_dec}")
-
-        closest_approach['converted_ra'] = converted_ra
-        closest_approach['converted_dec'] = converted_dec
-
         return {
             "status": detection_result["status"],
             "closest_approach": closest_approach,
@@ -1,7 +1,8 @@
 from .constellation_service import get_constellations_for_date_range
 from .constellation_visibility_service import process_day_data, \
-    calculate_visibility_for_constellations_parallel
+    calculate_visibility_for_constellations_batched, calculate_visibility_for_constellations_parallel
 
 __all__ = ['get_constellations_for_date_range',
            'process_day_data',
-           'calculate_visibility_for_constellations_parallel']
\ No newline at end of file
+           'calculate_visibility_for_constellations_batched',
+           'calculate_visibility_for_constellations_parallel']
@@ -1,12 +1,16 @@
 # services/constellation_visibility_service.py
 
 from skyfield.api import Topos, N, E, Star
+from skyfield.constants import ANGVEL, C_AUDAY, DAY_S
+from skyfield.framelib import itrs
+from skyfield.functions import length_of, mxm, mxv, to_spherical
+from skyfield.positionlib import position_of_radec
 from app.global_resources import ts, earth  # 각종 전역 리소스 임포트
 from datetime import datetime, timedelta
 import numpy as np
 import logging
-from multiprocessing import Pool
 from app.services.directions_utils import azimuth_to_direction
+from app.services.timezone_conversion_service import round_seconds
 from app import cache  # Flask-Caching import
 
 logging.basicConfig(level=logging.DEBUG)
@@ -15,6 +19,88 @@ logging.basicConfig(level=logging.DEBUG)
 KOREA_AVERAGE_ALTITUDE = 480  # meters
 
 
+def calculate_constellation_visibility(date_str, constellation_name, sunset_str, sunrise_str, offset_sec,
+                                       ra_deg, dec_deg, latitude, longitude):
+    """
+    주어진 날짜와 위치에서 특정 별자리가 가장 잘 보인다고 예상되는 시간대를 계산하는 함수
+
+    Args:
+        date_str (str): 날짜 (YYYY-MM-DD)
+        constellation_name (str): 별자리 이름
+        sunset_str (str): 현지 일몰 시간 (ISO 형식)
+        sunrise_str (str): 현지 일출 시간 (ISO 형식)
+        offset_sec (int): 타임존 오프셋 (초 단위)
+        ra_deg (float): 적경 (도)
+        dec_deg (float): 적위 (도)
+        latitude (float): 위도
+        longitude (float): 경도
+
+    Returns:
+        dict: 별자리의 가장 잘 보인다고 예상되는 시간대 정보
+    """
+    # 일몰 및 일출 시간 가져오기
+    sunset_time = datetime.fromisoformat(sunset_str)
+    sunrise_time = datetime.fromisoformat(sunrise_str)
+    if offset_sec is None:
+        raise ValueError("Missing offset in day_data")
+
+    # 일몰이 일출보다 늦은 경우 (다음 날로 넘어가는 경우)
+    if sunset_time > sunrise_time:
+        sunrise_time += timedelta(days=1)
+
+    # Skyfield에서 사용할 위치 및 날짜 객체 생성
+    location = Topos(latitude * N, longitude * E, elevation_m=KOREA_AVERAGE_ALTITUDE)
+    t0 = ts.utc(sunset_time.year, sunset_time.month, sunset_time.day, sunset_time.hour, sunset_time.minute)
+    t1 = ts.utc(sunrise_time.year, sunrise_time.month, sunrise_time.day, sunrise_time.hour, sunrise_time.minute)
+
+    # 일몰부터 일출까지 10분 간격으로 시간 생성 (간격 조정)
+    num_steps = max(1, int((t1.tt - t0.tt) * 24 * 6))  # 10분 간격으로 시간 생성, 최소 1 스텝 보장
+    times = ts.utc([t0.utc_datetime() + timedelta(minutes=10 * i) for i in range(num_steps)])
+
+    # 관찰자 위치에서 천체 위치 계산 (벡터화 적용)
+    observer = earth + location
+
+    # 이미 가져온 적경(ra)과 적위(dec) 사용
+    if ra_deg is None or dec_deg is None:
+        raise ValueError(f"Missing RA or DEC for constellation {constellation_name}")
+
+    # 별자리 정보를 Star 객체로 변환
+    star = Star(ra_hours=ra_deg / 15, dec_degrees=dec_deg)
+
+    # 천체 위치 계산 (벡터화 처리)
+    astrometric = observer.at(times).observe(star).apparent()
+    altitudes, azimuths, _ = astrometric.altaz()
+
+    # Lazy Evaluation 적용: 최고 고도 찾기
+    max_altitude = max(altitudes.degrees)
+    if max_altitude < 0:
+        # 모든 고도가 음수인 경우 (관측 불가)
+        return {
+            "date": date_str,
+            "constellation": constellation_name,
+            "error": "Constellation not visible during the night"
+        }
+
+    # 최고 고도 시간 찾기
+    best_index = np.argmax(altitudes.degrees)
+    best_time = times[best_index].utc_datetime()
+
+    # 계산된 UTC 시간을 다시 현지 시간으로 변환
+    local_datetime = best_time + timedelta(seconds=offset_sec)
+
+    # 방위경을 동서남북 분포로 변환
+    azimuth = azimuths.degrees[best_index]
+    direction = azimuth_to_direction(azimuth)
+
+    return {
+        "date": date_str,
+        "constellation": constellation_name,
+        "best_visibility_time": local_datetime.strftime('%H:%M:%S'),
+        "max_altitude": f"{max_altitude:.2f}°",
+        "azimuth": direction
+    }
+
+
 @cache.memoize(timeout=3600)  # 캐싱 적용 (1시간)
 def process_day_data(day_data, latitude, longitude):
     """
@@ -31,92 +117,164 @@ def process_day_data(day_data, latitude, longitude):
     latitude = round(latitude, 4)
     longitude = round(longitude, 4)
 
+    if "error" in day_data:
+        return {
+            "date": day_data["date"],
+            "error": day_data["error"]
+        }
+
     constellation_name = day_data.get("constellation", "Unknown")
     try:
+        return calculate_constellation_visibility(day_data["date"], constellation_name, day_data.get("sunset"),
+                                                  day_data.get("sunrise"), day_data.get("offset"),
+                                                  day_data.get("ra_deg"), day_data.get("dec_deg"),
+                                                  latitude, longitude)
+    except Exception as e:
+        return {
+            "date": day_data["date"],
+            "constellation": constellation_name,
+            "error": f"Failed to calculate visibility: {str(e)}"
+        }
+
+
+def calculate_visibility_for_constellations_batched(constellation_data, latitude, longitude):
+    """
+    날짜 범위 전체의 별자리 최적 가시성 정보를 한 번의 벡터화 계산으로 구하는 함수
+
+    모든 밤의 10분 간격 관측 시각과 방향(적경/적위)을 하나의 배열로 이어 붙여 한 번의 회전으로 고도/방위각을 구하고,
+    밤(구간)별 최고 고도 지점을 NumPy 구간 연산으로 찾는다.
+
+    Args:
+        constellation_data (list): 별자리 정보 리스트
+        latitude (float): 위도
+        longitude (float): 경도
+
+    Returns:
+        list: 가시성 정보가 추가된 별자리 정보 리스트
+    """
+    if isinstance(constellation_data, dict) and "error" in constellation_data:
+        return constellation_data
+
+    latitude = round(latitude, 4)
+    longitude = round(longitude, 4)
+
+    results = [None] * len(constellation_data)
+    nights = []
+    for position, day_data in enumerate(constellation_data):
         if "error" in day_data:
-            return {
+            results[position] = {"date": day_data["date"], "error": day_data["error"]}
+            continue
+
+        constellation_name = day_data.get("constellation", "Unknown")
+        try:
+            sunset_time = datetime.fromisoformat(day_data["sunset"])
+            sunrise_time = datetime.fromisoformat(day_data["sunrise"])
+            offset_sec = day_data.get("offset")
+            if offset_sec is None:
+                raise ValueError("Missing offset in day_data")
+
+            ra_deg = day_data.get("ra_deg")
+            dec_deg = day_data.get("dec_deg")
+            if ra_deg is None or dec_deg is None:
+                raise ValueError(f"Missing RA or DEC for constellation {constellation_name}")
+
+            # 일몰이 일출보다 늦은 경우 (다음 날로 넘어가는 경우)
+            if sunset_time > sunrise_time:
+                sunrise_time += timedelta(days=1)
+
+            nights.append((position, day_data["date"], constellation_name, sunset_time, sunrise_time,
+                           offset_sec, ra_deg, dec_deg))
+        except Exception as e:
+            results[position] = {
                 "date": day_data["date"],
-                "error": day_data["error"]
+                "constellation": constellation_name,
+                "error": f"Failed to calculate visibility: {str(e)}"
             }
 
-        date = datetime.strptime(day_data["date"], '%Y-%m-%d')
+    if not nights:
+        return results
 
-        # 일몰 및 일출 시간 가져오기
-        sunset_time = datetime.fromisoformat(day_data["sunset"])
-        sunrise_time = datetime.fromisoformat(day_data["sunrise"])
-        offset_sec = day_data.get("offset")
-        if offset_sec is None:
-            raise ValueError("Missing offset in day_data")
+    positions, dates, names, sunsets, sunrises, offsets, ra_values, dec_values = zip(*nights)
 
-        # 일몰이 일출보다 늦은 경우 (다음 날로 넘어가는 경우)
-        if sunset_time > sunrise_time:
-            sunrise_time += timedelta(days=1)
+    # 모든 밤의 일몰/일출 시각을 한 번에 Time 배열로 변환
+    t0 = ts.utc([t.year for t in sunsets], [t.month for t in sunsets], [t.day for t in sunsets],
+                [t.hour for t in sunsets], [t.minute for t in sunsets])
+    t1 = ts.utc([t.year for t in sunrises], [t.month for t in sunrises], [t.day for t in sunrises],
+                [t.hour for t in sunrises], [t.minute for t in sunrises])
 
-        # Skyfield에서 사용할 위치 및 날짜 객체 생성
-        location = Topos(latitude * N, longitude * E, elevation_m=KOREA_AVERAGE_ALTITUDE)
-        t0 = ts.utc(sunset_time.year, sunset_time.month, sunset_time.day, sunset_time.hour, sunset_time.minute)
-        t1 = ts.utc(sunrise_time.year, sunrise_time.month, sunrise_time.day, sunrise_time.hour, sunrise_time.minute)
+    # 밤마다 일몰부터 일출까지 10분 간격 샘플 개수 (최소 1 스텝 보장)
+    step_days = 10 / (24 * 60)
+    counts = np.maximum(1, ((t1.tt - t0.tt) * 24 * 6).astype(int))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    night_index = np.repeat(np.arange(len(nights)), counts)
+    step_index = np.arange(counts.sum()) - starts[night_index]
+    sample_tt = t0.tt[night_index] + step_index * step_days
 
-        # 일몰부터 일출까지 10분 간격으로 시간 생성 (간격 조정)
-        num_steps = max(1, int((t1.tt - t0.tt) * 24 * 6))  # 10분 간격으로 시간 생성, 최소 1 스텝 보장
-        times = ts.utc([t0.utc_datetime() + timedelta(minutes=10 * i) for i in range(num_steps)])
+    # 샘플마다 그 밤의 방향(적경/적위)을 단위 벡터로 만들어 모든 샘플을 한 번에 지평 좌표계로 회전
+    # (Star는 좌표 배열과 시각 배열을 원소별로 짝짓지 않으므로 항성 관측과 같은 계산을 배열로 수행)
+    location = Topos(latitude * N, longitude * E, elevation_m=KOREA_AVERAGE_ALTITUDE)
+    ra_values = np.asarray(ra_values, dtype=float)
+    dec_values = np.asarray(dec_values, dtype=float)
+    directions = position_of_radec(ra_values[night_index] / 15, dec_values[night_index]).position.au
+    directions /= length_of(directions)
 
-        # 관찰자 위치에서 천체 위치 계산 (벡터화 적용)
-        observer = earth + location
+    # 연주 광행차 보정 (지구의 태양계 질량중심 속도, 1차 근사)
+    velocity = earth.at(ts.tt_jd(sample_tt)).velocity.au_per_d / C_AUDAY
+    apparent = directions + velocity
+    apparent /= length_of(apparent)
 
-        # 이미 가져온 적경(ra)과 적위(dec) 사용
-        ra_deg = day_data.get("ra_deg")
-        dec_deg = day_data.get("dec_deg")
-        if ra_deg is None or dec_deg is None:
-            raise ValueError(f"Missing RA or DEC for constellation {constellation_name}")
+    # 세차/장동 행렬은 밤마다 일몰 시각에서 한 번만 계산하고 (하룻밤 변화는 0.1초 미만)
+    # 일몰 이후 샘플 시각까지의 지구 자전만 z축 회전으로 더함 (샘플마다 IAU2000A 장동을 계산하지 않음)
+    at_sunset = mxv(itrs.rotation_at(t0)[:, :, night_index], apparent)
+    spin = (sample_tt - t0.tt[night_index]) * ANGVEL * DAY_S
+    cos_spin, sin_spin = np.cos(spin), np.sin(spin)
+    earth_fixed = np.array([cos_spin * at_sunset[0] + sin_spin * at_sunset[1],
+                            cos_spin * at_sunset[1] - sin_spin * at_sunset[0],
+                            at_sunset[2]])
 
-        # 별자리 정보를 Star 객체로 변환
-        star = Star(ra_hours=ra_deg / 15, dec_degrees=dec_deg)
+    # 지구 고정 좌표계 → 관측지 지평 좌표계 (위도/경도 회전은 시각과 무관)
+    latlon_rotation = mxm(location.rotation_at(t0[0]), itrs.rotation_at(t0[0]).T)
+    _, altitude_radians, azimuth_radians = to_spherical(mxv(latlon_rotation, earth_fixed))
+    altitude_degrees = np.degrees(altitude_radians)
+    azimuth_degrees = np.degrees(azimuth_radians)
 
-        # 천체 위치 계산 (벡터화 처리)
-        astrometric = observer.at(times).observe(star).apparent()
-        altitudes, azimuths, _ = astrometric.altaz()
+    # 밤별 최고 고도와 그 첫 번째 위치 (구간별 argmax)
+    max_altitudes = np.maximum.reduceat(altitude_degrees, starts)
+    is_max = altitude_degrees == max_altitudes[night_index]
+    max_positions = np.flatnonzero(is_max)
+    best_indices = max_positions[np.searchsorted(max_positions, starts)]
+    best_times = ts.tt_jd(sample_tt[best_indices]).utc_datetime()
 
-        # Lazy Evaluation 적용: 최고 고도 찾기
-        max_altitude = max(altitudes.degrees)
-        if max_altitude < 0:
+    for i, position in enumerate(positions):
+        if max_altitudes[i] < 0:
             # 모든 고도가 음수인 경우 (관측 불가)
-            return {
-                "date": day_data["date"],
-                "constellation": constellation_name,
+            results[position] = {
+                "date": dates[i],
+                "constellation": names[i],
                 "error": "Constellation not visible during the night"
             }
+            continue
 
-        # 최고 고도 시간 찾기
-        best_index = np.argmax(altitudes.degrees)
-        best_time = times[best_index].utc_datetime()
-
-        # 계산된 UTC 시간을 다시 현지 시간으로 변환
-        local_datetime = best_time + timedelta(seconds=offset_sec)
+        # 계산된 UTC 시간을 다시 현지 시간으로 변환 (부동소수점 오차 보정을 위해 초 단위 반올림)
+        local_datetime = round_seconds(best_times[i] + timedelta(seconds=offsets[i]))
 
-        # 방위경을 동서남북 분포로 변환
-        azimuth = azimuths.degrees[best_index]
-        direction = azimuth_to_direction(azimuth)
-
-        return {
-            "date": day_data["date"],
-            "constellation": constellation_name,
+        results[position] = {
+            "date": dates[i],
+            "constellation": names[i],
             "best_visibility_time": local_datetime.strftime('%H:%M:%S'),
-            "max_altitude": f"{max_altitude:.2f}°",
-            "azimuth": direction
+            "max_altitude": f"{max_altitudes[i]:.2f}°",
+            "azimuth": azimuth_to_direction(azimuth_degrees[best_indices[i]])
         }
 
-    except Exception as e:
-        return {
-            "date": day_data["date"],
-            "constellation": constellation_name,
-            "error": f"Failed to calculate visibility: {str(e)}"
-        }
+    return results
 
 
 def calculate_visibility_for_constellations_parallel(constellation_data, latitude, longitude):
     """
-    별자리 데이터에 대한 최적 가시성 정보를 병렬 처리로 계산하는 함수
+    날짜 범위 전체의 별자리 최적 가시성 정보를 구하는 함수 (기존 이름 유지)
+
+    요청마다 프로세스 풀을 만들던 경로로, 이제 프로세스를 만들지 않고 현재 프로세스에서
+    calculate_visibility_for_constellations_batched의 벡터화 계산을 사용한다.
 
     Args:
         constellation_data (list): 별자리 정보 리스트
@@ -126,13 +284,8 @@ def calculate_visibility_for_constellations_parallel(constellation_data, latitud
     Returns:
         list: 가시성 정보가 추가된 별자리 정보 리스트
     """
-    latitude = round(latitude, 4)
-    longitude = round(longitude, 4)
-
-    with Pool() as pool:
-        results = pool.starmap(process_day_data,
-                               [(day, latitude, longitude) for day in constellation_data])
-    return results
+    return calculate_visibility_for_constellations_batched(constellation_data, latitude, longitude)
 
 
-__all__ = ['calculate_visibility_for_constellations_parallel']
+__all__ = ['calculate_visibility_for_constellations_batched', 'calculate_visibility_for_constellations_parallel',
+           'process_day_data', 'calculate_constellation_visibility']
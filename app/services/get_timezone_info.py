@@ -1,15 +1,107 @@
 import os
-from datetime import datetime
+import threading
+from datetime import datetime, timezone, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import requests
 
 from app import cache  # Flask-Caching import
 
+try:
+    from timezonefinder import TimezoneFinder  # 시간대 경계 데이터셋 + 공간 인덱스
+except ImportError:  # 설치되지 않은 경우 Google API만 사용
+    TimezoneFinder = None
+
+# 시간대 해석 방식: "local" (로컬 경계 데이터 우선, 실패 시 Google) 또는 "google" (Google API만 사용)
+TIMEZONE_RESOLVER = os.getenv('TIMEZONE_RESOLVER', 'local').lower()
+
+# Google Time Zone API 주소 (로컬 대체 서버로 재생/벤치마크 시 환경변수로 변경)
+GOOGLE_TIMEZONE_API_URL = os.getenv('GOOGLE_TIMEZONE_API_URL', 'https://maps.googleapis.com/maps/api/timezone/json')
+
+# Google Time Zone API 연결/응답 대기 시간 (초) - 대체 경로 지연 시 요청이 무기한 묶이지 않도록 제한
+GOOGLE_TIMEZONE_CONNECT_TIMEOUT = float(os.getenv('GOOGLE_TIMEZONE_CONNECT_TIMEOUT', 3))
+GOOGLE_TIMEZONE_READ_TIMEOUT = float(os.getenv('GOOGLE_TIMEZONE_READ_TIMEOUT', 5))
+
+_timezone_finder = None
+_timezone_finder_lock = threading.Lock()
+
+
+def get_timezone_finder():
+    """
+    로컬 시간대 경계 데이터셋을 로드한 TimezoneFinder 인스턴스를 반환하는 함수 (최초 호출 시 한 번만 로드)
+
+    Returns:
+        TimezoneFinder: 시간대 검색 객체 또는 None (timezonefinder 미설치 시)
+    """
+    global _timezone_finder
+    if TimezoneFinder is None:
+        return None
+
+    if _timezone_finder is None:
+        with _timezone_finder_lock:
+            if _timezone_finder is None:
+                _timezone_finder = TimezoneFinder()
+    return _timezone_finder
+
+
+def resolve_timezone_id(lat, lon):
+    """
+    위도와 경도로부터 IANA 시간대 ID를 로컬에서 찾는 함수
+
+    Args:
+        lat (float): 위도
+        lon (float): 경도
+
+    Returns:
+        str: IANA 시간대 ID (예: "Asia/Seoul") 또는 None
+    """
+    finder = get_timezone_finder()
+    if finder is None:
+        return None
+    return finder.timezone_at(lat=lat, lng=lon)
+
+
+def get_local_timezone_info(lat, lon, timestamp):
+    """
+    로컬 시간대 경계 데이터와 tzdata를 사용하여 시간대 정보를 계산하는 함수.
+    반환 형식은 Google Time Zone API 응답과 동일하다.
+
+    Args:
+        lat (float): 위도
+        lon (float): 경도
+        timestamp (int): 타임스탬프 (초 단위)
+
+    Returns:
+        dict: 시간대 정보 또는 None (로컬에서 해석할 수 없는 경우)
+    """
+    timezone_id = resolve_timezone_id(lat, lon)
+    if not timezone_id:
+        return None
+
+    try:
+        zone = ZoneInfo(timezone_id)
+    except ZoneInfoNotFoundError:
+        return None
+
+    # 요청 시각 기준으로 표준시 오프셋과 서머타임 오프셋을 분리
+    local_time = datetime.fromtimestamp(timestamp, tz=timezone.utc).astimezone(zone)
+    total_offset = local_time.utcoffset() or timedelta(0)
+    dst_offset = local_time.dst() or timedelta(0)
+
+    return {
+        'status': 'OK',
+        'timeZoneId': timezone_id,
+        'timeZoneName': local_time.tzname(),
+        'rawOffset': int((total_offset - dst_offset).total_seconds()),
+        'dstOffset': int(dst_offset.total_seconds())
+    }
+
 
 @cache.memoize(timeout=43200)  # 캐싱 적용, 12시간 유효
 def get_timezone_info(lat, lon, timestamp):
     """
-    Google Time Zone API를 사용하여 시간대 정보를 가져오는 함수.
+    위도와 경도로부터 시간대 정보를 가져오는 함수.
+    로컬 시간대 경계 데이터로 먼저 계산하고, 해석할 수 없는 경우에만 Google Time Zone API를 사용한다.
 
     Args:
         lat (float): 위도
@@ -20,11 +112,31 @@ def get_timezone_info(lat, lon, timestamp):
         dict: 시간대 정보
     """
     print("============get_timezone_info 작동===============")
+    if TIMEZONE_RESOLVER != 'google':
+        timezone_info = get_local_timezone_info(lat, lon, timestamp)
+        if timezone_info is not None:
+            return timezone_info
+
+    return get_google_timezone_info(lat, lon, timestamp)
+
+
+def get_google_timezone_info(lat, lon, timestamp):
+    """
+    Google Time Zone API를 사용하여 시간대 정보를 가져오는 함수.
+
+    Args:
+        lat (float): 위도
+        lon (float): 경도
+        timestamp (int): 타임스탬프 (초 단위)
+
+    Returns:
+        dict: 시간대 정보
+    """
     api_key = os.getenv('GOOGLE_TIMEZONE_API_KEY')
     if not api_key:
         raise ValueError("Google Time Zone API key is not set in environment variables.")
 
-    base_url = "https://maps.googleapis.com/maps/api/timezone/json"
+    base_url = GOOGLE_TIMEZONE_API_URL
     params = {
         'location': f'{lat},{lon}',
         'timestamp': timestamp,
@@ -34,7 +146,8 @@ def get_timezone_info(lat, lon, timestamp):
     # print(f"Requesting Google Time Zone API for lat: {lat}, lon: {lon}, timestamp: {timestamp}")
     # print(f"Request parameters: {json.dumps(params)}")
 
-    response = requests.get(base_url, params=params)
+    response = requests.get(base_url, params=params,
+                            timeout=(GOOGLE_TIMEZONE_CONNECT_TIMEOUT, GOOGLE_TIMEZONE_READ_TIMEOUT))
 
     # 로그 추가 - 응답 상태 코드와 내용 기록
     # print(f"Response status code: {response.status_code}")
@@ -48,7 +161,7 @@ def get_timezone_info(lat, lon, timestamp):
 
 def get_timezone_from_lat_lon(latitude, longitude, timestamp=None):
     """
-    위도와 경도로부터 시간대 정보를 가져오는 함수 (Google Time Zone API 사용)
+    위도와 경도로부터 시간대 정보를 가져오는 함수 (로컬 경계 데이터 우선, Google Time Zone API 대체)
 
     Args:
         latitude (float): 위도
@@ -75,3 +188,7 @@ def get_timezone_from_lat_lon(latitude, longitude, timestamp=None):
     except Exception as e:
         print(f"Error fetching timezone information: {e}")
         return None
+
+
+__all__ = ['get_timezone_info', 'get_timezone_from_lat_lon', 'get_local_timezone_info', 'get_google_timezone_info',
+           'resolve_timezone_id']
@@ -0,0 +1,262 @@
+# services/horizons_cache_service.py
+
+import os
+import gzip
+import json
+import time
+import hashlib
+import logging
+import threading
+
+# 캐시 디렉터리와 최대 크기 (바이트) - 초과 시 가장 오래 사용하지 않은 응답부터 삭제
+HORIZONS_CACHE_DIR = os.getenv('HORIZONS_CACHE_DIR', os.path.join('instance', 'horizons_cache'))
+HORIZONS_CACHE_MAX_BYTES = int(os.getenv('HORIZONS_CACHE_MAX_BYTES', 512 * 1024 * 1024))
+HORIZONS_CACHE_ENABLED = os.getenv('HORIZONS_CACHE_ENABLED', 'true').lower() == 'true'
+
+# 삭제 시 최대 크기의 이 비율까지 줄여 매 쓰기마다 삭제가 반복되지 않도록 함
+EVICTION_TARGET_RATIO = 0.9
+
+# 캐시 키에서 제외할 파라미터 (응답 내용과 무관)
+IGNORED_PARAMS = {'key'}
+
+# 프로세스 내 인덱스 {키: (크기, 마지막 사용 시각)} - 최초 사용 시 디렉터리를 훑어 구성.
+# 여러 워커가 같은 디렉터리를 공유하므로 인덱스에는 다른 워커의 저장/삭제가 반영되지 않는다.
+# 로컬 합계가 최대 크기를 넘거나, 마지막으로 훑은 뒤 이 프로세스가 쓴 양이 삭제 여유분
+# (최대 크기 x (1 - EVICTION_TARGET_RATIO))을 넘으면 디렉터리를 다시 훑어 실제 크기로 삭제 여부를 판단한다.
+# 따라서 전체 크기는 최대 크기 + 워커 수 x 삭제 여유분을 넘지 않는다.
+_index = {}
+_index_loaded = False
+_total_bytes = 0
+_written_since_scan = 0
+_cache_lock = threading.Lock()
+
+_cache_stats = {
+    "hits": 0,
+    "misses": 0,
+    "writes": 0,
+    "evictions": 0,
+    "errors": 0
+}
+
+
+def is_cacheable_request(params):
+    """
+    고정된 파라미터에 대해 항상 같은 결과를 주는 요청(천체력 생성)인지 판단하는 함수.
+    레코드 번호 검색처럼 시간이 지나면 결과가 바뀌는 요청은 캐시하지 않는다.
+
+    Args:
+        params (dict): Horizons API 쿼리 파라미터
+
+    Returns:
+        bool: 캐시 가능 여부
+    """
+    return HORIZONS_CACHE_ENABLED and str(params.get('MAKE_EPHEM', '')).strip("'\"").upper() == 'YES'
+
+
+def is_cacheable_response(body):
+    """
+    응답 본문이 캐시해도 되는 결과인지 판단하는 함수.
+    Horizons는 잘못된 요청에도 200 상태 코드와 "error" 키가 있는 JSON 본문을 반환하므로 이를 제외한다.
+
+    Args:
+        body (str): 응답 본문
+
+    Returns:
+        bool: 캐시 가능 여부 (JSON이 아닌 본문은 그대로 캐시)
+    """
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return True
+    return not (isinstance(data, dict) and "error" in data)
+
+
+def horizons_cache_key(params):
+    """
+    정규화한 요청 파라미터(키 정렬, 값 앞뒤 공백 제거)의 SHA-256 해시로 캐시 키를 만드는 함수
+
+    Args:
+        params (dict): Horizons API 쿼리 파라미터
+
+    Returns:
+        str: 캐시 키
+    """
+    canonical = json.dumps(
+        {str(name): str(value).strip() for name, value in params.items() if name not in IGNORED_PARAMS},
+        sort_keys=True, ensure_ascii=False, separators=(',', ':')
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _cache_path(key):
+    return os.path.join(HORIZONS_CACHE_DIR, key[:2], f"{key}.json.gz")
+
+
+def _scan_locked():
+    """
+    캐시 디렉터리를 훑어 인덱스와 총 크기를 다시 구성하는 함수 (_cache_lock 안에서 호출).
+    다른 워커가 저장하거나 삭제한 항목과 마지막 사용 시각(파일 수정 시각)이 반영된다.
+    """
+    global _index_loaded, _total_bytes, _written_since_scan
+    _index.clear()
+    _total_bytes = 0
+    _written_since_scan = 0
+    if os.path.isdir(HORIZONS_CACHE_DIR):
+        for shard in os.scandir(HORIZONS_CACHE_DIR):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith('.json.gz'):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue  # 훑는 도중 다른 워커가 삭제한 경우
+                    _index[entry.name[:-len('.json.gz')]] = (stat.st_size, stat.st_mtime)
+                    _total_bytes += stat.st_size
+    _index_loaded = True
+
+
+def _load_index():
+    """
+    최초 사용 시 캐시 디렉터리를 훑어 인덱스와 총 크기를 구성하는 함수 (_cache_lock 안에서 호출)
+    """
+    if _index_loaded:
+        return
+    _scan_locked()
+    _evict_locked()  # 최대 크기가 줄어든 채로 재시작한 경우
+
+
+def _evict_locked():
+    """
+    총 크기가 최대 크기를 넘으면 마지막 사용 시각이 오래된 순으로 삭제하는 함수 (_cache_lock 안에서 호출)
+    """
+    global _total_bytes
+    if _total_bytes <= HORIZONS_CACHE_MAX_BYTES:
+        return
+
+    target_bytes = HORIZONS_CACHE_MAX_BYTES * EVICTION_TARGET_RATIO
+    for key, (size, _) in sorted(_index.items(), key=lambda item: item[1][1]):
+        if _total_bytes <= target_bytes:
+            break
+        try:
+            os.remove(_cache_path(key))
+        except FileNotFoundError:
+            pass  # 다른 워커가 먼저 삭제한 경우
+        except OSError as e:
+            logging.warning(f"Failed to evict Horizons cache entry {key}: {e}")
+            continue
+        del _index[key]
+        _total_bytes -= size
+        _cache_stats["evictions"] += 1
+
+
+def get_cached_horizons_response(params):
+    """
+    캐시된 Horizons 응답을 반환하는 함수 (사용 시 마지막 사용 시각 갱신)
+
+    Args:
+        params (dict): Horizons API 쿼리 파라미터
+
+    Returns:
+        dict: {"status_code", "content_type", "url", "body"} 또는 None (캐시 없음)
+    """
+    key = horizons_cache_key(params)
+    path = _cache_path(key)
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            cached = json.load(f)
+    except FileNotFoundError:
+        with _cache_lock:
+            _cache_stats["misses"] += 1
+        return None
+    except (OSError, ValueError) as e:
+        logging.warning(f"Corrupt Horizons cache entry {key}: {e}")
+        with _cache_lock:
+            _cache_stats["errors"] += 1
+            _cache_stats["misses"] += 1
+        return None
+
+    # 마지막 사용 시각 갱신 (읽은 직후 다른 워커가 삭제한 경우에도 읽은 응답은 그대로 반환)
+    used_at = time.time()
+    try:
+        os.utime(path, (used_at, used_at))
+    except OSError:
+        used_at = None
+
+    with _cache_lock:
+        _cache_stats["hits"] += 1
+        if key in _index and used_at is not None:
+            _index[key] = (_index[key][0], used_at)
+    return cached
+
+
+def store_horizons_response(params, status_code, content_type, url, body):
+    """
+    Horizons 응답을 압축해 캐시에 저장하는 함수 (임시 파일에 쓴 뒤 교체하여 동시 읽기에 안전)
+
+    Args:
+        params (dict): Horizons API 쿼리 파라미터
+        status_code (int): 응답 상태 코드
+        content_type (str): 응답 Content-Type
+        url (str): 요청 URL
+        body (str): 응답 본문
+    """
+    global _total_bytes, _written_since_scan
+    key = horizons_cache_key(params)
+    path = _cache_path(key)
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with gzip.open(temp_path, 'wt', encoding='utf-8') as f:
+            json.dump({"status_code": status_code, "content_type": content_type, "url": url, "body": body}, f)
+        # 교체 전에 크기와 시각을 읽어 교체 직후 다른 워커가 삭제해도 영향이 없도록 함
+        stat = os.stat(temp_path)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logging.warning(f"Failed to store Horizons cache entry {key}: {e}")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass  # 임시 파일이 만들어지기 전에 실패한 경우
+        with _cache_lock:
+            _cache_stats["errors"] += 1
+        return
+
+    with _cache_lock:
+        _load_index()
+        size = stat.st_size
+        previous_size = _index.get(key, (0, 0))[0]
+        _index[key] = (size, stat.st_mtime)
+        _total_bytes += size - previous_size
+        _written_since_scan += size
+        _cache_stats["writes"] += 1
+
+        # 다른 워커가 쓴 양을 반영하기 위해 삭제 전에 디렉터리를 다시 훑음
+        rescan_bytes = HORIZONS_CACHE_MAX_BYTES * (1 - EVICTION_TARGET_RATIO)
+        if _total_bytes > HORIZONS_CACHE_MAX_BYTES or _written_since_scan > rescan_bytes:
+            _scan_locked()
+        _evict_locked()
+
+
+def get_horizons_cache_stats():
+    """
+    Horizons 응답 캐시의 적중/미적중/저장/삭제 건수와 크기를 반환하는 함수
+
+    Returns:
+        dict: 캐시 통계
+    """
+    with _cache_lock:
+        _load_index()
+        stats = dict(_cache_stats)
+        stats["entries"] = len(_index)
+        stats["total_bytes"] = _total_bytes
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+    stats["max_bytes"] = HORIZONS_CACHE_MAX_BYTES
+    stats["enabled"] = HORIZONS_CACHE_ENABLED
+    stats["directory"] = os.path.abspath(HORIZONS_CACHE_DIR)
+    return stats
+
+
+__all__ = ['is_cacheable_request', 'is_cacheable_response', 'horizons_cache_key', 'get_cached_horizons_response',
+           'store_horizons_response', 'get_horizons_cache_stats']
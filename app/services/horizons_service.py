@@ -1,25 +1,293 @@
 # services/horizons_service.py
 
+import os
+import re
+import time
+import atexit
+import random
+import logging
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app, has_app_context
+from requests.adapters import HTTPAdapter
+from apscheduler.schedulers.background import BackgroundScheduler
 from datetime import datetime, timedelta
 from app.data.data import PLANET_CODES, COMET_CODES
+from app.services.comets.comet_record_service import get_stored_comet_record_number, store_comet_record_numbers
+from app.services.horizons_utils import parse_horizons_ephemeris, HORIZONS_LAYOUTS
+from app.services.horizons_cache_service import is_cacheable_request, is_cacheable_response, \
+    get_cached_horizons_response, store_horizons_response
 
+logger = logging.getLogger(__name__)
 
-def get_comet_record_number(comet_name):
-    comet_code = COMET_CODES.get(comet_name)
-    if not comet_code:
-        return {"error": "Invalid comet name."}
+# ELEMENTS 결과의 궤도 요소 항목 (예: "EC= 9.679E-01", "W = 1.113E+02", "Tp=  2446470.96")
+ELEMENT_PATTERN = re.compile(r'\b(EC|QR|IN|OM|W|Tp)\s*=\s*([-+]?\d+(?:\.\d*)?(?:E[-+]?\d+)?)')
+
+# Horizons API 주소 (로컬 대체 서버로 재생/벤치마크 시 환경변수로 변경)
+HORIZONS_API_URL = os.getenv('HORIZONS_API_URL', 'https://ssd.jpl.nasa.gov/api/horizons.api')
+
+# 연결/응답 대기 시간 (초) - JPL 지연 시 워커가 무기한 묶이지 않도록 제한
+HORIZONS_CONNECT_TIMEOUT = float(os.getenv('HORIZONS_CONNECT_TIMEOUT', 5))
+HORIZONS_READ_TIMEOUT = float(os.getenv('HORIZONS_READ_TIMEOUT', 30))
+
+# 재시도 횟수와 지수 백오프 기본 간격 (초, full jitter 적용)
+HORIZONS_MAX_RETRIES = int(os.getenv('HORIZONS_MAX_RETRIES', 2))
+HORIZONS_RETRY_BACKOFF = float(os.getenv('HORIZONS_RETRY_BACKOFF', 0.5))
+HORIZONS_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 프로세스당 동시 Horizons 호출 수와 슬롯 대기 시간 (초)
+HORIZONS_MAX_CONCURRENCY = int(os.getenv('HORIZONS_MAX_CONCURRENCY', 4))
+HORIZONS_ACQUIRE_TIMEOUT = float(os.getenv('HORIZONS_ACQUIRE_TIMEOUT', 10))
+
+# 독립적인 조회(구간/혜성/연도)를 병렬로 실행할 작업 스레드 수 (실제 API 호출 수는 위 세마포어로 제한)
+HORIZONS_FANOUT_WORKERS = int(os.getenv('HORIZONS_FANOUT_WORKERS', HORIZONS_MAX_CONCURRENCY))
+
+_horizons_session = None
+_horizons_session_lock = threading.Lock()
+_horizons_semaphore = threading.BoundedSemaphore(HORIZONS_MAX_CONCURRENCY)
+
+_fanout_executor = None
+_fanout_executor_lock = threading.Lock()
+_fanout_local = threading.local()  # 현재 스레드가 팬아웃 작업을 실행 중인지 여부
+
+# 프로세스 단위 호출 지표
+_horizons_metrics = {
+    "in_flight": 0,
+    "calls": 0,
+    "succeeded": 0,
+    "failed": 0,
+    "retries": 0,
+    "timeouts": 0,
+    "rejected": 0,
+    "total_latency_ms": 0.0,
+    "max_latency_ms": 0.0,
+    "last_error": None
+}
+_horizons_metrics_lock = threading.Lock()
+
+
+def get_horizons_session():
+    """
+    Horizons API 호출에 공유하는 keep-alive 세션을 반환하는 함수 (최초 호출 시 한 번만 생성)
+
+    Returns:
+        requests.Session: 연결 풀이 설정된 세션
+    """
+    global _horizons_session
+    if _horizons_session is None:
+        with _horizons_session_lock:
+            if _horizons_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HORIZONS_MAX_CONCURRENCY)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _horizons_session = session
+    return _horizons_session
+
+
+def get_fanout_executor():
+    """
+    병렬 조회에 공유하는 스레드 풀을 반환하는 함수 (최초 호출 시 한 번만 생성)
+
+    Returns:
+        ThreadPoolExecutor: 스레드 풀
+    """
+    global _fanout_executor
+    if _fanout_executor is None:
+        with _fanout_executor_lock:
+            if _fanout_executor is None:
+                _fanout_executor = ThreadPoolExecutor(max_workers=HORIZONS_FANOUT_WORKERS,
+                                                      thread_name_prefix='horizons-fanout')
+    return _fanout_executor
+
+
+def fetch_concurrently(calls):
+    """
+    서로 독립적인 조회 함수들을 공유 스레드 풀에서 병렬로 실행하고 입력 순서대로 결과를 반환하는 함수.
+    호출한 스레드의 Flask 앱 컨텍스트를 작업 스레드에도 적용하며,
+    작업 스레드 안에서 다시 호출되면(중첩 팬아웃) 풀이 서로를 기다리며 멈추지 않도록 순서대로 실행한다.
+
+    Args:
+        calls (list): (함수, 인자1, 인자2, ...) 튜플 리스트
+
+    Returns:
+        list: 각 호출의 반환값 리스트 (작업에서 발생한 예외는 호출부로 그대로 전달)
+    """
+    if len(calls) <= 1 or getattr(_fanout_local, 'active', False):
+        return [function(*args) for function, *args in calls]
+
+    app = current_app._get_current_object() if has_app_context() else None
+
+    def run(call):
+        function, *args = call
+        _fanout_local.active = True
+        try:
+            if app is None:
+                return function(*args)
+            with app.app_context():
+                return function(*args)
+        finally:
+            _fanout_local.active = False
+
+    executor = get_fanout_executor()
+    futures = [executor.submit(run, call) for call in calls]
+    return [future.result() for future in futures]
+
+
+def _record_metric(**changes):
+    with _horizons_metrics_lock:
+        for name, value in changes.items():
+            if name == "last_error":
+                _horizons_metrics[name] = value
+            elif name == "max_latency_ms":
+                _horizons_metrics[name] = max(_horizons_metrics[name], value)
+            else:
+                _horizons_metrics[name] += value
+
+
+def get_horizons_metrics():
+    """
+    현재 프로세스의 Horizons 호출 지표를 반환하는 함수
+
+    Returns:
+        dict: 진행 중/성공/실패/재시도/타임아웃/거절 건수와 평균·최대 지연 시간(ms)
+    """
+    with _horizons_metrics_lock:
+        metrics = dict(_horizons_metrics)
+    finished = metrics["succeeded"] + metrics["failed"]
+    metrics["avg_latency_ms"] = round(metrics["total_latency_ms"] / finished, 1) if finished else 0.0
+    metrics["total_latency_ms"] = round(metrics["total_latency_ms"], 1)
+    metrics["max_latency_ms"] = round(metrics["max_latency_ms"], 1)
+    metrics["max_concurrency"] = HORIZONS_MAX_CONCURRENCY
+    metrics["fanout_workers"] = HORIZONS_FANOUT_WORKERS
+    return metrics
+
+
+def request_horizons(params):
+    """
+    Horizons API 응답을 반환하는 함수.
+    천체력 생성 요청은 디스크 캐시(요청 파라미터 해시 키)를 먼저 확인하고, 없을 때만 API를 호출해 성공 응답(오류 본문 제외)을 저장한다.
+
+    Args:
+        params (dict): Horizons API 쿼리 파라미터
+
+    Returns:
+        requests.Response 또는 dict: 응답 객체 또는 에러 메시지 (슬롯 대기 초과, 재시도 후에도 연결 실패 시)
+    """
+    cacheable = is_cacheable_request(params)
+    if cacheable:
+        cached = get_cached_horizons_response(params)
+        if cached is not None:
+            return build_cached_response(cached)
+
+    response = fetch_horizons(params)
+    if (cacheable and not isinstance(response, dict) and response.status_code == 200
+            and is_cacheable_response(response.text)):
+        store_horizons_response(params, response.status_code, response.headers.get('Content-Type'),
+                                response.url, response.text)
+    return response
+
+
+def build_cached_response(cached):
+    """
+    캐시된 응답을 호출부에서 그대로 쓸 수 있도록 requests.Response 객체로 만드는 함수
+
+    Args:
+        cached (dict): {"status_code", "content_type", "url", "body"}
+
+    Returns:
+        requests.Response: 응답 객체
+    """
+    response = requests.Response()
+    response.status_code = cached["status_code"]
+    response.url = cached["url"]
+    response.encoding = 'utf-8'
+    response._content = cached["body"].encode('utf-8')
+    if cached.get("content_type"):
+        response.headers['Content-Type'] = cached["content_type"]
+    return response
+
+
+def fetch_horizons(params):
+    """
+    공유 세션으로 Horizons API를 호출하는 함수.
+    동시 호출 수를 세마포어로 제한하고, 연결 오류/타임아웃/일시적 오류 응답은 지터를 준 지수 백오프로 재시도한다.
+
+    Args:
+        params (dict): Horizons API 쿼리 파라미터
+
+    Returns:
+        requests.Response 또는 dict: 응답 객체 또는 에러 메시지 (슬롯 대기 초과, 재시도 후에도 연결 실패 시)
+    """
+    if not _horizons_semaphore.acquire(timeout=HORIZONS_ACQUIRE_TIMEOUT):
+        _record_metric(rejected=1, last_error="concurrency limit reached")
+        logger.warning("Horizons API concurrency limit reached; request rejected.")
+        return {"error": "Horizons API is busy. Please try again later."}
+
+    _record_metric(in_flight=1, calls=1)
+    started = time.perf_counter()
+    response = None
+    error_message = None
+    try:
+        session = get_horizons_session()
+        for attempt in range(HORIZONS_MAX_RETRIES + 1):
+            if attempt:
+                _record_metric(retries=1)
+                time.sleep(random.uniform(0, HORIZONS_RETRY_BACKOFF * (2 ** (attempt - 1))))
+            try:
+                response = session.get(HORIZONS_API_URL, params=params,
+                                       timeout=(HORIZONS_CONNECT_TIMEOUT, HORIZONS_READ_TIMEOUT))
+                error_message = None
+            except requests.Timeout as e:
+                _record_metric(timeouts=1)
+                response, error_message = None, f"Horizons API request timed out: {e}"
+                logger.warning(error_message)
+                continue
+            except requests.RequestException as e:
+                response, error_message = None, f"Horizons API request failed: {e}"
+                logger.warning(error_message)
+                continue
+
+            logger.debug(f"Request Horizons URL: {response.url}")
+            logger.debug(f"Response Status Code: {response.status_code}")
+            if response.status_code not in HORIZONS_RETRY_STATUS_CODES:
+                break
+    finally:
+        latency_ms = (time.perf_counter() - started) * 1000
+        _horizons_semaphore.release()
+        succeeded = response is not None and response.status_code == 200
+        if not succeeded and response is not None:
+            error_message = f"Horizons API status code: {response.status_code}"
+        _record_metric(in_flight=-1, succeeded=int(succeeded), failed=int(not succeeded),
+                       total_latency_ms=latency_ms, max_latency_ms=latency_ms)
+        if error_message:
+            _record_metric(last_error=error_message)
 
-    url = "https://ssd.jpl.nasa.gov/api/horizons.api"
+    if response is None:
+        return {"error": f"Failed to retrieve data from Horizons API. {error_message}"}
+    return response
+
+
+def fetch_comet_record_number(comet_code):
+    """
+    Horizons 텍스트 조회로 혜성 고유 번호의 최신 궤도 레코드 번호를 가져오는 함수
+
+    Args:
+        comet_code (str): 혜성 고유 번호 (예: 1P)
+
+    Returns:
+        dict: {"designation", "record_number", "epoch_year"} 또는 에러 메시지
+    """
     params = {
         "format": "text",  # 텍스트 형식으로 요청
         "COMMAND": f"'{comet_code}'",
         "OBJ_DATA": "NO"
     }
 
-    response = requests.get(url, params=params)
-    print(f"Request record-Num URL: {response.url}")
-    print(f"Response Status Code: {response.status_code}")
+    response = request_horizons(params)
+    if isinstance(response, dict):
+        return response
 
     if response.status_code == 200:
         try:
@@ -46,17 +314,137 @@ def get_comet_record_number(comet_name):
                         continue
 
             if latest_record:
-                print(f"Extracted Latest Record Number: {latest_record}")
-                return latest_record
+                logger.debug(f"Extracted Latest Record Number: {latest_record}")
+                return {"designation": comet_code, "record_number": latest_record, "epoch_year": latest_year}
             else:
                 return {"error": "Failed to extract the latest record number."}
         except Exception as e:
-            print(f"Parsing error: {e}")
+            logger.warning(f"Parsing error: {e}")
             return {"error": "Failed to parse response from Horizons API."}
     else:
         return {"error": f"Failed to retrieve data from Horizons API. Status code: {response.status_code}"}
 
 
+def get_comet_record_number(comet_name):
+    """
+    혜성의 최신 궤도 레코드 번호를 반환하는 함수.
+    프로세스 내 맵과 DB에 저장된 값을 우선 사용하고, 없을 때만 Horizons를 조회해 저장한다.
+
+    Args:
+        comet_name (str): 혜성 이름
+
+    Returns:
+        str 또는 dict: 레코드 번호 또는 에러 메시지
+    """
+    comet_code = COMET_CODES.get(comet_name)
+    if not comet_code:
+        return {"error": "Invalid comet name."}
+
+    record_number = get_stored_comet_record_number(comet_code)
+    if record_number:
+        return record_number
+
+    record = fetch_comet_record_number(comet_code)
+    if "error" in record:
+        return record
+
+    store_comet_record_numbers([record])
+    return record["record_number"]
+
+
+def refresh_comet_record_numbers():
+    """
+    모든 혜성의 레코드 번호를 Horizons에서 다시 조회해 저장하는 함수 (새 궤도 해가 추가된 경우 반영)
+    """
+    records = []
+    for comet_name, comet_code in COMET_CODES.items():
+        record = fetch_comet_record_number(comet_code)
+        if "error" in record:
+            logger.warning(f"Failed to refresh record number for {comet_name}: {record['error']}")
+            continue
+        records.append(record)
+
+    store_comet_record_numbers(records)
+    logger.info(f"Refreshed {len(records)} comet record numbers.")
+
+
+# 스케줄러 설정 - 매주 월요일 새벽 3시에 혜성 레코드 번호 갱신
+scheduler = BackgroundScheduler()
+scheduler.add_job(refresh_comet_record_numbers, 'cron', day_of_week='mon', hour='3', minute='0')
+scheduler.start()
+
+# 앱이 종료될 때 스케줄러도 같이 종료되도록 설정
+atexit.register(lambda: scheduler.shutdown())
+
+
+def get_comet_elements_from_horizons(comet_name, epoch):
+    """
+    Horizons ELEMENTS 요청으로 혜성의 태양 중심 접촉 궤도 요소(황도 J2000, AU/일)를 가져오는 함수
+
+    Args:
+        comet_name (str): 혜성 이름
+        epoch (datetime): 궤도 요소 기준 날짜
+
+    Returns:
+        dict: {"designation", "record_number", "epoch_jd", "eccentricity", "perihelion_distance_au",
+               "inclination_degrees", "longitude_of_ascending_node_degrees", "argument_of_perihelion_degrees",
+               "perihelion_time_jd"} 또는 에러 메시지
+    """
+    record_number = get_comet_record_number(comet_name)
+    if isinstance(record_number, dict) and "error" in record_number:
+        return record_number
+
+    params = {
+        "format": "json",
+        "COMMAND": f"'{record_number}'",
+        "CENTER": "'500@10'",  # 태양 중심
+        "MAKE_EPHEM": "YES",
+        "EPHEM_TYPE": "ELEMENTS",
+        "OBJ_DATA": "NO",
+        "REF_PLANE": "ECLIPTIC",
+        "REF_SYSTEM": "J2000",
+        "OUT_UNITS": "AU-D",
+        "START_TIME": f"'{epoch.strftime('%Y-%m-%d')}'",
+        "STOP_TIME": f"'{(epoch + timedelta(days=1)).strftime('%Y-%m-%d')}'",
+        "STEP_SIZE": "'1 d'"
+    }
+
+    response = request_horizons(params)
+    if isinstance(response, dict):
+        return response
+    if response.status_code != 200:
+        return {"error": f"Failed to retrieve data from Horizons API. Status code: {response.status_code}"}
+
+    try:
+        result = response.json().get('result', '')
+    except ValueError as e:
+        logger.warning(f"JSON parsing error: {e}")
+        return {"error": "Failed to parse JSON response from Horizons API."}
+
+    if "$$SOE" not in result:
+        return {"error": "Unexpected response format from Horizons API."}
+
+    # 첫 번째 기준 시각의 궤도 요소만 사용
+    first_block = result.split("$$SOE", 1)[1].split("$$EOE", 1)[0].strip().split(" = A.D.", 1)
+    try:
+        epoch_jd = float(first_block[0].split()[-1])
+        elements = {name: float(value) for name, value in ELEMENT_PATTERN.findall(first_block[1])}
+        return {
+            "designation": COMET_CODES[comet_name],
+            "record_number": record_number,
+            "epoch_jd": epoch_jd,
+            "eccentricity": elements["EC"],
+            "perihelion_distance_au": elements["QR"],
+            "inclination_degrees": elements["IN"],
+            "longitude_of_ascending_node_degrees": elements["OM"],
+            "argument_of_perihelion_degrees": elements["W"],
+            "perihelion_time_jd": elements["Tp"]
+        }
+    except (IndexError, KeyError, ValueError) as e:
+        logger.warning(f"Failed to parse Horizons elements for {comet_name}: {e}")
+        return {"error": "Failed to parse orbital elements from Horizons API."}
+
+
 def get_comet_approach_events(comet_name, date, range_days):
     record_number = get_comet_record_number(comet_name)
     if isinstance(record_number, dict) and "error" in record_number:
@@ -70,7 +458,6 @@ def get_comet_approach_events(comet_name, date, range_days):
     else:
         end_date = date + timedelta(days=range_days)
 
-    url = "https://ssd.jpl.nasa.gov/api/horizons.api"
     params = {
         "format": "json",
         "COMMAND": f"'{record_number}'",
@@ -81,55 +468,42 @@ def get_comet_approach_events(comet_name, date, range_days):
         "START_TIME": f"'{date.strftime('%Y-%m-%d')}'",
         "STOP_TIME": f"'{end_date.strftime('%Y-%m-%d')}'",
         "STEP_SIZE": "'1 d'",
-        "QUANTITIES": "'1,2,19,20,23,25'"  # 필요한 데이터만 요청 (시간, 태양 거리, 궤도 요소, 적경/적위, 속도)
+        "QUANTITIES": HORIZONS_LAYOUTS['comet']['quantities']  # 필요한 데이터만 요청 (시간, 적경/적위, 태양/지구 거리, 각도)
     }
 
-    response = requests.get(url, params=params)
-    print(f"Request Comet URL: {response.url}")
-    print(f"Response Status Code: {response.status_code}")
+    response = request_horizons(params)
+    if isinstance(response, dict):
+        return response
 
     if response.status_code == 200:
         try:
             data = response.json()
             if 'result' in data:
-                result_lines = data['result'].splitlines()
-                parsed_data = []
-                extracting = False
-                for line in result_lines:
-                    if "$SOE" in line:
-                        extracting = True
-                        continue
-                    elif "$EOE" in line:
-                        extracting = False
-                        break
-                    if extracting:
-                        parsed_data.append(line)
-
-                parsed_dict = []
-                for entry in parsed_data:
-                    parts = entry.split()
-                    if len(parts) >= 11:  # Ensure there are enough parts to parse correctly
-                        parsed_dict.append({
-                            "comet_name": comet_name,
-                            "time": f"{parts[0]} {parts[1]}",  # TIME
-                            "ra": f"{parts[2]} {parts[3]} {parts[4]}",  # Right Ascension (RA)
-                            "dec": f"{parts[5]} {parts[6]} {parts[7]}",  # Declination (DEC)
-                            "delta": parts[14],  # Solar distance
-                            "deldot": parts[15],  # Radial velocity
-                            "s-o-t": parts[16]  # Sun-Observer-Target angle
-                        })
-                    else:
-                        print(f"Skipping line due to unexpected format: {entry}")
-
-                # print("Parsed Data:")
-                # for item in parsed_dict:
-                #      print(item)
-
-                return {"data": parsed_dict}
+                # API 응답에는 Horizons 원문 값을 그대로 쓰므로 원문 문자열도 함께 받음
+                columns = parse_horizons_ephemeris(data['result'], 'comet', keep_text=True)
+                text = columns.pop('text')
+                if columns['skipped']:
+                    logger.warning(f"Skipped {columns['skipped']} Horizons rows with unexpected format for {comet_name}.")
+
+                parsed_dict = [
+                    {
+                        "comet_name": comet_name,
+                        "time": time_text,  # TIME
+                        "ra": ra,  # Right Ascension (RA)
+                        "dec": dec,  # Declination (DEC)
+                        "delta": delta,  # Earth distance
+                        "deldot": deldot,  # Radial velocity relative to Earth
+                        "s-o-t": sot  # Sun-Observer-Target angle
+                    }
+                    for time_text, ra, dec, delta, deldot, sot
+                    in zip(text['time'], text['ra'], text['dec'], text['delta'], text['deldot'], text['s-o-t'])
+                ]
+
+                return {"data": parsed_dict, "columns": columns}
             else:
                 return {"error": "Unexpected response format from Horizons API."}
         except ValueError as e:
-            print(f"JSON parsing error: {e}")
+            logger.warning(f"JSON parsing error: {e}")
             return {"error": "Failed to parse JSON response from Horizons API."}
     else:
         return {"error": f"Failed to retrieve data from Horizons API. Status code: {response.status_code}"}
@@ -139,13 +513,8 @@ def get_planet_position_from_horizons(planet_name, date, range_days):
     planet_code = PLANET_CODES.get(planet_name)
     if not planet_code:
         return {"error": "Invalid planet name."}
-    # 요청 유형에 따른 처리
-    if planet_name in PLANET_CODES:
-        request_type = "planet"
-    else:
-        request_type = "comet"
 
-    print(f"planet_code: {planet_code}")
+    logger.debug(f"planet_code: {planet_code}")
     # 포맷 전 로그
     # print(f"Formatted Date Before: {date}")
 
@@ -161,7 +530,6 @@ def get_planet_position_from_horizons(planet_name, date, range_days):
     else:
         end_date = date + timedelta(days=range_days)
 
-    url = "https://ssd.jpl.nasa.gov/api/horizons.api"
     params = {
         "format": "json",
         "COMMAND": f"'{planet_code}'",
@@ -172,53 +540,34 @@ def get_planet_position_from_horizons(planet_name, date, range_days):
         "START_TIME": f"'{date.strftime('%Y-%m-%d')}'",
         "STOP_TIME": f"'{end_date.strftime('%Y-%m-%d')}'",
         "STEP_SIZE": "'1 d'",
-        "QUANTITIES": "'1,20,23'"  # 필요한 데이터만 요청 (시간, 적경/적위, 태양 거리)
+        "QUANTITIES": HORIZONS_LAYOUTS['planet']['quantities']  # 필요한 데이터만 요청 (시간, 적경/적위, 지구 거리, 각도)
     }
 
     # 포맷 후 로그
     # print(f"Formatted Parameters: {params}")
 
-    response = requests.get(url, params=params)
-    print(f"Request URL: {response.url}")  # 요청 URL 로그
-    print(f"Response Status Code: {response.status_code}")  # 응답 상태 코드 로그
+    response = request_horizons(params)
+    if isinstance(response, dict):
+        return response
 
     if response.status_code == 200:
         try:
             data = response.json()
             # print(f"Response Data: {data}")  # 응답 데이터 로그
             if 'result' in data:
-                # 파싱 로직 추가
-                result_lines = data['result'].splitlines()
-                parsed_data = []
-                extracting = False
-                for line in result_lines:
-                    if "$SOE" in line:
-                        extracting = True
-                        continue
-                    elif "$EOE" in line:
-                        extracting = False
-                        break
-                    if extracting:
-                        parsed_data.append(line)
-                # print(f"Parsed Data: {parsed_data}")  # 파싱된 데이터 로그
-
-                # 파싱된 데이터를 딕셔너리 형태로 변환
-                parsed_dict = []
-                for entry in parsed_data:
-                    parts = entry.split()
-                    parsed_dict.append({
-                        "time": f"{parts[0]} {parts[1]}",
-                        "ra": f"{parts[2]} {parts[3]} {parts[4]}",
-                        "dec": f"{parts[5]} {parts[6]} {parts[7]}",
-                        "delta": parts[8],
-                        "s-o-t": parts[10]
-                    })
-                # print(f"Parsed Dictionary: {parsed_dict}")  # 딕셔너리 형태의 파싱 데이터 로그
-                return {"data": parsed_dict}
+                columns = parse_horizons_ephemeris(data['result'], 'planet')
+                if columns['skipped']:
+                    logger.warning(f"Skipped {columns['skipped']} Horizons rows with unexpected format for {planet_name}.")
+                return {"columns": columns}
             else:
                 return {"error": "Unexpected response format from Horizons API."}
         except ValueError as e:
-            print(f"JSON parsing error: {e}")  # JSON 파싱 에러 로그
+            logger.warning(f"JSON parsing error: {e}")  # JSON 파싱 에러 로그
             return {"error": "Failed to parse JSON response from Horizons API."}
     else:
         return {"error": f"Failed to retrieve data from Horizons API. Status code: {response.status_code}"}
+
+
+__all__ = ['get_comet_record_number', 'fetch_comet_record_number', 'refresh_comet_record_numbers',
+           'get_comet_approach_events', 'get_comet_elements_from_horizons', 'get_planet_position_from_horizons',
+           'request_horizons', 'fetch_horizons', 'get_horizons_session', 'get_horizons_metrics', 'fetch_concurrently']
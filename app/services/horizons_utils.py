@@ -0,0 +1,128 @@
+# services/horizons_utils.py
+
+from operator import itemgetter
+
+import numpy as np
+
+# Horizons 시각 문자열의 월 이름 → 월 번호 (예: "2024-Oct-01 00:00"의 "Oct" → "10")
+HORIZONS_MONTH_NUMBERS = {name: f"{number:02d}" for number, name in enumerate(
+    ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"], start=1)}
+
+# 호출부별 QUANTITIES와 ephemeris 행의 토큰 배치 {필드: (시작 토큰 위치, 형식)}
+# 형식: "hours" (시 분 초 → 시), "degrees" (±도 분 초 → 도), "float" (실수, "n.a."는 NaN)
+HORIZONS_LAYOUTS = {
+    # 시각(2), 천문 적경/적위(6), 겉보기 적경/적위(6), r/rdot(2), delta/deldot(2), S-O-T
+    "comet": {
+        "quantities": "'1,2,19,20,23,25'",
+        "min_tokens": 19,
+        "fields": {"ra": (2, "hours"), "dec": (5, "degrees"), "delta": (16, "float"), "deldot": (17, "float"),
+                   "s-o-t": (18, "float")}
+    },
+    # 시각(2), 천문 적경/적위(6), delta/deldot(2), S-O-T
+    "planet": {
+        "quantities": "'1,20,23'",
+        "min_tokens": 11,
+        "fields": {"ra": (2, "hours"), "dec": (5, "degrees"), "delta": (8, "float"), "deldot": (9, "float"),
+                   "s-o-t": (10, "float")}
+    }
+}
+
+# 형식별 원문 토큰 수
+FIELD_WIDTHS = {"hours": 3, "degrees": 3, "float": 1}
+
+
+def _to_float(token):
+    try:
+        return float(token)
+    except ValueError:
+        return np.nan
+
+
+def parse_horizons_ephemeris(result, layout, keep_text=False):
+    """
+    Horizons 결과 문자열에서 $$SOE와 $$EOE 사이의 행만 한 번 훑어 미리 할당한 배열에 바로 채우는 함수.
+    전체 결과를 줄 리스트로 나누거나 문자열 딕셔너리 리스트를 만들지 않는다.
+
+    Args:
+        result (str): Horizons 응답의 result 문자열
+        layout (str): HORIZONS_LAYOUTS의 키 ("comet" 또는 "planet")
+        keep_text (bool): 각 필드의 원문 문자열도 함께 반환할지 여부 (API 응답에 원문 값을 그대로 쓰는 경우)
+
+    Returns:
+        dict: {"time": datetime64[m] 배열, 필드명: float64 배열, ..., "skipped": 형식이 맞지 않아 건너뛴 행 수}
+              keep_text가 True이면 "text": {"time": [...], 필드명: [...]}도 포함
+    """
+    spec = HORIZONS_LAYOUTS[layout]
+    fields = spec["fields"]
+    min_tokens = spec["min_tokens"]
+
+    # 필드별로 필요한 토큰 위치와 값 행렬에서의 열 범위
+    token_indices = []
+    field_columns = {}
+    for name, (index, kind) in fields.items():
+        field_columns[name] = (len(token_indices), FIELD_WIDTHS[kind], kind)
+        token_indices.extend(range(index, index + FIELD_WIDTHS[kind]))
+    pick_tokens = itemgetter(*token_indices)
+
+    start = result.find("$$SOE")
+    end = result.find("$$EOE", start) if start >= 0 else -1
+    if end < 0:
+        start = end = 0
+    else:
+        start = result.find("\n", start) + 1
+
+    # 표의 줄 수를 상한으로 미리 할당하고 마지막에 실제 행 수만큼 잘라냄
+    capacity = result.count("\n", start, end)
+    times = np.empty(capacity, dtype="U16")
+    values = np.empty((capacity, len(token_indices)))
+    raw_rows = [] if keep_text else None
+
+    count = 0
+    skipped = 0
+    position = start
+    while position < end:
+        line_end = result.find("\n", position, end)
+        if line_end < 0:
+            line_end = end
+        parts = result[position:line_end].split()
+        position = line_end + 1
+
+        if len(parts) < min_tokens:
+            if parts:
+                skipped += 1
+            continue
+
+        # "2024-Oct-01" "00:00" → "2024-10-01T00:00"
+        year, month, day = parts[0].split("-")
+        times[count] = f"{year}-{HORIZONS_MONTH_NUMBERS[month]}-{day}T{parts[1]}"
+        picked = pick_tokens(parts)
+        try:
+            values[count] = [float(token) for token in picked]
+        except ValueError:
+            values[count] = [_to_float(token) for token in picked]  # "n.a." 등은 NaN
+        if keep_text:
+            raw_rows.append((parts[0], parts[1], picked))
+        count += 1
+
+    values = values[:count]
+    parsed = {"time": times[:count].astype("datetime64[m]")}
+    for name, (column, width, kind) in field_columns.items():
+        if kind == "float":
+            parsed[name] = values[:, column].copy()
+        else:
+            # 부호는 첫 토큰의 부호 비트로 판단 ("-00"은 -0.0이므로 0도인 음수 적위도 처리됨)
+            sign = np.where(np.signbit(values[:, column]), -1.0, 1.0)
+            parsed[name] = sign * (np.abs(values[:, column]) + values[:, column + 1] / 60
+                                   + values[:, column + 2] / 3600)
+    parsed["skipped"] = skipped
+
+    if keep_text:
+        text = {"time": [f"{day} {clock}" for day, clock, _ in raw_rows]}
+        for name, (column, width, kind) in field_columns.items():
+            text[name] = [picked[column] if width == 1 else " ".join(picked[column:column + width])
+                          for _, _, picked in raw_rows]
+        parsed["text"] = text
+    return parsed
+
+
+__all__ = ['parse_horizons_ephemeris', 'HORIZONS_LAYOUTS', 'HORIZONS_MONTH_NUMBERS']
@@ -1,43 +1,112 @@
 # services/moon_phase_service.py
 
-import math
+import threading
+import numpy as np
 from skyfield import almanac
-from datetime import datetime
+from datetime import datetime, timedelta
 from app.global_resources import ts, planets  # 전역 리소스 사용
 
+# 월령 테이블 설정 (10년 단위로 한 번만 계산하여 메모리에 보관)
+LUNATION_TABLE_YEARS = 10
+LUNATION_GRID_STEP_DAYS = 0.25  # 위상 각도 보간용 샘플 간격 (6시간)
+LUNATION_TABLE_MARGIN_DAYS = 2  # 구간 경계 보간을 위한 여유 일 수
 
-def get_moon_phase(date):
+_lunation_tables = {}
+_lunation_lock = threading.Lock()
+
+
+def _build_lunation_table(decade_start):
     """
-    특정 날짜의 달의 위상을 계산하고 조명율을 계산하는 함수
+    10년 구간의 월령 테이블을 계산하는 함수
 
     Args:
-        date (datetime): 달의 위상을 계산할 날짜
+        decade_start (int): 구간 시작 연도 (10의 배수)
 
     Returns:
-        dict: 달의 위상 정보 (0 = 뉴문, 1 = 보름달)과 조명율(0 ~ 1).
+        dict: 보간용 시각(TT)과 위상 각도 배열
     """
-    # 하루 동안 여덟 개의 UTC 시간을 사용 (3시간 간격)
-    observation_times = [
-        ts.utc(date.year, date.month, date.day, 0),
-        ts.utc(date.year, date.month, date.day, 3),
-        ts.utc(date.year, date.month, date.day, 6),
-        ts.utc(date.year, date.month, date.day, 9),
-        ts.utc(date.year, date.month, date.day, 12),
-        ts.utc(date.year, date.month, date.day, 15),
-        ts.utc(date.year, date.month, date.day, 18),
-        ts.utc(date.year, date.month, date.day, 21)
-    ]
+    t0 = ts.utc(decade_start, 1, 1 - LUNATION_TABLE_MARGIN_DAYS)
+    t1 = ts.utc(decade_start + LUNATION_TABLE_YEARS, 1, 1 + LUNATION_TABLE_MARGIN_DAYS)
+
+    # 6시간 간격 위상 각도를 한 번에 계산한 뒤 연속 각도로 펼쳐서 저장
+    grid_times = ts.tt_jd(np.arange(t0.tt, t1.tt + LUNATION_GRID_STEP_DAYS, LUNATION_GRID_STEP_DAYS))
+    grid_degrees = np.degrees(np.unwrap(almanac.moon_phase(planets, grid_times).radians))
 
-    # 여덟 시점 각각의 위상 각도와 조명률 계산
-    phase_angles = [almanac.moon_phase(planets, t) for t in observation_times]
-    illuminations = [(1 + math.cos(angle.radians)) / 2 for angle in phase_angles]
+    return {
+        "decade_start": decade_start,
+        "grid_tt": grid_times.tt,
+        "grid_degrees": grid_degrees
+    }
+
+
+def get_lunation_table(year):
+    """
+    주어진 연도가 속한 10년 구간의 월령 테이블을 반환하는 함수 (최초 요청 시 한 번만 계산)
+
+    Args:
+        year (int): 연도
+
+    Returns:
+        dict: 월령 테이블
+    """
+    decade_start = year // LUNATION_TABLE_YEARS * LUNATION_TABLE_YEARS
+    table = _lunation_tables.get(decade_start)
+    if table is None:
+        with _lunation_lock:
+            table = _lunation_tables.get(decade_start)
+            if table is None:
+                table = _build_lunation_table(decade_start)
+                _lunation_tables[decade_start] = table
+    return table
+
+
+def interpolate_moon_phase_degrees(times):
+    """
+    월령 테이블에서 보간하여 위상 각도를 계산하는 함수
+
+    Args:
+        times (Time): Skyfield Time 객체 (단일 또는 배열)
+
+    Returns:
+        numpy.ndarray: 위상 각도 (0 ~ 360)
+    """
+    tt = np.atleast_1d(times.tt)
+    years = np.atleast_1d(times.utc.year)
+    degrees = np.empty(len(tt))
+
+    # 10년 구간별로 나누어 보간
+    decades = years // LUNATION_TABLE_YEARS * LUNATION_TABLE_YEARS
+    for decade_start in np.unique(decades):
+        table = get_lunation_table(int(decade_start))
+        mask = decades == decade_start
+        degrees[mask] = np.interp(tt[mask], table["grid_tt"], table["grid_degrees"])
+
+    return np.mod(degrees, 360.0)
+
+
+# 하루 동안 사용하는 여덟 개의 UTC 관측 시각 (3시간 간격)
+OBSERVATION_HOURS = [0, 3, 6, 9, 12, 15, 18, 21]
+
+
+def summarize_moon_phase(date, phase_degrees):
+    """
+    하루 동안의 위상 각도 샘플로 달의 위상과 조명율을 요약하는 함수
+
+    Args:
+        date (datetime): 날짜
+        phase_degrees (numpy.ndarray): 관측 시각별 위상 각도 (0 ~ 360)
+
+    Returns:
+        dict: 달의 위상 정보 (0 = 뉴문, 1 = 보름달)과 조명율(0 ~ 1).
+    """
+    illuminations = (1 + np.cos(np.radians(phase_degrees))) / 2
 
     # 조명율 평균 계산
-    illumination_average = sum(illuminations) / len(illuminations)
+    illumination_average = float(np.mean(illuminations))
     illumination = 1 - illumination_average
 
     # moon_phase를 여덟 시점의 평균 위상 각도로 계산
-    phase_angle_average = sum(angle.degrees for angle in phase_angles) / len(phase_angles)
+    phase_angle_average = float(np.mean(phase_degrees))
     if phase_angle_average < 0:
         phase_angle_average += 360
     moon_phase = phase_angle_average / 360.0
@@ -50,6 +119,47 @@ def get_moon_phase(date):
     }
 
 
+def get_moon_phase(date):
+    """
+    특정 날짜의 달의 위상을 계산하고 조명율을 계산하는 함수
+
+    Args:
+        date (datetime): 달의 위상을 계산할 날짜
+
+    Returns:
+        dict: 달의 위상 정보 (0 = 뉴문, 1 = 보름달)과 조명율(0 ~ 1).
+    """
+    # 날짜 범위 계산과 같은 경로를 사용해 두 모드의 결과를 일치시킴
+    return get_moon_phase_for_range(date, date)[0]
+
+
+def get_moon_phase_for_range(start_date, end_date):
+    """
+    날짜 범위의 달의 위상을 월령 테이블에서 한 번에(벡터화) 보간하여 구하는 함수
+
+    Args:
+        start_date (datetime): 시작 날짜
+        end_date (datetime): 종료 날짜
+
+    Returns:
+        list: 날짜별 달의 위상 정보 리스트 (단일 날짜 결과와 동일한 형식)
+    """
+    num_days = (end_date.date() - start_date.date()).days + 1
+    samples_per_day = len(OBSERVATION_HOURS)
+
+    # 모든 날짜의 관측 시각을 하나의 Time 배열로 생성
+    hours = np.arange(num_days)[:, None] * 24 + np.array(OBSERVATION_HOURS)[None, :]
+    observation_times = ts.utc(start_date.year, start_date.month, start_date.day, hours.ravel())
+
+    # 전체 시각에 대해 위상 각도를 한 번에 보간
+    phase_degrees = interpolate_moon_phase_degrees(observation_times).reshape(num_days, samples_per_day)
+
+    return [
+        summarize_moon_phase(start_date + timedelta(days=i), phase_degrees[i])
+        for i in range(num_days)
+    ]
+
+
 def get_phase_description(moon_phase, phase_angle_degrees, illumination):
     """
     달의 위상에 따라 설명을 제공하는 함수
@@ -107,4 +217,23 @@ def get_moon_phase_for_date(date):
         return {"error": f"Failed to calculate moon phase: {str(e)}"}
 
 
-__all__ = ['get_moon_phase', 'get_phase_description', 'get_moon_phase_for_date']
+def get_moon_phase_for_date_range(start_date, end_date):
+    """
+    날짜 범위에 대한 달의 위상을 계산하는 함수
+
+    Args:
+        start_date (datetime): 시작 날짜
+        end_date (datetime): 종료 날짜
+
+    Returns:
+        list: 날짜별 달의 위상 정보 리스트 또는 오류 메시지
+    """
+    try:
+        return get_moon_phase_for_range(start_date, end_date)
+
+    except Exception as e:
+        return {"error": f"Failed to calculate moon phase: {str(e)}"}
+
+
+__all__ = ['get_moon_phase', 'get_phase_description', 'get_moon_phase_for_date', 'get_lunation_table',
+           'interpolate_moon_phase_degrees', 'summarize_moon_phase', 'get_moon_phase_for_range', 'get_moon_phase_for_date_range']
@@ -0,0 +1,90 @@
+# services/planet/planet_ephemeris_service.py
+
+from sqlalchemy import select, bindparam, extract
+from app.models.planet_raw_data import PlanetEphemeris
+from app.models.opposition_event import OppositionEvent
+from app.db.db_utils import retry_execute
+
+# 조회 경로에서 재사용하는 Core select 문 (모듈 로드 시 한 번만 구성, 요청마다 ORM 매핑 없음)
+_ephemeris = PlanetEphemeris.__table__
+
+EPHEMERIS_RANGE_SELECT = select(
+    _ephemeris.c.planet_name, _ephemeris.c.reg_date, _ephemeris.c.distance, _ephemeris.c.s_o_t
+).where(
+    _ephemeris.c.planet_name == bindparam('planet_name'),
+    _ephemeris.c.reg_date.between(bindparam('start_date'), bindparam('end_date'))
+).order_by(_ephemeris.c.reg_date.asc())
+
+_events = OppositionEvent.__table__
+
+PLANET_EVENTS_SELECT = select(
+    _events.c.planet_name, _events.c.event_date, _events.c.event_type, _events.c.event_time,
+    _events.c.distance, _events.c.s_o_t
+).where(
+    _events.c.planet_name == bindparam('planet_name'),
+    _events.c.event_date.between(bindparam('start_date'), bindparam('end_date'))
+).order_by(_events.c.event_time.asc())
+
+# 원시 데이터 / 이벤트 인덱스가 있는 연도 목록
+EPHEMERIS_YEARS_SELECT = select(extract('year', _ephemeris.c.reg_date)).distinct()
+EVENT_YEARS_SELECT = select(extract('year', _events.c.event_date)).distinct()
+
+
+def get_planet_ephemeris_rows(session, planet_name, start_date, end_date):
+    """
+    특정 행성의 날짜 범위 원시 데이터를 한 번의 인덱스 범위 조회로 가져오는 함수.
+    연도 경계를 넘는 범위도 하나의 쿼리로 처리한다.
+
+    Args:
+        session: SQLAlchemy 세션
+        planet_name (str): 행성 이름
+        start_date (date): 시작 날짜
+        end_date (date): 종료 날짜 (포함)
+
+    Returns:
+        list: 날짜 오름차순 Row 리스트 (planet_name, reg_date, distance, s_o_t) 또는 None (재시도 실패 시)
+    """
+    return retry_execute(session, EPHEMERIS_RANGE_SELECT, {
+        "planet_name": planet_name, "start_date": start_date, "end_date": end_date
+    })
+
+
+def get_planet_event_rows(session, planet_name, start_date, end_date):
+    """
+    opposition_events 인덱스에서 날짜 범위의 행성 이벤트를 기본 키 범위 조회로 가져오는 함수
+
+    Args:
+        session: SQLAlchemy 세션
+        planet_name (str): 행성 이름
+        start_date (date): 시작 날짜
+        end_date (date): 종료 날짜 (포함)
+
+    Returns:
+        list: 시각 오름차순 Row 리스트
+              (planet_name, event_date, event_type, event_time, distance, s_o_t) 또는 None (재시도 실패 시)
+    """
+    return retry_execute(session, PLANET_EVENTS_SELECT, {
+        "planet_name": planet_name, "start_date": start_date, "end_date": end_date
+    })
+
+
+def get_unindexed_event_years(session):
+    """
+    planet_ephemeris에 원시 데이터가 있지만 opposition_events 인덱스에 이벤트가 하나도 없는 연도를 찾는 함수
+    (인덱스 테이블 추가 이전에 적재된 연도)
+
+    Args:
+        session: SQLAlchemy 세션
+
+    Returns:
+        list: 연도 오름차순 리스트 또는 None (재시도 실패 시)
+    """
+    ephemeris_years = retry_execute(session, EPHEMERIS_YEARS_SELECT)
+    event_years = retry_execute(session, EVENT_YEARS_SELECT)
+    if ephemeris_years is None or event_years is None:
+        return None
+    return sorted({int(row[0]) for row in ephemeris_years} - {int(row[0]) for row in event_years})
+
+
+__all__ = ['get_planet_ephemeris_rows', 'get_planet_event_rows', 'get_unindexed_event_years', 'EPHEMERIS_RANGE_SELECT',
+           'PLANET_EVENTS_SELECT']
@@ -1,101 +1,352 @@
 # services/planet/planet_event_storage_service.py
 
-from datetime import datetime
+import os
+from datetime import datetime, date, timedelta
 from apscheduler.schedulers.background import BackgroundScheduler
 import logging
+import numpy as np
+from app.global_resources import ts, planets, earth, sun  # 전역 리소스 임포트
+from app.data.data import get_skyfield_planet_code
 from app.services.horizons_service import get_planet_position_from_horizons
-from app.models.planet_raw_data import get_planet_raw_data_model
-from sqlalchemy import Table, Column, Integer, String, Float, Date, MetaData, inspect
-from app.db.db_utils import get_session
+from skyfield.searchlib import find_minima, find_maxima
+from app.models.planet_raw_data import PlanetEphemeris
+from app.models.opposition_event import OppositionEvent
+from app.services.timezone_conversion_service import round_seconds
+from sqlalchemy import text
+from app.db.db_utils import get_session, bulk_upsert
+from app.services.planets.planet_ephemeris_service import get_unindexed_event_years
 
 # 로깅 설정
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# 원시 데이터 계산 방식: "ephemeris" (로컬 de440, 기본값) 또는 "horizons" (JPL Horizons API)
+PLANET_RAW_DATA_SOURCE = os.getenv('PLANET_RAW_DATA_SOURCE', 'ephemeris').lower()
 
-def create_yearly_table(year):
+RAW_DATA_PLANETS = ["Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"]
+
+# 지구 궤도 안쪽 행성 (각도 최대 = 최대 이각, 그 외 행성은 충)
+INNER_PLANETS = ["Mercury", "Venus"]
+
+# 연도 경계의 이벤트를 놓치지 않도록 탐색 구간 앞뒤로 더하는 여유 일수
+EVENT_SEARCH_MARGIN_DAYS = 3
+
+# 원시 데이터 재계산 요청 한 번에 허용하는 최대 연도 수
+RAW_DATA_MAX_YEARS = 50
+
+
+def get_raw_data_year_range():
     """
-    특정 연도의 테이블을 생성하는 함수
+    로컬 천체력이 온전히 포함하는 연도 범위를 반환하는 함수.
+    이벤트 탐색 여유 일수를 고려해 천체력 시작/종료 연도는 제외한다.
+
+    Returns:
+        tuple: (첫 연도, 마지막 연도)
     """
-    table_name = f'planet_raw_data_{year}'
-    metadata = MetaData()
+    start_jd = max(segment.spk_segment.start_jd for segment in planets.segments)
+    end_jd = min(segment.spk_segment.end_jd for segment in planets.segments)
+    return ts.tt_jd(start_jd).utc.year + 1, ts.tt_jd(end_jd).utc.year - 1
 
-    # get_session을 사용하여 세션 바인딩
-    with get_session() as session:
-        engine = session.get_bind()  # 세션에 바인딩된 엔진 가져오기
-        inspector = inspect(engine)
 
-        if not inspector.has_table(table_name):
-            new_table = Table(
-                table_name,
-                metadata,
-                Column('id', Integer, primary_key=True, autoincrement=True),
-                Column('planet_name', String(50), nullable=False),
-                Column('reg_date', Date, nullable=False),
-                Column('distance', Float, nullable=False),
-                Column('s_o_t', Float, nullable=False)
-            )
-            metadata.create_all(engine)  # 엔진을 사용하여 테이블 생성
+def ensure_planet_ephemeris_table(session, years):
+    """
+    planet_ephemeris / opposition_events 테이블을 준비하는 함수.
+    테이블이 없으면 생성하고, MariaDB에서 연도별 파티션이 없는 연도는 pmax 파티션에서 분리한다.
+
+    Args:
+        session: SQLAlchemy 세션
+        years (list): 적재할 연도 목록
+    """
+    engine = session.get_bind()  # 세션에 바인딩된 엔진 가져오기
+    PlanetEphemeris.__table__.create(engine, checkfirst=True)
+    OppositionEvent.__table__.create(engine, checkfirst=True)
+
+    if engine.dialect.name not in ('mysql', 'mariadb'):
+        return
+
+    partitions = session.execute(text(
+        "SELECT PARTITION_NAME, PARTITION_DESCRIPTION FROM information_schema.PARTITIONS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'planet_ephemeris' AND PARTITION_NAME IS NOT NULL"
+    )).fetchall()
+    partition_names = {name for name, _ in partitions}
+    if 'pmax' not in partition_names:
+        return  # 파티션이 없는 테이블
+
+    # 현재 가장 큰 연도 경계 이후의 연도만 pmax에서 분리 가능
+    upper_bound = max(int(description) for _, description in partitions if description != 'MAXVALUE')
+    new_years = range(upper_bound, max(years) + 1)
+    if not new_years:
+        return
+
+    new_partitions = ', '.join(f'PARTITION p{year} VALUES LESS THAN ({year + 1})' for year in new_years)
+    session.execute(text(
+        f"ALTER TABLE planet_ephemeris REORGANIZE PARTITION pmax INTO "
+        f"({new_partitions}, PARTITION pmax VALUES LESS THAN MAXVALUE)"
+    ))
+
+
+def calculate_planet_raw_data(planet_name, year):
+    """
+    로컬 천체력(de440)을 사용해 특정 행성의 1년치 일별 원시 데이터를 계산하는 함수.
+    하루 간격의 Time 배열로 한 번에 계산한다 (Horizons QUANTITIES 20, 23과 동일한 값).
+
+    Args:
+        planet_name (str): 행성 이름
+        year (int): 계산할 연도
+
+    Returns:
+        dict: 컬럼별 배열 {"planet_name", "reg_date", "distance", "s_o_t"} 또는 에러 메시지
+    """
+    skyfield_planet_code = get_skyfield_planet_code(planet_name)
+    if not skyfield_planet_code:
+        return {"error": f"Invalid planet name for Skyfield: {planet_name}"}
+
+    target = planets[skyfield_planet_code]
+    year_start_date = date(year, 1, 1)
+    num_days = (date(year + 1, 1, 1) - year_start_date).days
+
+    # 매일 00:00 UTC 시점을 하나의 Time 배열로 구성
+    t = ts.utc(year, 1, 1 + np.arange(num_days))
+    observer = earth.at(t)
+
+    # 지구 중심 기준 행성까지의 거리 (광행차 보정, AU)
+    astrometric = observer.observe(target)
+    distance = astrometric.distance().au
+
+    # 태양-관측자-행성 각도 (도)
+    s_o_t = astrometric.apparent().separation_from(observer.observe(sun).apparent()).degrees
+
+    return {
+        "planet_name": planet_name,
+        "reg_date": [year_start_date + timedelta(days=i) for i in range(num_days)],
+        "distance": distance,
+        "s_o_t": s_o_t
+    }
+
+
+def detect_planet_events(planet_name, year):
+    """
+    로컬 천체력으로 특정 행성의 1년 동안의 이벤트 시각을 찾는 함수.
+    일별 샘플에서 지구-행성 거리의 극소(최근접)와 태양-관측자-행성 각도의 극대(충 또는 최대 이각)를 찾고
+    그 사이를 세밀하게 탐색해 실제 이벤트 시각을 구한다.
+
+    Args:
+        planet_name (str): 행성 이름
+        year (int): 탐색할 연도
+
+    Returns:
+        list: 이벤트 행 딕셔너리 리스트 또는 에러 메시지
+    """
+    skyfield_planet_code = get_skyfield_planet_code(planet_name)
+    if not skyfield_planet_code:
+        return {"error": f"Invalid planet name for Skyfield: {planet_name}"}
+
+    target = planets[skyfield_planet_code]
+
+    def distance_at(t):
+        return earth.at(t).observe(target).distance().au
+
+    def s_o_t_at(t):
+        observer = earth.at(t)
+        return observer.observe(target).apparent().separation_from(observer.observe(sun).apparent()).degrees
+
+    distance_at.step_days = 1.0
+    s_o_t_at.step_days = 1.0
+
+    t0 = ts.utc(year, 1, 1 - EVENT_SEARCH_MARGIN_DAYS)
+    t1 = ts.utc(year + 1, 1, 1 + EVENT_SEARCH_MARGIN_DAYS)
+    approach_times, _ = find_minima(t0, t1, distance_at)
+    elongation_times, _ = find_maxima(t0, t1, s_o_t_at)
+
+    elongation_type = "greatest_elongation" if planet_name in INNER_PLANETS else "opposition"
+    rows = []
+    for event_type, times in (("closest_approach", approach_times), (elongation_type, elongation_times)):
+        if not len(times):
+            continue
+
+        # 이벤트 시각의 거리와 각도를 한 번에 계산
+        distances = distance_at(times)
+        s_o_t_values = s_o_t_at(times)
+        for event_time, distance, s_o_t in zip(times.utc_datetime(), distances.tolist(), s_o_t_values.tolist()):
+            event_time = round_seconds(event_time.replace(tzinfo=None))
+            if event_time.year != year:
+                continue  # 여유 구간에서 찾은 이벤트는 해당 연도 적재 시 처리
+            rows.append({
+                "planet_name": planet_name,
+                "event_date": event_time.date(),
+                "event_type": event_type,
+                "event_time": event_time,
+                "distance": distance,
+                "s_o_t": s_o_t
+            })
+
+    return rows
 
 
-def update_raw_data():
+def fetch_planet_raw_data_from_horizons(planet_name, year):
     """
-    모든 행성에 대해 현재 연도와 다음 연도의 대접근 이벤트 데이터를 업데이트하는 함수
+    Horizons API를 사용해 특정 행성의 1년치 일별 원시 데이터를 가져오는 함수
+
+    Args:
+        planet_name (str): 행성 이름
+        year (int): 조회할 연도
+
+    Returns:
+        dict: 컬럼별 배열 {"planet_name", "reg_date", "distance", "s_o_t"} 또는 에러 메시지
+    """
+    year_start_date = datetime(year, 1, 1)
+    year_end_date = datetime(year, 12, 31)
+    planet_data = get_planet_position_from_horizons(
+        planet_name, year_start_date, (year_end_date - year_start_date).days
+    )
+
+    if 'error' in planet_data:
+        return planet_data
+
+    columns = planet_data.get('columns')
+    if not columns or not len(columns['time']):
+        return {"error": f"No valid data from Horizons API for {planet_name} in year {year}."}
+
+    return {
+        "planet_name": planet_name,
+        "reg_date": columns['time'].astype('datetime64[D]').tolist(),
+        "distance": columns['delta'],
+        "s_o_t": columns['s-o-t']
+    }
+
+
+def upsert_planet_raw_data(session, columns_list):
+    """
+    컬럼별 배열 형태의 원시 데이터를 planet_ephemeris 테이블에 일괄 upsert하는 함수.
+    (planet_name, reg_date)가 이미 있으면 거리와 각도만 갱신하므로 재실행해도 중복되지 않는다.
+
+    Args:
+        session: SQLAlchemy 세션
+        columns_list (list): 행성별 컬럼 배열 딕셔너리 리스트 {"planet_name", "reg_date", "distance", "s_o_t"}
+
+    Returns:
+        int: 처리한 행 수
+    """
+    rows = []
+    for columns in columns_list:
+        planet_name = columns["planet_name"]
+        rows.extend(
+            {"planet_name": planet_name, "reg_date": reg_date, "distance": distance, "s_o_t": s_o_t}
+            for reg_date, distance, s_o_t in zip(columns["reg_date"], columns["distance"].tolist(),
+                                                 columns["s_o_t"].tolist())
+        )
+
+    return bulk_upsert(session, PlanetEphemeris.__table__, rows, key_columns=['planet_name', 'reg_date'],
+                       update_columns=['distance', 's_o_t'])
+
+
+def upsert_planet_events(session, event_rows):
     """
-    planets = ["Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"]
-    current_year = datetime.now().year + 2
+    이벤트 행을 opposition_events 테이블에 일괄 upsert하는 함수
+
+    Args:
+        session: SQLAlchemy 세션
+        event_rows (list): detect_planet_events가 반환한 이벤트 행 리스트
+
+    Returns:
+        int: 처리한 행 수
+    """
+    return bulk_upsert(session, OppositionEvent.__table__, event_rows,
+                       key_columns=['planet_name', 'event_date', 'event_type'],
+                       update_columns=['event_time', 'distance', 's_o_t'])
+
+
+def update_raw_data(years=None):
+    """
+    모든 행성에 대해 지정한 연도들의 원시 데이터(거리, 태양-관측자-행성 각도)를 업데이트하는 함수
+
+    Args:
+        years (list, optional): 업데이트할 연도 목록. 기본값은 2년 후와 3년 후
+    """
+    if years is None:
+        current_year = datetime.now().year + 2
+        years = [current_year, current_year + 1]
 
     # get_session을 사용하여 세션 관리
     with get_session() as session:
         try:
-            for planet in planets:
-                # 모든 행성에 대해 현재 연도와 다음 연도의 대접근 이벤트를 업데이트
-                years_to_update = [current_year, current_year + 1]
+            # 테이블과 연도별 파티션 준비
+            ensure_planet_ephemeris_table(session, years)
 
-                for year in years_to_update:
-                    # 테이블이 없으면 생성
-                    create_yearly_table(year)
+            for year in years:
+                columns_list = []
+                event_rows = []
+                for planet in RAW_DATA_PLANETS:
                     logging.info(f"Updating raw data for {planet} for the year {year}")
 
-                    # Horizons API를 사용해 해당 연도의 데이터 가져오기
-                    year_start_date = datetime(year, 1, 1)
-                    year_end_date = datetime(year, 12, 31)
-                    planet_data = get_planet_position_from_horizons(
-                        planet, year_start_date, (year_end_date - year_start_date).days
-                    )
+                    if PLANET_RAW_DATA_SOURCE == 'horizons':
+                        columns = fetch_planet_raw_data_from_horizons(planet, year)
+                    else:
+                        columns = calculate_planet_raw_data(planet, year)
 
-                    if 'error' in planet_data:
-                        logging.error(
-                            f"Failed to retrieve planet data from Horizons API for {planet}: {planet_data['error']}")
+                    if 'error' in columns:
+                        logging.error(f"Failed to calculate raw data for {planet} in year {year}: {columns['error']}")
                         continue
 
-                    horizons_data = planet_data.get('data')
-                    if not horizons_data:
-                        logging.error(f"No valid data from Horizons API for {planet} in year {year}.")
+                    columns_list.append(columns)
+
+                    # 최근접 / 충 / 최대 이각 이벤트 인덱스
+                    events = detect_planet_events(planet, year)
+                    if 'error' in events:
+                        logging.error(f"Failed to detect events for {planet} in year {year}: {events['error']}")
                         continue
+                    event_rows.extend(events)
 
-                    # ORM 객체를 사용해 데이터를 삽입
-                    PlanetRawDataYear = get_planet_raw_data_model(year)
-                    for day_data in horizons_data:
-                        reg_date = datetime.strptime(day_data["time"], '%Y-%b-%d %H:%M')
+                # 연도 단위로 모든 행성의 데이터를 일괄 upsert 후 커밋
+                upsert_planet_raw_data(session, columns_list)
+                upsert_planet_events(session, event_rows)
+                session.commit()
 
-                        # ORM 객체를 사용해 데이터를 삽입
-                        new_data = PlanetRawDataYear(
-                            planet_name=planet,
-                            reg_date=reg_date,
-                            distance=float(day_data.get('delta')),
-                            s_o_t=float(day_data.get('s-o-t'))
-                        )
-                        session.add(new_data)
+        except Exception as e:
+            logging.error(f"Failed to update raw data: {e}")
+            session.rollback()  # 트랜잭션 복구
 
-                    # 변경사항 커밋
-                    session.commit()
+
+def backfill_planet_events():
+    """
+    원시 데이터는 있지만 opposition_events 인덱스가 비어 있는 연도의 이벤트를 채우는 함수.
+    인덱스 테이블 추가 이전에 적재된 연도(현재·과거 연도)를 위해 시작 시 한 번 실행하며, 이미 채워진 연도는 건너뛴다.
+    """
+    with get_session() as session:
+        try:
+            OppositionEvent.__table__.create(session.get_bind(), checkfirst=True)
+
+            years = get_unindexed_event_years(session)
+            if years is None:
+                logging.error("Failed to read years to backfill planet events.")
+                return
+
+            # 로컬 천체력 범위 밖의 연도는 이벤트를 계산할 수 없음
+            first_year, last_year = get_raw_data_year_range()
+            years = [year for year in years if first_year <= year <= last_year]
+
+            for year in years:
+                event_rows = []
+                for planet in RAW_DATA_PLANETS:
+                    events = detect_planet_events(planet, year)
+                    if 'error' in events:
+                        logging.error(f"Failed to detect events for {planet} in year {year}: {events['error']}")
+                        continue
+                    event_rows.extend(events)
+
+                # 연도 단위로 upsert 후 커밋 (중간에 실패해도 채운 연도는 유지)
+                upsert_planet_events(session, event_rows)
+                session.commit()
+
+            if years:
+                logging.info(f"Backfilled planet events for {len(years)} years ({years[0]}-{years[-1]}).")
 
         except Exception as e:
-            logging.error(f"Failed to update raw data: {e}")
+            logging.error(f"Failed to backfill planet events: {e}")
             session.rollback()  # 트랜잭션 복구
 
 
-# 스케줄링 설정
+# 스케줄링 설정 (매년 원시 데이터 갱신, 시작 시 한 번 이벤트 인덱스 채우기)
 scheduler = BackgroundScheduler()
 scheduler.add_job(update_raw_data, 'cron', month='1', day='1', hour='0', minute='0')
+scheduler.add_job(backfill_planet_events, 'date')
 scheduler.start()
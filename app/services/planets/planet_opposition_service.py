@@ -1,58 +1,73 @@
 # services/planet/planet_opposition_service.py
 
 import logging
+from datetime import date
 
 from app.data.data import get_opposition_au_threshold
-from app.models.planet_raw_data import get_planet_raw_data_model
-from app.db.db_utils import retry_query, get_session
+from app.services.planets.planet_ephemeris_service import get_planet_event_rows
+from app.db.db_utils import get_session
 from app import cache
 
 # 로깅 설정
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# 각도 극대 이벤트의 응답용 이름
+ELONGATION_EVENT_NAMES = {
+    "opposition": "planet opposition",
+    "greatest_elongation": "planet greatest elongation"
+}
+
 
 @cache.memoize(timeout=3600)
-def predict_opposition_events(planet_name, year, strict=False):
+def predict_opposition_events(planet_name, year, strict=False, years=1):
     """
-    특정 행성의 대접근 이벤트를 예측하는 함수
+    특정 행성의 대접근 이벤트를 예측하는 함수.
+    적재 시 계산해 둔 opposition_events 인덱스에서 실제 이벤트 시각을 조회한다.
+
+    Args:
+        planet_name (str): 행성 이름
+        year (int): 시작 연도
+        strict (bool): True이면 엄격한 거리 기준을 만족하는 최근접만 반환
+        years (int): 조회할 연도 수 (화성과 금성은 최소 2년)
+
+    Returns:
+        list: 이벤트 정보 리스트 또는 에러 메시지
     """
     events_list = []
 
-    # 연도의 시작과 끝 날짜 설정 (화성과 금성의 경우 2년치 데이터를 조회)
+    # 연도의 시작과 끝 날짜 설정 (화성과 금성의 경우 최소 2년치 데이터를 조회)
     if planet_name in ["Mars", "Venus"]:
-        years_to_query = [year, year + 1]
-    else:
-        years_to_query = [year]
+        years = max(years, 2)
 
     # `get_session` 사용
     with get_session() as session:
         try:
             threshold_strict = get_opposition_au_threshold(planet_name, strict=True)
-
-            # 각 연도별로 테이블에서 데이터를 조회
-            for query_year in years_to_query:
-                PlanetRawDataYear = get_planet_raw_data_model(query_year)
-
-                # 연도별 테이블에서 데이터 조회
-                query = session.query(PlanetRawDataYear).filter(
-                    PlanetRawDataYear.planet_name == planet_name,
-                    PlanetRawDataYear.distance <= get_opposition_au_threshold(planet_name, strict)
-                ).order_by(PlanetRawDataYear.distance.asc()).limit(5)
-
-                rows = retry_query(session, query)
-
-                for closest_event in rows:
-                    reg_date = closest_event.reg_date
-                    distance = closest_event.distance
-                    s_o_t = closest_event.s_o_t
-                    event_type = "planet big approach" if distance <= threshold_strict else "planet approach"
-                    events_list.append({
-                        "planet": planet_name,
-                        "closest_date": reg_date.strftime("%Y-%m-%d"),
-                        "distance_to_earth": f"{distance:.4f} AU",
-                        "sun_observer_target_angle": f"{s_o_t:.2f}°",
-                        "event_type": event_type
-                    })
+            threshold = get_opposition_au_threshold(planet_name, strict)
+
+            # 조회 기간 전체 이벤트를 한 번의 기본 키 범위 조회로 가져옴
+            rows = get_planet_event_rows(
+                session, planet_name, date(year, 1, 1), date(year + years - 1, 12, 31)
+            ) or []
+
+            for event in rows:
+                if event.event_type == "closest_approach":
+                    # 최근접은 거리 기준을 만족하는 경우에만 대접근으로 반환
+                    if threshold is not None and event.distance > threshold:
+                        continue
+                    is_big_approach = threshold_strict is not None and event.distance <= threshold_strict
+                    event_type = "planet big approach" if is_big_approach else "planet approach"
+                else:
+                    event_type = ELONGATION_EVENT_NAMES.get(event.event_type, event.event_type)
+
+                events_list.append({
+                    "planet": planet_name,
+                    "closest_date": event.event_date.strftime("%Y-%m-%d"),
+                    "event_time": event.event_time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "distance_to_earth": f"{event.distance:.4f} AU",
+                    "sun_observer_target_angle": f"{event.s_o_t:.2f}°",
+                    "event_type": event_type
+                })
 
             if not events_list:
                 return {"error": "No opposition events found for the requested year."}
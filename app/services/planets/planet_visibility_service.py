@@ -1,18 +1,59 @@
 # services/planet/planet_visibility_service.py
 
 from datetime import datetime, timedelta
+import numpy as np
 from skyfield import almanac
 from skyfield.api import Topos
-from app.global_resources import ts, planets  # 전역 리소스 임포트
+from app.global_resources import ts, planets, earth  # 전역 리소스 임포트
 from app.services.sunrise_sunset_service import calculate_sunrise_sunset_for_range  # 일출 및 일몰 계산 함수 import
 from app.services.timezone_conversion_service import convert_utc_to_local_time  # 시간 변환 함수 import
 from app.data.data import get_skyfield_planet_code
-from app.models.planet_raw_data import get_planet_raw_data_model
+from app.services.planets.planet_ephemeris_service import get_planet_ephemeris_rows
 from app.services.directions_utils import azimuth_to_direction
-from app.db.db_utils import retry_query, get_session  # get_session 추가
+from app.db.db_utils import get_session  # get_session 추가
 from app import cache
 
 
+def calculate_planet_visibility_for_dates(planet, location, reg_dates):
+    """
+    여러 날짜에 대한 행성의 첫 번째 떠오름 시각과 고도/방위각을 한 번에 계산하는 함수.
+    전체 기간에 대해 떠오름/짐 탐색을 한 번 수행하고, 각 날짜 00:00 UTC의 고도와 방위각을 한 번의 관측으로 계산한다.
+
+    Args:
+        planet: Skyfield 천체 객체
+        location (Topos): 관측 위치
+        reg_dates (list): 날짜 리스트 (오름차순)
+
+    Returns:
+        tuple: (고도 배열, 방위각 배열, 날짜별 첫 떠오름 UTC datetime 리스트 (없으면 None))
+    """
+    first_date = reg_dates[0]
+    last_date = reg_dates[-1]
+    day_offsets = np.array([(reg_date - first_date).days for reg_date in reg_dates])
+
+    # 각 날짜 00:00 UTC 시점의 고도와 방위각을 한 번에 계산
+    t_days = ts.utc(first_date.year, first_date.month, first_date.day + day_offsets)
+    apparent = (earth + location).at(t_days).observe(planet).apparent()
+    alt, az, _ = apparent.altaz()
+
+    # 전체 기간의 떠오름/짐 이벤트를 한 번에 탐색
+    t0 = ts.utc(first_date.year, first_date.month, first_date.day, 0, 0, 0)
+    t1 = ts.utc(last_date.year, last_date.month, last_date.day, 23, 59, 59)
+    times, events = almanac.find_discrete(t0, t1, almanac.risings_and_settings(planets, planet, location))
+
+    # 날짜별 첫 번째 떠오름 이벤트 찾기
+    rise_positions = np.flatnonzero(events == 1)
+    rise_days = np.floor(times.tt[rise_positions] - t0.tt).astype(int)
+    rise_lookup = np.searchsorted(rise_days, day_offsets, side='left')
+    has_rise = rise_lookup < len(rise_days)
+    has_rise[has_rise] = rise_days[rise_lookup[has_rise]] == day_offsets[has_rise]
+
+    rise_datetimes = times[rise_positions].utc_datetime() if len(rise_positions) else []
+    first_rises = [rise_datetimes[rise_lookup[i]] if has_rise[i] else None for i in range(len(reg_dates))]
+
+    return alt.degrees, az.degrees, first_rises
+
+
 @cache.memoize(timeout=3600)
 def calculate_planet_info(planet_name, latitude, longitude, date, range_days=1, timezone_info=None):
     """
@@ -23,30 +64,24 @@ def calculate_planet_info(planet_name, latitude, longitude, date, range_days=1,
     # 위치 설정
     location = Topos(latitude, longitude)
 
-    # 타임존 정보가 제공되지 않은 경우, sunrise_sunset_data_list에서 가져옴
     # range_days가 None인 경우 기본값 설정
     if range_days is None:
         range_days = 1
 
-    if not timezone_info:
-        sunrise_sunset_data_list = calculate_sunrise_sunset_for_range(
-            latitude, longitude, date, date + timedelta(days=range_days - 1)
-        )
-        if not sunrise_sunset_data_list or "error" in sunrise_sunset_data_list[0]:
-            return [{"error": "Failed to calculate sunrise or sunset."}]
-
-        timezone_info = {
-            'timeZoneId': sunrise_sunset_data_list[0].get('timeZoneId', 'Unknown'),
-            'offset_sec': sunrise_sunset_data_list[0].get('offset', 0)
-        }
-
-    # 지정된 범위에 대한 일출 및 일몰 정보 가져오기
+    # 지정된 범위에 대한 일출 및 일몰 정보 가져오기 (한 번만 계산하여 재사용)
     end_date = date + timedelta(days=range_days - 1)
     sunrise_sunset_data_list = calculate_sunrise_sunset_for_range(latitude, longitude, date, end_date)
 
     if not sunrise_sunset_data_list or "error" in sunrise_sunset_data_list[0]:
         return [{"error": "Failed to calculate sunrise or sunset."}]
 
+    # 타임존 정보가 제공되지 않은 경우, sunrise_sunset_data_list에서 가져옴
+    if not timezone_info:
+        timezone_info = {
+            'timeZoneId': sunrise_sunset_data_list[0].get('timeZoneId', 'Unknown'),
+            'offset_sec': sunrise_sunset_data_list[0].get('offset', 0)
+        }
+
     # Skyfield에서 사용할 행성 이름으로 변환
     skyfield_planet_code = get_skyfield_planet_code(planet_name)
     if not skyfield_planet_code:
@@ -58,80 +93,43 @@ def calculate_planet_info(planet_name, latitude, longitude, date, range_days=1,
     # get_session을 사용하여 세션 관리
     with get_session() as session:
         try:
-            # DB에서 데이터 조회
-            PlanetRawDataYear = get_planet_raw_data_model(date.year)
-            query = session.query(PlanetRawDataYear).filter(
-                PlanetRawDataYear.planet_name == planet_name,
-                PlanetRawDataYear.reg_date.between(date, end_date)
-            )
-
-            rows = retry_query(session, query)
+            # DB에서 데이터 조회 (연도 경계를 넘는 범위도 한 번에 조회)
+            rows = get_planet_ephemeris_rows(session, planet_name, date, end_date)
 
             if not rows:
                 return [{"error": f"No data available for {planet_name} in the specified date range."}]
 
+            # 조회된 모든 날짜의 고도/방위각과 떠오름 시각을 한 번에 계산
+            rows = rows[:len(sunrise_sunset_data_list)]
+            altitudes, azimuths, first_rises = calculate_planet_visibility_for_dates(
+                planet, location, [row.reg_date for row in rows]
+            )
+
             results = []
 
-            for row, sunrise_sunset_data in zip(rows, sunrise_sunset_data_list):
+            for row, sunrise_sunset_data, altitude, azimuth, rise_time in zip(
+                    rows, sunrise_sunset_data_list, altitudes.tolist(), azimuths.tolist(), first_rises):
                 reg_date = row.reg_date
                 delta = row.distance
-                s_o_t = row.s_o_t
 
-                t0 = ts.utc(reg_date.year, reg_date.month, reg_date.day, 0, 0, 0)
-                t1 = ts.utc(reg_date.year, reg_date.month, reg_date.day, 23, 59, 59)
-                times, is_visible = almanac.find_discrete(
-                    t0, t1, almanac.risings_and_settings(planets, planet, location)
-                )
+                # 날짜별 오프셋 (서머타임 전환을 넘는 범위에서도 일출/일몰 문자열과 같은 기준)
+                offset_sec = sunrise_sunset_data.get('offset', timezone_info['offset_sec'])
 
                 # 가시성 판단 추가 로직 (고도를 고려)
                 visible = False
                 best_time = None
 
-                # 행성의 고도와 방위각 계산
-                apparent = (planets['earth'] + location).at(t0).observe(planet).apparent()
-                alt, az, _ = apparent.altaz()
-                altitude = alt.degrees
-
-                for t, visible_event in zip(times, is_visible):
-                    if visible_event == 1:  # 행성이 떠오르는 시간
-                        # 고도가 0 이상일 때만 visible로 설정
-                        if altitude >= 0:
-                            visible = True
-                            best_time = convert_utc_to_local_time(
-                                t.utc_datetime(), timezone_info['offset_sec']
-                            ).time()
-                        break
+                # 행성이 떠오르는 시간 (고도가 0 이상일 때만 visible로 설정)
+                if rise_time is not None and altitude >= 0:
+                    visible = True
+                    best_time = convert_utc_to_local_time(rise_time, offset_sec).time()
 
                 # 고도와 일출/일몰 시간에 따라 visibility_judgment 설정
                 sunrise_time = datetime.fromisoformat(sunrise_sunset_data['sunrise']).time()
                 sunset_time = datetime.fromisoformat(sunrise_sunset_data['sunset']).time()
-
-                if best_time:
-                    if best_time > sunset_time or best_time < sunrise_time:
-                        # 일몰 이후 또는 일출 이전이라면
-                        if altitude >= 45:
-                            visibility_judgment = (
-                                "Good visibility - The planet is high in the sky and it's dark enough for easy observation."
-                            )
-                        else:
-                            visibility_judgment = (
-                                "Difficult to observe - The planet is visible, but it is low in the sky, making it harder to see."
-                            )
-                    else:
-                        # 일출 이후 일몰 이전
-                        if altitude >= 45:
-                            visibility_judgment = (
-                                "Difficult to observe - The planet is high, but daylight might make it challenging to see."
-                            )
-                        else:
-                            visibility_judgment = (
-                                "Not recommended - The planet is low in the sky and daylight makes it very hard to observe."
-                            )
-                else:
-                    visibility_judgment = "No optimal observation time available."
+                visibility_judgment = get_visibility_judgment(best_time, altitude, sunrise_time, sunset_time)
 
                 # 방위각을 동서남북 방향으로 변환
-                azimuth = az.degrees
                 direction = azimuth_to_direction(azimuth)
 
                 results.append(
@@ -140,7 +138,7 @@ def calculate_planet_info(planet_name, latitude, longitude, date, range_days=1,
                         "visible": visible,
                         "best_time": best_time.strftime("%H:%M") if best_time else "N/A",
                         "timeZoneId": timezone_info['timeZoneId'],
-                        "offset_sec": timezone_info['offset_sec'],
+                        "offset_sec": offset_sec,
                         "distance_to_earth": f"{delta:.4f} AU" if delta else "N/A",
                         "altitude": f"{altitude:.2f}°",
                         "azimuth": direction,
@@ -154,3 +152,34 @@ def calculate_planet_info(planet_name, latitude, longitude, date, range_days=1,
             return [{"error": f"Database operation failed: {e}"}]
 
     return results
+
+
+def get_visibility_judgment(best_time, altitude, sunrise_time, sunset_time):
+    """
+    떠오름 시각, 고도, 일출/일몰 시각으로 관측 난이도 메시지를 결정하는 함수
+
+    Args:
+        best_time (time): 현지 떠오름 시각 (없으면 None)
+        altitude (float): 고도 (도)
+        sunrise_time (time): 현지 일출 시각
+        sunset_time (time): 현지 일몰 시각
+
+    Returns:
+        str: 관측 난이도 메시지
+    """
+    if not best_time:
+        return "No optimal observation time available."
+
+    if best_time > sunset_time or best_time < sunrise_time:
+        # 일몰 이후 또는 일출 이전이라면
+        if altitude >= 45:
+            return "Good visibility - The planet is high in the sky and it's dark enough for easy observation."
+        return "Difficult to observe - The planet is visible, but it is low in the sky, making it harder to see."
+
+    # 일출 이후 일몰 이전
+    if altitude >= 45:
+        return "Difficult to observe - The planet is high, but daylight might make it challenging to see."
+    return "Not recommended - The planet is low in the sky and daylight makes it very hard to observe."
+
+
+__all__ = ['calculate_planet_info', 'calculate_planet_visibility_for_dates', 'get_visibility_judgment']
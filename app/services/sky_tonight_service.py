@@ -0,0 +1,143 @@
+# services/sky_tonight_service.py
+
+from datetime import datetime, timedelta
+import numpy as np
+from skyfield.api import Topos, N, E, position_of_radec
+from app.global_resources import ts, planets, earth, moon, constellation_map  # 전역 리소스 임포트
+from app.data.data import get_skyfield_planet_code
+from app.services.sunrise_sunset_service import calculate_sunrise_sunset_for_range
+from app.services.timezone_conversion_service import convert_utc_to_local_time, round_seconds
+from app.services.moon_phase_service import get_moon_phase_for_date
+from app.services.directions_utils import azimuth_to_direction
+from app import cache
+
+# 밤하늘 요약에 포함할 행성
+SKY_TONIGHT_PLANETS = ["Mercury", "Venus", "Mars", "Jupiter", "Saturn", "Uranus", "Neptune"]
+
+# 일몰부터 다음 날 일출까지의 샘플 간격 (분)
+SKY_TONIGHT_STEP_MINUTES = 15
+
+
+def observe_bodies_tonight(observer_at, bodies):
+    """
+    공유된 관측자 위치(Time 배열)에 대해 여러 천체의 고도/방위각/거리/적경·적위를 계산하는 함수
+
+    Args:
+        observer_at (Barycentric): (earth + location).at(t) 결과 (t는 밤 시간대 Time 배열)
+        bodies (dict): {이름: Skyfield 천체 객체}
+
+    Returns:
+        dict: {이름: (고도 배열, 방위각 배열, 거리 배열(AU), 적경 배열(시), 적위 배열(도))}
+    """
+    observations = {}
+    for name, body in bodies.items():
+        apparent = observer_at.observe(body).apparent()
+        alt, az, distance = apparent.altaz()
+        ra, dec, _ = apparent.radec()
+        observations[name] = (alt.degrees, az.degrees, distance.au, ra.hours, dec.degrees)
+    return observations
+
+
+@cache.memoize(timeout=3600)
+def get_sky_tonight(latitude, longitude, date):
+    """
+    특정 위치와 날짜의 밤(일몰 ~ 다음 날 일출)에 보이는 행성, 달, 천정의 별자리를 한 번에 계산하는 함수.
+    모든 천체를 하나의 관측자 위치와 하나의 Time 배열로 계산한다.
+
+    Args:
+        latitude (float): 위도
+        longitude (float): 경도
+        date (datetime): 관측 날짜 (현지 날짜)
+
+    Returns:
+        dict: 밤하늘 요약 정보 또는 에러 메시지
+    """
+    latitude = round(latitude, 4)
+    longitude = round(longitude, 4)
+
+    # 오늘 일몰과 다음 날 일출 (한 번의 범위 계산)
+    sunrise_sunset_data_list = calculate_sunrise_sunset_for_range(latitude, longitude, date,
+                                                                  date + timedelta(days=1))
+    if (not isinstance(sunrise_sunset_data_list, list) or len(sunrise_sunset_data_list) < 2
+            or any("error" in day_data for day_data in sunrise_sunset_data_list)):
+        return {"error": "Failed to calculate sunrise or sunset."}
+
+    tonight, tomorrow = sunrise_sunset_data_list[0], sunrise_sunset_data_list[1]
+    offset_sec = tonight["offset"]
+    sunset_local = datetime.fromisoformat(tonight["sunset"]).replace(tzinfo=None)
+    sunrise_local = datetime.fromisoformat(tomorrow["sunrise"]).replace(tzinfo=None)
+
+    # 밤 시간대를 하나의 Time 배열로 구성 (UTC)
+    sunset_utc = sunset_local - timedelta(seconds=offset_sec)
+    night_minutes = (sunrise_local - sunset_local).total_seconds() / 60
+    minute_offsets = np.arange(0, night_minutes + 1e-9, SKY_TONIGHT_STEP_MINUTES)
+    t = ts.utc(sunset_utc.year, sunset_utc.month, sunset_utc.day, sunset_utc.hour,
+               sunset_utc.minute + minute_offsets, sunset_utc.second)
+
+    # 관측자 위치는 한 번만 계산하여 모든 천체에 재사용
+    location = Topos(latitude * N, longitude * E)
+    observer_at = (earth + location).at(t)
+
+    bodies = {name: planets[get_skyfield_planet_code(name)] for name in SKY_TONIGHT_PLANETS}
+    bodies["Moon"] = moon
+    observations = observe_bodies_tonight(observer_at, bodies)
+
+    # 각 천체의 최고 고도 시점
+    names = list(observations)
+    altitudes = np.array([observations[name][0] for name in names])
+    best_indices = np.argmax(altitudes, axis=1)
+    body_rows = np.arange(len(names))
+
+    # 최고 고도 시점의 별자리를 한 번에 조회
+    best_ra = np.array([observations[name][3] for name in names])[body_rows, best_indices]
+    best_dec = np.array([observations[name][4] for name in names])[body_rows, best_indices]
+    best_constellations = constellation_map(position_of_radec(best_ra, best_dec))
+
+    best_datetimes = t[best_indices].utc_datetime()
+    sky_bodies = []
+    for row, name in enumerate(names):
+        max_altitude = float(altitudes[row, best_indices[row]])
+        _, azimuths, distances, _, _ = observations[name]
+        visible = max_altitude > 0
+        best_time = convert_utc_to_local_time(best_datetimes[row], offset_sec)
+        sky_bodies.append({
+            "name": name,
+            "visible": bool(visible),
+            "best_time": best_time.strftime("%H:%M") if visible else "N/A",
+            "max_altitude": f"{max_altitude:.2f}°",
+            "azimuth": azimuth_to_direction(float(azimuths[best_indices[row]])),
+            "constellation": str(best_constellations[row]),
+            "distance_to_earth": f"{float(distances[best_indices[row]]):.4f} AU"
+        })
+
+    planet_list = [body for body in sky_bodies if body["name"] != "Moon"]
+    moon_info = next(body for body in sky_bodies if body["name"] == "Moon")
+
+    # 달의 위상 (월령 테이블 보간)
+    moon_phase = get_moon_phase_for_date(date)
+    if "error" not in moon_phase:
+        moon_info["phase_description"] = moon_phase["phase_description"]
+        moon_info["illumination"] = moon_phase["illumination"]
+
+    # 밤 한가운데 시점의 천정 별자리 (천정의 적경 = 지방 항성시, 적위 = 위도)
+    middle = len(t) // 2
+    zenith_ra = (t.gast[middle] + longitude / 15.0) % 24.0
+    zenith_constellation = constellation_map(position_of_radec(zenith_ra, latitude))
+    zenith_time = round_seconds(sunset_local + timedelta(minutes=float(minute_offsets[middle])))
+
+    return {
+        "location": {"latitude": latitude, "longitude": longitude},
+        "date": date.strftime('%Y-%m-%d'),
+        "timeZoneId": tonight.get("timeZoneId"),
+        "sunset": tonight["sunset"],
+        "sunrise": tomorrow["sunrise"],
+        "constellation": {
+            "zenith": str(zenith_constellation),
+            "time": zenith_time.strftime("%H:%M")
+        },
+        "moon": moon_info,
+        "planets": planet_list
+    }
+
+
+__all__ = ['get_sky_tonight', 'observe_bodies_tonight']
@@ -1,14 +1,67 @@
 # services/sunrise_sunset_service.py
 
 from datetime import datetime, timedelta
+import numpy as np
 from skyfield.api import Topos, N, E
 from skyfield import almanac
 from app.global_resources import ts, planets  # 전역 리소스 임포트
-from .timezone_conversion_service import convert_utc_to_local_time, get_cached_utc_offset  # 시간 변환 함수 import 상대경로 유지.
+from .timezone_conversion_service import convert_utc_to_local_time, get_cached_utc_offset, \
+    get_daily_utc_offsets  # 시간 변환 함수 import 상대경로 유지.
 from .get_timezone_info import get_timezone_info  # 타임존 정보 가져오는 함수 import 상대경로 유지.
 from app import cache
 
 
+def find_sunrise_sunset_events(location, start_date, end_date, offset_sec):
+    """
+    날짜 범위 전체에 대해 한 번의 탐색으로 일출/일몰 이벤트를 찾고 현지 날짜별로 분류하는 함수
+
+    Args:
+        location (Topos): 관측 위치
+        start_date (datetime): 시작 날짜
+        end_date (datetime): 종료 날짜
+        offset_sec (int | np.ndarray): 타임존 오프셋 (초 단위). 날짜별 오프셋 배열도 허용 (서머타임 반영)
+
+    Returns:
+        tuple: (날짜 리스트, 일출 Time 배열 인덱스, 일몰 Time 배열 인덱스, 이벤트 Time 배열)
+               일출/일몰이 없는 날짜의 인덱스는 -1
+    """
+    num_days = (end_date.date() - start_date.date()).days + 1
+    dates = [start_date + timedelta(days=i) for i in range(num_days)]
+    offsets = np.broadcast_to(np.asarray(offset_sec, dtype=float), (num_days,))
+
+    # 시작 날짜의 현지 자정부터 종료 날짜 다음 날 일몰까지 한 번에 탐색
+    t0 = ts.utc(start_date.year, start_date.month, start_date.day, 0, 0, -offsets[0])
+    t1 = ts.tt_jd(t0.tt + num_days + 1)
+    times, events = almanac.find_discrete(t0, t1, almanac.sunrise_sunset(planets, location))
+
+    # 각 이벤트가 속한 현지 날짜 인덱스 (0 = start_date)
+    # 날짜별 오프셋이 시작 날짜와 다르면 (서머타임 전환) 그 차이만큼 현지 날짜 경계를 보정
+    elapsed_days = times.tt - t0.tt
+    approx_index = np.clip(np.floor(elapsed_days).astype(int), 0, num_days - 1)
+    day_index = np.floor(elapsed_days + (offsets[approx_index] - offsets[0]) / 86400.0).astype(int)
+
+    rise_positions = np.flatnonzero(events == 1)
+    set_positions = np.flatnonzero(events == 0)
+
+    # 날짜별 첫 번째 일출 찾기
+    rise_days = day_index[rise_positions]
+    day_numbers = np.arange(num_days)
+    rise_lookup = np.searchsorted(rise_days, day_numbers, side='left')
+    has_rise = rise_lookup < len(rise_days)
+    has_rise[has_rise] = rise_days[rise_lookup[has_rise]] == day_numbers[has_rise]
+    sunrise_index = np.full(num_days, -1)
+    sunrise_index[has_rise] = rise_positions[rise_lookup[has_rise]]
+
+    # 일출 이후 첫 번째 일몰 찾기
+    set_lookup = np.searchsorted(set_positions, sunrise_index[has_rise], side='right')
+    has_set = set_lookup < len(set_positions)
+    sunset_index = np.full(num_days, -1)
+    sunset_days = np.flatnonzero(has_rise)[has_set]
+    sunset_index[sunset_days] = set_positions[set_lookup[has_set]]
+
+    return dates, sunrise_index, sunset_index, times
+
+
 @cache.memoize(timeout=3600)
 def calculate_sunrise_sunset_for_range(latitude, longitude, start_date, end_date, offset_sec=None, timezone_id=None):
     # print(f"[DEBUG] calculate_sunrise_sunset_for_range called with latitude: {latitude}, longitude: {longitude}, start_date: {start_date}, end_date: {end_date}")
@@ -19,7 +72,7 @@ def calculate_sunrise_sunset_for_range(latitude, longitude, start_date, end_date
     location = Topos(latitude * N, longitude * E)
     result_list = []
 
-    # 첫 번째 날짜에 대해 타임존 오프셋을 캐싱하여 재사용
+    # 첫 번째 날짜에 대해 타임존 정보를 캐싱하여 재사용
     if offset_sec is None or timezone_id is None:
         try:
             timezone_timestamp = int(start_date.timestamp())
@@ -29,54 +82,49 @@ def calculate_sunrise_sunset_for_range(latitude, longitude, start_date, end_date
             print(f"[ERROR] Failed to fetch timezone info: {e}")
             return {"error": f"타임존 정보를 가져오는 데 실패했습니다: {str(e)}"}
 
-    # 날짜 범위 내에서 일출 및 일몰 계산
-    current_date = start_date
-    while current_date <= end_date:
-        # print(f"[DEBUG] Calculating for date: {current_date}")
-        t0 = ts.utc(current_date.year, current_date.month, current_date.day - 1, 0, 0, 0)
-        t1 = ts.utc(current_date.year, current_date.month, current_date.day + 1, 23, 59, 59)
-
-        try:
-            times, events = almanac.find_discrete(t0, t1, almanac.sunrise_sunset(planets, location))
-            # print(f"[DEBUG] Sunrise/Sunset times (UTC): {times}")
-            # print(f"[DEBUG] Events: {events}")
-        except Exception as e:
-            # print(f"[ERROR] Failed to calculate sunrise/sunset for date {current_date}: {e}")
+    # 시간대 전환 테이블로 날짜별 오프셋을 계산 (범위 안의 서머타임 전환 반영)
+    num_days = (end_date.date() - start_date.date()).days + 1
+    daily_offsets = get_daily_utc_offsets(timezone_id, start_date, num_days, offset_sec)
+
+    # 날짜 범위 전체의 일출 및 일몰을 한 번에 계산
+    try:
+        dates, sunrise_index, sunset_index, times = find_sunrise_sunset_events(
+            location, start_date, end_date, daily_offsets
+        )
+    except Exception as e:
+        # print(f"[ERROR] Failed to calculate sunrise/sunset for range {start_date} ~ {end_date}: {e}")
+        current_date = start_date
+        while current_date <= end_date:
             result_list.append({
                 "date": current_date.strftime('%Y-%m-%d'),
                 "error": f"Failed to calculate sunrise/sunset: {e}"
             })
             current_date += timedelta(days=1)
-            continue
+        return result_list
 
-        sunrise_utc = None
-        sunset_utc = None
-        for t, event in zip(times, events):
-            if event == 1 and sunrise_utc is None:
-                sunrise_utc = t.utc_datetime()
-            elif event == 0 and sunset_utc is None and sunrise_utc is not None:
-                sunset_utc = t.utc_datetime()
+    # 이벤트 시간을 한 번에 UTC datetime으로 변환
+    event_datetimes = times.utc_datetime() if len(times) else []
 
-        if sunrise_utc is None or sunset_utc is None:
+    for current_date, rise_i, set_i, day_offset in zip(dates, sunrise_index, sunset_index, daily_offsets.tolist()):
+        if rise_i < 0 or set_i < 0:
             # print(f"[WARNING] Sunrise or sunset missing for date {current_date}")
             result_list.append({
                 "date": current_date.strftime('%Y-%m-%d'),
                 "error": "일출 또는 일몰 시간을 계산할 수 없습니다."
             })
-        else:
-            sunrise_local = convert_utc_to_local_time(sunrise_utc, offset_sec)
-            sunset_local = convert_utc_to_local_time(sunset_utc, offset_sec)
-            # print(f"[DEBUG] Sunrise (local): {sunrise_local}, Sunset (local): {sunset_local}")
+            continue
 
-            result_list.append({
-                "date": current_date.strftime('%Y-%m-%d'),
-                "sunrise": sunrise_local.isoformat(),
-                "sunset": sunset_local.isoformat(),
-                "offset": offset_sec,
-                "timeZoneId": timezone_id
-            })
+        sunrise_local = convert_utc_to_local_time(event_datetimes[rise_i], day_offset)
+        sunset_local = convert_utc_to_local_time(event_datetimes[set_i], day_offset)
+        # print(f"[DEBUG] Sunrise (local): {sunrise_local}, Sunset (local): {sunset_local}")
 
-        current_date += timedelta(days=1)
+        result_list.append({
+            "date": current_date.strftime('%Y-%m-%d'),
+            "sunrise": sunrise_local.isoformat(),
+            "sunset": sunset_local.isoformat(),
+            "offset": day_offset,
+            "timeZoneId": timezone_id
+        })
 
     # print(f"[DEBUG] Final sunrise/sunset result list: {result_list}")
     return result_list
@@ -107,4 +155,4 @@ def get_single_day_sunrise_sunset(latitude, longitude, date):
     return sunrise_sunset_data_list[0]
 
 
-__all__ = ['calculate_sunrise_sunset_for_range', 'get_single_day_sunrise_sunset']
+__all__ = ['calculate_sunrise_sunset_for_range', 'get_single_day_sunrise_sunset', 'find_sunrise_sunset_events']
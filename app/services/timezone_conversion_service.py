@@ -1,6 +1,8 @@
 # services/timezone_conversion_service.py
 
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+import numpy as np
 from .get_timezone_info import get_timezone_info  # 타임존 정보 가져오는 함수 import 상대경로 유지
 from app import cache  # Flask-Caching 객체 import
 
@@ -32,6 +34,38 @@ def get_cached_utc_offset(latitude, longitude, timestamp):
     return offset_sec, timezone_id
 
 
+def get_daily_utc_offsets(timezone_id, start_date, num_days, fallback_offset=0):
+    """
+    tzdata(zoneinfo)의 시간대 규칙을 이용해 날짜별 UTC 오프셋을 한 번에 계산하는 함수.
+    각 날짜의 오프셋은 현지 정오 시점을 기준으로 한다 (서머타임 전환 당일에도 일출/일몰 시각에 맞는 오프셋).
+
+    Args:
+        timezone_id (str): IANA 시간대 ID (예: "America/New_York")
+        start_date (datetime): 시작 날짜
+        num_days (int): 날짜 수
+        fallback_offset (int): 시간대를 알 수 없을 때 사용할 오프셋 (초 단위)
+
+    Returns:
+        np.ndarray: 날짜별 타임존 오프셋 배열 (초 단위)
+    """
+    if num_days <= 0:
+        return np.zeros(0, dtype=int)
+
+    try:
+        zone = ZoneInfo(timezone_id) if timezone_id else None
+    except (ZoneInfoNotFoundError, ValueError):
+        zone = None
+    if zone is None:
+        return np.full(num_days, int(fallback_offset), dtype=int)
+
+    # zoneinfo는 tzdata의 POSIX 규칙으로 전환 테이블 이후(2037년 이후 포함)의 날짜도 계산
+    first_noon = datetime(start_date.year, start_date.month, start_date.day, 12, tzinfo=zone)
+    return np.array([
+        int((first_noon + timedelta(days=day)).utcoffset().total_seconds())
+        for day in range(num_days)
+    ], dtype=int)
+
+
 def round_seconds(dt):
     """
     datetime 객체의 초 단위를 반올림하는 함수.
@@ -71,4 +105,4 @@ def convert_local_to_utc_time(local_time, offset_sec):
     return round_seconds(utc_time)  # 초 단위 반올림 후 반환
 
 
-__all__ = ['convert_utc_to_local_time', 'convert_local_to_utc_time', 'get_cached_utc_offset']
+__all__ = ['convert_utc_to_local_time', 'convert_local_to_utc_time', 'get_cached_utc_offset', 'get_daily_utc_offsets']
@@ -0,0 +1,72 @@
+"""Add single planet_ephemeris table and copy yearly raw data tables
+
+Revision ID: 7c3f9a1d5e42
+Revises: 2b188e060f1d
+Create Date: 2026-10-17 09:12:31.402117
+
+"""
+import re
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '7c3f9a1d5e42'
+down_revision = '2b188e060f1d'
+branch_labels = None
+depends_on = None
+
+# MariaDB 연도별 파티션 범위 (이후 연도는 적재 시 pmax에서 분리)
+PARTITION_FIRST_YEAR = 2020
+PARTITION_LAST_YEAR = 2040
+
+LEGACY_TABLE_PATTERN = re.compile(r'planet_raw_data_\d{4}')
+
+
+def upgrade():
+    op.create_table('planet_ephemeris',
+    sa.Column('planet_name', sa.String(length=50), nullable=False),
+    sa.Column('reg_date', sa.Date(), nullable=False),
+    sa.Column('distance', sa.Float(), nullable=False),
+    sa.Column('s_o_t', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('planet_name', 'reg_date')
+    )
+
+    bind = op.get_bind()
+    dialect_name = bind.dialect.name
+
+    # MariaDB/MySQL: 연도별 RANGE 파티션 (파티션 키 reg_date는 기본 키에 포함됨)
+    if dialect_name in ('mysql', 'mariadb'):
+        partitions = ', '.join(
+            f'PARTITION p{year} VALUES LESS THAN ({year + 1})'
+            for year in range(PARTITION_FIRST_YEAR, PARTITION_LAST_YEAR + 1)
+        )
+        op.execute(
+            'ALTER TABLE planet_ephemeris PARTITION BY RANGE (YEAR(reg_date)) '
+            f'(PARTITION p_old VALUES LESS THAN ({PARTITION_FIRST_YEAR}), {partitions}, '
+            'PARTITION pmax VALUES LESS THAN MAXVALUE)'
+        )
+
+    # 기존 연도별 테이블 데이터를 복사 (중복 키는 무시)
+    ephemeris = sa.table('planet_ephemeris', sa.column('planet_name'), sa.column('reg_date'),
+                         sa.column('distance'), sa.column('s_o_t'))
+    columns = ['planet_name', 'reg_date', 'distance', 's_o_t']
+    legacy_tables = sorted(name for name in sa.inspect(bind).get_table_names()
+                           if LEGACY_TABLE_PATTERN.fullmatch(name))
+
+    for table_name in legacy_tables:
+        legacy = sa.table(table_name, *(sa.column(column) for column in columns))
+        source = sa.select(*(legacy.c[column] for column in columns))
+
+        if dialect_name == 'postgresql':
+            stmt = postgresql.insert(ephemeris).from_select(columns, source).on_conflict_do_nothing()
+        else:
+            stmt = sa.insert(ephemeris).from_select(columns, source)
+            stmt = stmt.prefix_with('IGNORE', dialect='mysql').prefix_with('OR IGNORE', dialect='sqlite')
+        op.execute(stmt)
+
+
+def downgrade():
+    # 연도별 테이블은 upgrade에서 삭제하지 않으므로 새 테이블만 제거
+    op.drop_table('planet_ephemeris')
@@ -0,0 +1,32 @@
+"""Add opposition_events index table
+
+Revision ID: a41e6d02b8c7
+Revises: 7c3f9a1d5e42
+Create Date: 2026-10-17 10:03:47.118530
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a41e6d02b8c7'
+down_revision = '7c3f9a1d5e42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('opposition_events',
+    sa.Column('planet_name', sa.String(length=50), nullable=False),
+    sa.Column('event_date', sa.Date(), nullable=False),
+    sa.Column('event_type', sa.String(length=30), nullable=False),
+    sa.Column('event_time', sa.DateTime(), nullable=False),
+    sa.Column('distance', sa.Float(), nullable=False),
+    sa.Column('s_o_t', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('planet_name', 'event_date', 'event_type')
+    )
+
+
+def downgrade():
+    op.drop_table('opposition_events')
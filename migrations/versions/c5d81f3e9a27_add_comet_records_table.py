@@ -0,0 +1,30 @@
+"""Add comet_records table for cached Horizons record numbers
+
+Revision ID: c5d81f3e9a27
+Revises: a41e6d02b8c7
+Create Date: 2026-10-17 11:24:05.730912
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5d81f3e9a27'
+down_revision = 'a41e6d02b8c7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('comet_records',
+    sa.Column('designation', sa.String(length=20), nullable=False),
+    sa.Column('record_number', sa.String(length=20), nullable=False),
+    sa.Column('epoch_year', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('designation')
+    )
+
+
+def downgrade():
+    op.drop_table('comet_records')
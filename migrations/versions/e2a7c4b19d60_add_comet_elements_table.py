@@ -0,0 +1,36 @@
+"""Add comet_elements table for the local comet position engine
+
+Revision ID: e2a7c4b19d60
+Revises: c5d81f3e9a27
+Create Date: 2026-10-17 13:02:18.264590
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2a7c4b19d60'
+down_revision = 'c5d81f3e9a27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('comet_elements',
+    sa.Column('designation', sa.String(length=20), nullable=False),
+    sa.Column('record_number', sa.String(length=20), nullable=False),
+    sa.Column('epoch_jd', sa.Double(), nullable=False),
+    sa.Column('eccentricity', sa.Double(), nullable=False),
+    sa.Column('perihelion_distance_au', sa.Double(), nullable=False),
+    sa.Column('inclination_degrees', sa.Double(), nullable=False),
+    sa.Column('longitude_of_ascending_node_degrees', sa.Double(), nullable=False),
+    sa.Column('argument_of_perihelion_degrees', sa.Double(), nullable=False),
+    sa.Column('perihelion_time_jd', sa.Double(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('designation')
+    )
+
+
+def downgrade():
+    op.drop_table('comet_elements')
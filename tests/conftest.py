@@ -0,0 +1,23 @@
+# tests/conftest.py
+# 테스트 공통 설정
+
+import os
+import sys
+
+import pytest
+
+# 저장소 루트를 임포트 경로에 추가 (app 패키지 사용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# app.global_resources는 실행 디렉터리 기준 app/data/de440.bsp를 읽음
+# (Git LFS 포인터만 받은 작업 사본에서는 천체력이 필요한 테스트를 건너뜀)
+EPHEMERIS_PATH = os.path.join('app', 'data', 'de440.bsp')
+EPHEMERIS_AVAILABLE = os.path.exists(EPHEMERIS_PATH) and os.path.getsize(EPHEMERIS_PATH) > 1024 * 1024
+
+
+def require_ephemeris():
+    """
+    천체력 파일이 없으면 현재 테스트 모듈 전체를 건너뛰는 함수 (모듈 최상단에서 호출)
+    """
+    if not EPHEMERIS_AVAILABLE:
+        pytest.skip("app/data/de440.bsp is not available", allow_module_level=True)
@@ -0,0 +1,68 @@
+# tests/fake_upstream/bench.py
+"""
+API 엔드포인트 처리량 및 꼬리 지연 측정 스크립트 (로컬 대체 서버와 함께 사용)
+
+사용 예시:
+    python tests/fake_upstream/bench.py \
+        "http://localhost:5000/api/comet/approach?comet=Halley&start_date=2024-10-01&range_days=30" \
+        -n 200 -c 8
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def timed_get(session, url, timeout):
+    started = time.perf_counter()
+    try:
+        status = session.get(url, timeout=timeout).status_code
+    except requests.RequestException:
+        status = None
+    return status, (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure throughput and tail latency of an API endpoint")
+    parser.add_argument("url", nargs="+", help="endpoint URL(s), requested round-robin")
+    parser.add_argument("-n", "--requests", type=int, default=100, help="total number of requests")
+    parser.add_argument("-c", "--concurrency", type=int, default=4, help="number of concurrent clients")
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=args.concurrency, pool_maxsize=args.concurrency)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    urls = [args.url[i % len(args.url)] for i in range(args.requests)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(lambda url: timed_get(session, url, args.timeout), urls))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for _, latency in results)
+    statuses = {}
+    for status, _ in results:
+        statuses[status] = statuses.get(status, 0) + 1
+
+    print(f"requests     : {len(results)} (concurrency {args.concurrency})")
+    print(f"statuses     : {statuses}")
+    print(f"elapsed      : {elapsed:.2f} s")
+    print(f"throughput   : {len(results) / elapsed:.1f} req/s")
+    for label, fraction in (("p50", 0.50), ("p90", 0.90), ("p99", 0.99)):
+        print(f"latency {label}  : {percentile(latencies, fraction):.1f} ms")
+    print(f"latency max  : {latencies[-1]:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# tests/fake_upstream/record_fixtures.py
+"""
+엔드포인트별 기준 요청(혜성 천체력, 궤도 요소, 행성 천체력, 레코드 번호 검색, 시간대)의 실제 응답을 녹화하는 스크립트
+
+대체 서버를 --record 모드로 띄운 뒤 앱의 Horizons/Google 클라이언트 함수를 그대로 호출하므로,
+녹화 파일의 요청 파라미터가 앱이 보내는 요청과 정확히 일치한다. 네트워크와 Google API 키가 필요하다.
+
+사용 예시 (저장소 루트에서 실행):
+    GOOGLE_TIMEZONE_API_KEY=... python tests/fake_upstream/record_fixtures.py
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import requests
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SERVER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(base_url):
+    for _ in range(100):
+        try:
+            requests.get(f"{base_url}/_fake/stats", timeout=1)
+            return
+        except requests.ConnectionError:
+            time.sleep(0.1)
+    raise RuntimeError("fake upstream server did not start")
+
+
+def record_all():
+    """
+    앱 클라이언트 함수로 엔드포인트별 기준 요청을 한 번씩 보내 녹화하는 함수 (앱은 대체 서버를 바라보도록 설정)
+    """
+    from sqlalchemy import create_engine
+    from app.db.session_manager import Session
+    from app.models import CometRecord
+    from app.services.horizons_service import fetch_comet_record_number, get_comet_elements_from_horizons, \
+        get_comet_approach_events, get_planet_position_from_horizons
+    from app.services.get_timezone_info import get_google_timezone_info
+
+    # 레코드 번호 저장용 임시 DB
+    engine = create_engine("sqlite://")
+    CometRecord.__table__.create(engine)
+    Session.configure(bind=engine)
+
+    results = {
+        "record search (1P)": fetch_comet_record_number("1P"),
+        "comet elements (Halley, 1986-02-19)": get_comet_elements_from_horizons("Halley", datetime(1986, 2, 19)),
+        "comet ephemeris (Halley, 1986-04-01 +20 d)": get_comet_approach_events("Halley", datetime(1986, 4, 1), 20),
+        "planet ephemeris (Mars, 2025-01-01 +30 d)": get_planet_position_from_horizons("Mars", datetime(2025, 1, 1),
+                                                                                       30),
+        "timezone (Seoul)": get_google_timezone_info(37.57, 126.98, int(datetime(2024, 10, 1).timestamp())),
+    }
+    for name, result in results.items():
+        failed = isinstance(result, dict) and ("error" in result or result.get("status") not in (None, "OK"))
+        print(f"{'FAILED' if failed else 'ok':6s} {name}")
+
+
+def main():
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen([sys.executable, SERVER_PATH, "--port", str(port), "--record"])
+    try:
+        wait_until_ready(base_url)
+        os.environ["HORIZONS_API_URL"] = f"{base_url}/api/horizons.api"
+        os.environ["GOOGLE_TIMEZONE_API_URL"] = f"{base_url}/maps/api/timezone/json"
+        os.environ["HORIZONS_CACHE_ENABLED"] = "false"  # 디스크 캐시를 거치지 않고 항상 서버로 요청
+
+        os.chdir(ROOT_DIR)  # app.global_resources가 app/data/de440.bsp를 상대 경로로 읽음
+        sys.path.insert(0, ROOT_DIR)
+        record_all()
+        print(requests.get(f"{base_url}/_fake/stats", timeout=5).json())
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
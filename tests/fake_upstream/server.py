@@ -0,0 +1,440 @@
+# tests/fake_upstream/server.py
+"""
+JPL Horizons API / Google Time Zone API 로컬 대체 서버
+
+녹화된 응답을 재생하고, 녹화가 없는 요청은 요청 파라미터로부터 Horizons/Google 응답 형식을 그대로 따르는
+결정적(deterministic) 응답을 생성한다. 지연 시간과 오류 응답을 주입할 수 있어 네트워크 없이
+혜성/유성우/행성 수집 경로의 처리량과 꼬리 지연을 재현 가능하게 측정할 수 있다.
+
+사용 예시:
+    python tests/fake_upstream/server.py --port 8089 --latency-ms 300 --jitter-ms 100 --error-rate 0.02
+
+    # API 서버 실행 시 대체 서버를 바라보도록 설정
+    HORIZONS_API_URL=http://localhost:8089/api/horizons.api
+    GOOGLE_TIMEZONE_API_URL=http://localhost:8089/maps/api/timezone/json
+
+    # 네트워크가 가능한 환경에서 실제 응답 녹화 (녹화가 없는 요청만 실제 API로 전달)
+    python tests/fake_upstream/server.py --record
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from flask import Flask, Response, request
+
+try:
+    import requests  # 녹화 모드에서만 사용
+except ImportError:
+    requests = None
+
+try:
+    from zoneinfo import ZoneInfo
+    from timezonefinder import TimezoneFinder  # Google 응답 생성 시 시간대 조회
+except ImportError:
+    TimezoneFinder = None
+
+UPSTREAM_URLS = {
+    "horizons": "https://ssd.jpl.nasa.gov/api/horizons.api",
+    "google_timezone": "https://maps.googleapis.com/maps/api/timezone/json",
+}
+
+# 녹화 키에서 제외할 파라미터 (API 키 등)
+IGNORED_PARAMS = {"key"}
+
+DEFAULT_RECORDINGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "recordings")
+
+J2000 = datetime(2000, 1, 1, 12)
+
+HORIZONS_MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+app = Flask(__name__)
+
+settings = {
+    "latency_ms": float(os.getenv("FAKE_UPSTREAM_LATENCY_MS", 0)),
+    "jitter_ms": float(os.getenv("FAKE_UPSTREAM_JITTER_MS", 0)),
+    "error_rate": float(os.getenv("FAKE_UPSTREAM_ERROR_RATE", 0)),
+    "error_status": int(os.getenv("FAKE_UPSTREAM_ERROR_STATUS", 503)),
+    "recordings_dir": os.getenv("FAKE_UPSTREAM_RECORDINGS", DEFAULT_RECORDINGS_DIR),
+    "record": False,
+    "seed": None,
+}
+
+stats = {"requests": 0, "replayed": 0, "recorded": 0, "synthesized": 0, "injected_errors": 0}
+_stats_lock = threading.Lock()
+_random = random.Random()
+_timezone_finder = None
+
+
+def count(name):
+    with _stats_lock:
+        stats[name] += 1
+
+
+def recording_key(service, params):
+    """
+    서비스 이름과 정렬된 쿼리 파라미터로 녹화 파일 키(SHA-256)를 만드는 함수
+
+    Args:
+        service (str): "horizons" 또는 "google_timezone"
+        params (dict): 쿼리 파라미터
+
+    Returns:
+        str: 녹화 키
+    """
+    canonical = json.dumps({k: v for k, v in sorted(params.items()) if k not in IGNORED_PARAMS},
+                           sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(f"{service}\n{canonical}".encode("utf-8")).hexdigest()
+
+
+def recording_path(service, params):
+    return os.path.join(settings["recordings_dir"], service, f"{recording_key(service, params)}.json")
+
+
+def load_recording(service, params):
+    path = recording_path(service, params)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_recording(service, params, status, content_type, body):
+    path = recording_path(service, params)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    recording = {
+        "service": service,
+        "request": {k: v for k, v in params.items() if k not in IGNORED_PARAMS},
+        "status": status,
+        "content_type": content_type,
+        "body": body,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(recording, f, ensure_ascii=False, indent=1)
+    return recording
+
+
+def fetch_upstream(service, params):
+    """
+    녹화 모드에서 실제 API로 요청을 전달하고 응답을 녹화하는 함수
+    """
+    if requests is None:
+        raise RuntimeError("requests is required for --record mode.")
+    response = requests.get(UPSTREAM_URLS[service], params=params, timeout=120)
+    return save_recording(service, params, response.status_code,
+                          response.headers.get("Content-Type", "text/plain"), response.text)
+
+
+# ---------------------------------------------------------------------------
+# 녹화가 없는 요청에 대한 결정적 응답 생성
+# ---------------------------------------------------------------------------
+
+def strip_quotes(value):
+    return (value or "").strip().strip("'\"")
+
+
+def seeded_value(*parts):
+    """
+    요청 내용으로부터 0~1 사이의 결정적 값을 만드는 함수 (같은 요청은 항상 같은 응답)
+    """
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return int(digest[:8], 16) / 0xFFFFFFFF
+
+
+def parse_horizons_time(value):
+    value = strip_quotes(value)
+    for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d", "%Y-%b-%d %H:%M", "%Y-%b-%d"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"Unsupported time format: {value}")
+
+
+def parse_step_size(value):
+    amount, _, unit = strip_quotes(value or "1 d").partition(" ")
+    unit = (unit or "d").lower()
+    amount = int(amount)
+    if unit.startswith("d"):
+        return timedelta(days=amount)
+    if unit.startswith("h"):
+        return timedelta(hours=amount)
+    if unit.startswith("m"):
+        return timedelta(minutes=amount)
+    raise ValueError(f"Unsupported step size: {value}")
+
+
+def format_sexagesimal(value, hours=False):
+    sign = "-" if value < 0 else ("" if hours else "+")
+    value = abs(value)
+    degrees = int(value)
+    minutes = int((value - degrees) * 60)
+    seconds = (value - degrees - minutes / 60) * 3600
+    if hours:
+        return f"{degrees:02d} {minutes:02d} {seconds:05.2f}"
+    return f"{sign}{degrees:02d} {minutes:02d} {seconds:04.1f}"
+
+
+def synthesize_ephemeris_row(command, when, quantities):
+    """
+    Horizons OBSERVER 표의 한 줄을 요청한 QUANTITIES 열 순서대로 생성하는 함수.
+    값은 대상과 시각에만 의존하므로 겹치는 기간을 요청해도 같은 날은 같은 값을 반환한다.
+    """
+    phase = seeded_value(command) * 2 * math.pi
+    angle = phase + (when - J2000).total_seconds() / 86400 * 0.0172  # 하루 약 1도
+    ra_hours = (12 + 12 * math.sin(angle)) % 24
+    dec_degrees = 25 * math.cos(angle * 1.3)
+    distance = 1.5 + math.sin(angle * 0.7)
+    sun_distance = 1.2 + 0.5 * math.cos(angle * 0.9)
+
+    columns = [f"{when.year}-{HORIZONS_MONTHS[when.month - 1]}-{when.day:02d} {when.hour:02d}:{when.minute:02d}"]
+    for quantity in quantities:
+        if quantity == "1":  # 천문 적경/적위
+            columns.append(f"{format_sexagesimal(ra_hours, hours=True)} {format_sexagesimal(dec_degrees)}")
+        elif quantity == "2":  # 겉보기 적경/적위
+            columns.append(f"{format_sexagesimal((ra_hours + 0.01) % 24, hours=True)} "
+                           f"{format_sexagesimal(dec_degrees + 0.05)}")
+        elif quantity == "19":  # 태양 거리, 시선 속도
+            columns.append(f"{sun_distance:.12f} {15 * math.sin(angle):10.7f}")
+        elif quantity == "20":  # 지구 거리, 시선 속도
+            columns.append(f"{distance:.14f} {20 * math.cos(angle * 0.7):11.7f}")
+        elif quantity == "23":  # S-O-T
+            columns.append(f"{90 + 89.9 * math.sin(angle * 0.8):8.4f} /{'L' if math.cos(angle) > 0 else 'T'}")
+        elif quantity == "25":  # T-O-M, 달 조도
+            columns.append(f"{90 + 80 * math.sin(angle * 13):5.1f}/ {50 + 49 * math.cos(angle * 12.4):4.1f}")
+    return " " + "  ".join(columns)
+
+
+def synthesize_elements_rows(command, when):
+    """
+    Horizons ELEMENTS 표의 한 기준 시각 블록(태양 중심, 황도 J2000, AU/일)을 생성하는 함수
+    """
+    jd = 2451545.0 + (when - J2000).total_seconds() / 86400
+    eccentricity = 0.6 + 0.39 * seeded_value(command, "EC")
+    perihelion = 0.5 + seeded_value(command, "QR")
+    semi_major_axis = perihelion / (1 - eccentricity)
+    period = 365.25 * semi_major_axis ** 1.5
+    perihelion_time = 2451545.0 + (seeded_value(command, "Tp") - 0.5) * period
+    return [
+        f"{jd:.9f} = A.D. {when:%Y-%b-%d %H:%M}:00.0000 TDB ",
+        f" EC= {eccentricity:.15E} QR= {perihelion:.15E} IN= {180 * seeded_value(command, 'IN'):.15E}",
+        f" OM= {360 * seeded_value(command, 'OM'):.15E} W = {360 * seeded_value(command, 'W'):.15E} "
+        f"Tp=  {perihelion_time:.12f}",
+        f" N = {0.9856076686 / semi_major_axis ** 1.5:.15E} MA= {0.0:.15E} TA= {0.0:.15E}",
+        f" A = {semi_major_axis:.15E} AD= {semi_major_axis * (1 + eccentricity):.15E} PR= {period:.15E}",
+    ]
+
+
+def synthesize_horizons(params):
+    """
+    녹화가 없는 Horizons 요청에 대해 같은 형식의 응답을 생성하는 함수
+
+    Returns:
+        tuple: (상태 코드, Content-Type, 본문)
+    """
+    command = strip_quotes(params.get("COMMAND"))
+    make_ephem = strip_quotes(params.get("MAKE_EPHEM")).upper() == "YES"
+
+    if not make_ephem:
+        # 혜성 레코드 번호 조회: 여러 출현(epoch)의 레코드 목록
+        base = 90000000 + int(seeded_value(command) * 900000)
+        lines = [
+            "*******************************************************************************",
+            " JPL/DASTCOM            Small-body Search Results",
+            " Comet AND asteroid index search:",
+            "",
+            f"    DES = {command};",
+            "",
+            " Matching small-bodies:",
+            "",
+            "    Record #  Epoch-yr  >MATCH DESIG<  Primary Desig  Name",
+            "    --------  --------  -------------  -------------  -------------------------",
+        ]
+        for offset, year in enumerate((1986, 2000, 2024)):
+            lines.append(f"    {base + offset:<8d}    {year}    {command:<13s}  {command:<13s}  {command}")
+        lines.append("")
+        lines.append(" (Display Epoch-yr is the last time the object was observed)")
+        body = "\n".join(lines) + "\n"
+        if params.get("format", "json") == "json":
+            return 200, "application/json", json.dumps({"signature": {"source": "fake upstream"}, "result": body})
+        return 200, "text/plain", body
+
+    try:
+        start = parse_horizons_time(params.get("START_TIME"))
+        stop = parse_horizons_time(params.get("STOP_TIME"))
+        step = parse_step_size(params.get("STEP_SIZE"))
+    except ValueError as e:
+        body = json.dumps({"signature": {"source": "fake upstream"}, "error": str(e)})
+        return 400, "application/json", body
+
+    if strip_quotes(params.get("EPHEM_TYPE")).upper() == "ELEMENTS":
+        rows = []
+        when = start
+        while when <= stop:
+            rows.extend(synthesize_elements_rows(command, when))
+            when += step
+    else:
+        quantities = [q.strip() for q in strip_quotes(params.get("QUANTITIES", "1")).split(",") if q.strip()]
+        rows = []
+        when = start
+        while when <= stop:
+            rows.append(synthesize_ephemeris_row(command, when, quantities))
+            when += step
+
+    result = "\n".join([
+        "*******************************************************************************",
+        f" Target body name: {command}",
+        " Center body name: Earth (399)",
+        "*******************************************************************************",
+        f" Start time      : A.D. {start:%Y-%b-%d %H:%M}:00.0000 UT",
+        f" Stop  time      : A.D. {stop:%Y-%b-%d %H:%M}:00.0000 UT",
+        "*******************************************************************************",
+        "$$SOE",
+        *rows,
+        "$$EOE",
+        "*******************************************************************************",
+    ]) + "\n"
+
+    if params.get("format", "json") == "json":
+        return 200, "application/json", json.dumps({"signature": {"source": "fake upstream"}, "result": result})
+    return 200, "text/plain", result
+
+
+def synthesize_google_timezone(params):
+    """
+    녹화가 없는 Google Time Zone 요청에 대해 로컬 시간대 경계 데이터로 같은 형식의 응답을 생성하는 함수
+    """
+    global _timezone_finder
+    try:
+        lat, lon = (float(value) for value in params.get("location", "").split(","))
+        timestamp = int(float(params.get("timestamp", 0)))
+    except ValueError:
+        return 200, "application/json", json.dumps({"status": "INVALID_REQUEST"})
+
+    timezone_id = None
+    if TimezoneFinder is not None:
+        if _timezone_finder is None:
+            _timezone_finder = TimezoneFinder(in_memory=True)
+        timezone_id = _timezone_finder.timezone_at(lat=lat, lng=lon)
+    if timezone_id is None:
+        return 200, "application/json", json.dumps({"status": "ZERO_RESULTS"})
+
+    local_time = datetime.fromtimestamp(timestamp, tz=timezone.utc).astimezone(ZoneInfo(timezone_id))
+    utc_offset = int(local_time.utcoffset().total_seconds())
+    dst_offset = int((local_time.dst() or timedelta(0)).total_seconds())
+    return 200, "application/json", json.dumps({
+        "dstOffset": dst_offset,
+        "rawOffset": utc_offset - dst_offset,
+        "status": "OK",
+        "timeZoneId": timezone_id,
+        "timeZoneName": local_time.tzname(),
+    })
+
+
+SYNTHESIZERS = {
+    "horizons": synthesize_horizons,
+    "google_timezone": synthesize_google_timezone,
+}
+
+
+def serve(service):
+    """
+    지연/오류 주입 후 녹화 재생 → (녹화 모드) 실제 API 녹화 → 결정적 응답 생성 순으로 응답하는 함수
+    """
+    params = request.args.to_dict()
+    count("requests")
+
+    delay_ms = settings["latency_ms"] + _random.uniform(0, settings["jitter_ms"])
+    if delay_ms > 0:
+        time.sleep(delay_ms / 1000)
+
+    if _random.random() < settings["error_rate"]:
+        count("injected_errors")
+        return Response(f"Injected upstream error ({settings['error_status']})",
+                        status=settings["error_status"], mimetype="text/plain")
+
+    recording = load_recording(service, params)
+    if recording is not None:
+        count("replayed")
+    elif settings["record"]:
+        recording = fetch_upstream(service, params)
+        count("recorded")
+    else:
+        status, content_type, body = SYNTHESIZERS[service](params)
+        count("synthesized")
+        return Response(body, status=status, content_type=content_type)
+
+    return Response(recording["body"], status=recording["status"], content_type=recording["content_type"])
+
+
+@app.route("/api/horizons.api")
+def horizons():
+    return serve("horizons")
+
+
+@app.route("/maps/api/timezone/json")
+def google_timezone():
+    return serve("google_timezone")
+
+
+@app.route("/_fake/stats")
+def fake_stats():
+    with _stats_lock:
+        return dict(stats)
+
+
+@app.route("/_fake/config", methods=["GET", "POST"])
+def fake_config():
+    """
+    실행 중 지연/오류 주입 설정 조회 및 변경 (POST JSON: latency_ms, jitter_ms, error_rate, error_status)
+    """
+    if request.method == "POST":
+        for name, value in (request.get_json(silent=True) or {}).items():
+            if name in ("latency_ms", "jitter_ms", "error_rate"):
+                settings[name] = float(value)
+            elif name == "error_status":
+                settings[name] = int(value)
+    return {name: settings[name] for name in ("latency_ms", "jitter_ms", "error_rate", "error_status", "record")}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Horizons / Google Time Zone stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency-ms", type=float, default=settings["latency_ms"], help="fixed response latency")
+    parser.add_argument("--jitter-ms", type=float, default=settings["jitter_ms"], help="extra uniform random latency")
+    parser.add_argument("--error-rate", type=float, default=settings["error_rate"],
+                        help="probability (0~1) of returning an injected error")
+    parser.add_argument("--error-status", type=int, default=settings["error_status"])
+    parser.add_argument("--recordings", default=settings["recordings_dir"], help="recorded responses directory")
+    parser.add_argument("--record", action="store_true",
+                        help="forward requests without a recording to the real API and save the response")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for latency/error injection")
+    args = parser.parse_args()
+
+    settings.update({
+        "latency_ms": args.latency_ms,
+        "jitter_ms": args.jitter_ms,
+        "error_rate": args.error_rate,
+        "error_status": args.error_status,
+        "recordings_dir": args.recordings,
+        "record": args.record,
+        "seed": args.seed,
+    })
+    if args.seed is not None:
+        _random.seed(args.seed)
+
+    print(f"Fake upstream listening on http://{args.host}:{args.port} "
+          f"(latency {args.latency_ms}+{args.jitter_ms} ms, error rate {args.error_rate}, "
+          f"recordings {args.recordings}, record={args.record})")
+    app.run(host=args.host, port=args.port, threaded=True)
+
+
+if __name__ == "__main__":
+    main()
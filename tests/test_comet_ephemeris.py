@@ -0,0 +1,124 @@
+# tests/test_comet_ephemeris.py
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+
+from conftest import require_ephemeris
+
+require_ephemeris()
+
+from app.db import db_utils  # noqa: E402
+from app.db.session_manager import Session  # noqa: E402
+from app.models import CometElements  # noqa: E402
+from app.services.comets import comet_elements_service, comet_ephemeris_service, comet_series_service  # noqa: E402
+from app.services.comets import parse_comet_series  # noqa: E402
+
+# JPL Horizons의 핼리 혜성 접촉 궤도 요소 (1986-02-19 TDB 기준, 황도 J2000)
+HALLEY_1986 = {
+    "designation": "1P",
+    "record_number": "90000030",
+    "epoch_jd": 2446480.5,
+    "eccentricity": 0.967277,
+    "perihelion_distance_au": 0.587104,
+    "inclination_degrees": 162.2422,
+    "longitude_of_ascending_node_degrees": 58.8601,
+    "argument_of_perihelion_degrees": 111.8657,
+    "perihelion_time_jd": 2446470.95891
+}
+
+
+@pytest.fixture
+def halley_elements(monkeypatch):
+    monkeypatch.setattr(comet_ephemeris_service, 'get_comet_elements', lambda comet_name: dict(HALLEY_1986))
+
+
+def test_halley_1986_closest_approach(halley_elements):
+    series = comet_ephemeris_service.calculate_comet_series('Halley', datetime(1986, 3, 1), 90)
+    columns = series["columns"]
+
+    # 1986-04-11 지구 최근접 (약 0.417 AU)
+    closest = int(np.argmin(columns["delta"]))
+    assert columns["time"][closest].astype('datetime64[D]') == np.datetime64('1986-04-11')
+    assert columns["delta"][closest] == pytest.approx(0.417, abs=0.002)
+    assert columns["deldot"][closest - 1] < 0 < columns["deldot"][closest + 1]
+    assert series["data"][closest]["time"] == "1986-Apr-11 00:00"
+
+
+def test_columns_match_formatted_rows(halley_elements):
+    series = comet_ephemeris_service.calculate_comet_series('Halley', datetime(1986, 3, 1), 30)
+    parsed = parse_comet_series(series["data"])["columns"]
+
+    assert len(series["data"]) == 31
+    np.testing.assert_array_equal(parsed["time"], series["columns"]["time"])
+    for name, tolerance in (("ra", 0.01 / 3600), ("dec", 0.1 / 3600), ("delta", 1e-11), ("deldot", 1e-6)):
+        np.testing.assert_allclose(parsed[name], series["columns"][name], rtol=0, atol=tolerance)
+
+
+def test_dates_outside_validity_window_are_rejected(halley_elements, monkeypatch):
+    monkeypatch.setattr(comet_ephemeris_service, 'COMET_ELEMENTS_VALID_YEARS', 2)
+
+    assert "error" in comet_ephemeris_service.calculate_comet_series('Halley', datetime(1990, 1, 1), 30)
+    assert "error" in comet_ephemeris_service.calculate_comet_series('Halley', datetime(1987, 12, 1), 180)
+    assert "error" not in comet_ephemeris_service.calculate_comet_series('Halley', datetime(1987, 12, 1), 30)
+
+
+def test_series_falls_back_to_horizons_outside_window(halley_elements, monkeypatch):
+    requests = []
+
+    def fake_events(comet_name, date, range_days):
+        requests.append((date, range_days))
+        return {"error": "unreachable"}
+
+    monkeypatch.setattr(comet_series_service, 'COMET_EPHEMERIS_SOURCE', 'elements')
+    monkeypatch.setattr(comet_series_service, 'get_comet_approach_events', fake_events)
+    monkeypatch.setattr(comet_series_service, '_comet_series', {})
+
+    assert "error" not in comet_series_service.get_comet_approach_series('Halley', datetime(1986, 3, 1), 10)
+    assert requests == []
+
+    comet_series_service.get_comet_approach_series('Halley', datetime(2061, 7, 1), 10)
+    assert requests == [(datetime(2061, 7, 1), 10)]
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    engine.select_count = 0
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def count_selects(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith('SELECT'):
+            engine.select_count += 1
+
+    Session.remove()
+    Session.configure(bind=engine)
+    monkeypatch.setattr(db_utils.time, 'sleep', lambda seconds: None)  # retry_execute 재시도 대기 생략
+    monkeypatch.setattr(comet_elements_service, '_elements', {})
+    monkeypatch.setattr(comet_elements_service, '_elements_loaded', False)
+    monkeypatch.setattr(comet_elements_service, '_elements_retry_at', 0.0)
+    yield engine
+    Session.remove()
+    engine.dispose()
+
+
+def test_failed_elements_load_backs_off_before_querying_again(engine):
+    # 테이블이 없어 조회가 실패하는 경우
+    assert comet_elements_service.load_comet_elements() == {}
+    failed_selects = engine.select_count
+    assert failed_selects > 0
+
+    # 대기 시간 동안에는 DB를 다시 조회하지 않음
+    assert comet_elements_service.load_comet_elements() == {}
+    assert engine.select_count == failed_selects
+
+    # 대기 시간이 지나면 다시 적재
+    CometElements.__table__.create(engine)
+    comet_elements_service.store_comet_elements([HALLEY_1986])
+    comet_elements_service._elements.clear()
+    comet_elements_service._elements_retry_at = 0.0
+    assert comet_elements_service.load_comet_elements()["1P"]["epoch_jd"] == HALLEY_1986["epoch_jd"]
+    assert comet_elements_service._elements_loaded
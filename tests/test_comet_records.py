@@ -0,0 +1,67 @@
+# tests/test_comet_records.py
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+
+from conftest import require_ephemeris
+
+require_ephemeris()
+
+from app.db import db_utils  # noqa: E402
+from app.db.session_manager import Session  # noqa: E402
+from app.models import CometRecord  # noqa: E402
+from app.services.comets import comet_record_service  # noqa: E402
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    engine.select_count = 0
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def count_selects(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith('SELECT'):
+            engine.select_count += 1
+
+    Session.remove()
+    Session.configure(bind=engine)
+    monkeypatch.setattr(db_utils.time, 'sleep', lambda seconds: None)  # retry_execute 재시도 대기 생략
+    monkeypatch.setattr(comet_record_service, '_record_numbers', {})
+    monkeypatch.setattr(comet_record_service, '_record_numbers_loaded', False)
+    monkeypatch.setattr(comet_record_service, '_record_numbers_retry_at', 0.0)
+    yield engine
+    Session.remove()
+    engine.dispose()
+
+
+def test_failed_load_backs_off_before_querying_again(engine):
+    # 테이블이 없어 조회가 실패하는 경우
+    assert comet_record_service.get_stored_comet_record_number('1P') is None
+    failed_selects = engine.select_count
+    assert failed_selects > 0
+
+    # 대기 시간 동안에는 DB를 다시 조회하지 않음
+    assert comet_record_service.get_stored_comet_record_number('1P') is None
+    assert engine.select_count == failed_selects
+
+    # 대기 시간이 지나면 다시 적재
+    CometRecord.__table__.create(engine)
+    comet_record_service.store_comet_record_numbers([{"designation": "1P", "record_number": "90000030",
+                                                      "epoch_year": 1986}])
+    comet_record_service._record_numbers.clear()
+    comet_record_service._record_numbers_retry_at = 0.0
+    assert comet_record_service.get_stored_comet_record_number('1P') == "90000030"
+    assert comet_record_service._record_numbers_loaded
+
+
+def test_records_are_loaded_once(engine):
+    CometRecord.__table__.create(engine)
+    comet_record_service.store_comet_record_numbers([{"designation": "8P", "record_number": "90000176",
+                                                      "epoch_year": 2021}])
+    comet_record_service._record_numbers.clear()
+
+    assert comet_record_service.get_stored_comet_record_number('8P') == "90000176"
+    selects = engine.select_count
+    assert comet_record_service.get_stored_comet_record_number('1P') is None
+    assert engine.select_count == selects
@@ -0,0 +1,123 @@
+# tests/test_comet_series.py
+
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from conftest import require_ephemeris
+
+require_ephemeris()
+
+from app.services.comets import analyze_comet_data, analyze_comet_series, comet_series_service  # noqa: E402
+from app.services.comets.comet_series_service import find_missing_ranges  # noqa: E402
+
+
+def covered(*days):
+    return {date(2024, 1, day): None for day in days}
+
+
+def test_nothing_covered_returns_whole_range():
+    assert find_missing_ranges({}, date(2024, 1, 1), date(2024, 1, 10)) == [(date(2024, 1, 1), date(2024, 1, 10))]
+
+
+def test_fully_covered_returns_nothing():
+    assert find_missing_ranges(covered(*range(1, 11)), date(2024, 1, 1), date(2024, 1, 10)) == []
+
+
+def test_gaps_at_start_middle_and_end():
+    days = covered(3, 4, 5, 8)
+
+    assert find_missing_ranges(days, date(2024, 1, 1), date(2024, 1, 10)) == [
+        (date(2024, 1, 1), date(2024, 1, 2)),
+        (date(2024, 1, 6), date(2024, 1, 7)),
+        (date(2024, 1, 9), date(2024, 1, 10)),
+    ]
+
+
+def test_single_day_range():
+    assert find_missing_ranges({}, date(2024, 1, 5), date(2024, 1, 5)) == [(date(2024, 1, 5), date(2024, 1, 5))]
+    assert find_missing_ranges(covered(5), date(2024, 1, 5), date(2024, 1, 5)) == []
+
+
+def make_rows(start, deldots, deltas):
+    """일별 Horizons 형식 행과 같은 값의 열 배열을 만드는 함수"""
+    times = np.datetime64(start) + np.arange(len(deltas))
+    rows = [
+        {
+            "comet_name": "Test",
+            "time": day.astype(datetime).strftime('%Y-%b-%d 00:00'),
+            "ra": f"{index:02d} 30 00.00",
+            "dec": f"-00 {index:02d} 00.0",
+            "delta": f"{delta:.6f}",
+            "deldot": f"{deldot:.4f}",
+            "s-o-t": "90.0000"
+        }
+        for index, (day, delta, deldot) in enumerate(zip(times, deltas, deldots))
+    ]
+    columns = {
+        "time": times.astype('datetime64[m]'),
+        "ra": np.arange(len(deltas)) + 0.5,
+        "dec": -np.arange(len(deltas)) / 60,
+        "delta": np.array(deltas, dtype=float),
+        "deldot": np.array(deldots, dtype=float),
+        "s-o-t": np.full(len(deltas), 90.0),
+        "skipped": 0
+    }
+    return rows, columns
+
+
+def test_analysis_reports_next_approach_with_column_coordinates():
+    rows, columns = make_rows('2024-01-01', [-1.0, 2.0, 1.0, -3.0], [0.5, 0.2, 0.3, 0.4])
+
+    analyzed = analyze_comet_series({"data": rows, "columns": columns})
+
+    assert analyzed["closest_approach"]["time"] == "2024-Jan-02 00:00"
+    assert analyzed["detection"]["status"] == "receding"
+    next_approach = analyzed["detection"]["next_closest_approach"]
+    assert next_approach["time"] == "2024-Jan-04 00:00"
+    assert next_approach["converted_ra"] == 3.5
+    assert next_approach["converted_dec"] == pytest.approx(-0.05)
+    # 반환한 접근 이벤트는 복사본
+    assert "converted_ra" not in rows[3]
+
+
+def test_analysis_of_rows_matches_columns():
+    rows, columns = make_rows('2024-01-01', [-1.0, -0.5, -0.2], [0.5, 0.4, 0.3])
+
+    from_rows = analyze_comet_data(list(reversed(rows)))
+    from_columns = analyze_comet_series({"data": rows, "columns": columns})
+
+    assert from_rows == from_columns
+    assert from_columns["detection"]["status"] == "closing"
+    assert from_columns["closest_approach"]["converted_dec"] == pytest.approx(-2 / 60)
+
+
+def test_analysis_without_rows_returns_error():
+    assert "error" in analyze_comet_series({"data": [], "columns": {}})
+    assert "error" in analyze_comet_data([])
+
+
+def test_horizons_series_is_stitched_with_columns(monkeypatch):
+    rows, columns = make_rows('2024-01-01', np.linspace(-1, 1, 11), np.linspace(0.5, 0.6, 11))
+    requests = []
+
+    def fake_events(comet_name, date, range_days):
+        requests.append((date.date(), range_days))
+        first = (date.date() - datetime(2024, 1, 1).date()).days
+        selected = slice(first, first + range_days + 1)
+        return {"data": rows[selected], "columns": {name: values[selected] if name != "skipped" else 0
+                                                    for name, values in columns.items()}}
+
+    monkeypatch.setattr(comet_series_service, 'COMET_EPHEMERIS_SOURCE', 'horizons')
+    monkeypatch.setattr(comet_series_service, 'get_comet_approach_events', fake_events)
+    monkeypatch.setattr(comet_series_service, '_comet_series', {})
+
+    comet_series_service.get_comet_approach_series('Test', datetime(2024, 1, 4), 3)
+    series = comet_series_service.get_comet_approach_series('Test', datetime(2024, 1, 1), 10)
+
+    # 두 번째 요청은 빠진 앞뒤 구간만 가져옴
+    assert requests == [(date(2024, 1, 4), 3), (date(2024, 1, 1), 2), (date(2024, 1, 8), 3)]
+    assert series["data"] == rows
+    for name in comet_series_service.SERIES_COLUMNS:
+        np.testing.assert_array_equal(series["columns"][name], columns[name])
@@ -0,0 +1,74 @@
+# tests/test_constellation_visibility.py
+
+import multiprocessing
+from datetime import datetime, timedelta
+
+import pytest
+
+from conftest import require_ephemeris
+
+require_ephemeris()
+
+from app.services.constellation.constellation_visibility_service import (  # noqa: E402
+    calculate_constellation_visibility, calculate_visibility_for_constellations_batched,
+    calculate_visibility_for_constellations_parallel
+)
+
+SEOUL = (37.5665, 126.978)
+
+
+def make_nights(count):
+    nights = []
+    for day in range(count):
+        date = datetime(2024, 10, 1) + timedelta(days=day)
+        nights.append({
+            "date": date.strftime('%Y-%m-%d'),
+            "constellation": "Ori",
+            "sunset": (date + timedelta(hours=9, minutes=day)).isoformat(),
+            "sunrise": (date + timedelta(hours=21, minutes=30 - day)).isoformat(),
+            "offset": 32400,
+            "ra_deg": (300.0 + 7 * day) % 360,
+            "dec_deg": 20.0 + day % 40
+        })
+    return nights
+
+
+@pytest.mark.parametrize("count", [5, 45])
+def test_batched_matches_single_night_calculation(count):
+    nights = make_nights(count)
+
+    batched = calculate_visibility_for_constellations_batched(nights, *SEOUL)
+
+    for night, result in zip(nights, batched):
+        expected = calculate_constellation_visibility(
+            night["date"], night["constellation"], night["sunset"], night["sunrise"], night["offset"],
+            night["ra_deg"], night["dec_deg"], *SEOUL)
+        # 배치 계산은 일주 광행차와 하룻밤 동안의 장동 변화를 생략하므로 (0.3초 미만) 반올림 경계에서만 0.01° 차이
+        assert float(result["max_altitude"][:-1]) == pytest.approx(float(expected["max_altitude"][:-1]), abs=0.011)
+        assert result["azimuth"] == expected["azimuth"]
+        assert result["best_visibility_time"][:5] == expected["best_visibility_time"][:5]
+
+
+def test_batched_keeps_positions_of_error_days():
+    nights = make_nights(3)
+    nights.insert(1, {"date": "2024-10-09", "error": "Failed to calculate constellation"})
+    nights.append({"date": "2024-10-10", "constellation": "Ori", "sunset": "2024-10-10T09:00:00",
+                   "sunrise": "2024-10-10T21:00:00", "offset": 32400, "ra_deg": None, "dec_deg": None})
+
+    results = calculate_visibility_for_constellations_batched(nights, *SEOUL)
+
+    assert [result["date"] for result in results] == [night["date"] for night in nights]
+    assert results[1] == {"date": "2024-10-09", "error": "Failed to calculate constellation"}
+    assert "Missing RA or DEC" in results[-1]["error"]
+    assert all("best_visibility_time" in results[i] for i in (0, 2, 3))
+
+
+def test_parallel_entry_point_runs_in_process(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("a process pool must not be created per request")
+
+    monkeypatch.setattr(multiprocessing, 'Pool', no_pool)
+    nights = make_nights(3)
+
+    assert calculate_visibility_for_constellations_parallel(nights, *SEOUL) == \
+        calculate_visibility_for_constellations_batched(nights, *SEOUL)
@@ -0,0 +1,80 @@
+# tests/test_db_utils.py
+
+import pytest
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table, UniqueConstraint, create_engine, event, \
+    func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.db.db_utils import bulk_upsert
+
+metadata = MetaData()
+
+raw_data = Table(
+    'raw_data', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('planet_name', String(20), nullable=False),
+    Column('reg_date', String(10), nullable=False),
+    Column('altitude', Float),
+    UniqueConstraint('planet_name', 'reg_date')
+)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine('sqlite://')
+    metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    # 실행된 INSERT 문 수 기록 (배치 경계 확인용)
+    session.insert_count = 0
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def count_inserts(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith('INSERT'):
+            session.insert_count += 1
+
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def make_rows(count, altitude):
+    return [{"planet_name": "Mars", "reg_date": f"2024-01-{day + 1:02d}", "altitude": altitude + day}
+            for day in range(count)]
+
+
+def upsert(session, rows, batch_size):
+    processed = bulk_upsert(session, raw_data, rows, ['planet_name', 'reg_date'], ['altitude'],
+                            batch_size=batch_size)
+    session.commit()
+    return processed
+
+
+def test_rerun_updates_rows_without_duplicates(session):
+    assert upsert(session, make_rows(5, 10.0), batch_size=1000) == 5
+    assert upsert(session, make_rows(5, 50.0), batch_size=1000) == 5
+
+    rows = session.execute(select(raw_data.c.reg_date, raw_data.c.altitude).order_by(raw_data.c.reg_date)).all()
+    assert len(rows) == 5
+    assert [altitude for _, altitude in rows] == [50.0, 51.0, 52.0, 53.0, 54.0]
+
+
+@pytest.mark.parametrize("count, batch_size, statements", [(4, 2, 2), (5, 2, 3), (2, 2, 1), (1, 2, 1)])
+def test_rows_are_split_at_batch_boundary(session, count, batch_size, statements):
+    upsert(session, make_rows(count, 10.0), batch_size=batch_size)
+
+    assert session.insert_count == statements
+    assert session.execute(select(func.count()).select_from(raw_data)).scalar() == count
+
+
+def test_partial_overlap_inserts_new_and_updates_existing(session):
+    upsert(session, make_rows(3, 10.0), batch_size=2)
+    upsert(session, make_rows(5, 20.0), batch_size=2)
+
+    altitudes = session.execute(select(raw_data.c.altitude).order_by(raw_data.c.reg_date)).scalars().all()
+    assert altitudes == [20.0, 21.0, 22.0, 23.0, 24.0]
+
+
+def test_empty_rows_execute_nothing(session):
+    assert upsert(session, [], batch_size=2) == 0
+    assert session.insert_count == 0
@@ -0,0 +1,83 @@
+# tests/test_fake_upstream.py
+# 로컬 대체 서버(tests/fake_upstream/server.py)를 실제로 띄워 혜성 요청 한 건을 처리하는 스모크 테스트
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import pytest
+import requests
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from conftest import require_ephemeris
+
+require_ephemeris()
+
+from app.db.session_manager import Session  # noqa: E402
+from app.models import CometRecord  # noqa: E402
+from app.services import horizons_service, horizons_cache_service  # noqa: E402
+from app.services.comets import comet_record_service  # noqa: E402
+
+SERVER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fake_upstream', 'server.py')
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def fake_upstream(monkeypatch):
+    port = free_port()
+    process = subprocess.Popen([sys.executable, SERVER_PATH, '--port', str(port)],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    base_url = f'http://127.0.0.1:{port}'
+    try:
+        for _ in range(100):
+            try:
+                requests.get(f'{base_url}/_fake/stats', timeout=1)
+                break
+            except requests.ConnectionError:
+                time.sleep(0.1)
+        else:
+            pytest.fail("fake upstream server did not start")
+
+        monkeypatch.setattr(horizons_service, 'HORIZONS_API_URL', f'{base_url}/api/horizons.api')
+        monkeypatch.setattr(horizons_cache_service, 'HORIZONS_CACHE_ENABLED', False)
+        yield base_url
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+@pytest.fixture
+def comet_records_db(monkeypatch):
+    engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    CometRecord.__table__.create(engine)
+    Session.remove()
+    Session.configure(bind=engine)
+    monkeypatch.setattr(comet_record_service, '_record_numbers', {})
+    monkeypatch.setattr(comet_record_service, '_record_numbers_loaded', False)
+    yield engine
+    Session.remove()
+    engine.dispose()
+
+
+def test_comet_approach_request_through_fake_upstream(fake_upstream, comet_records_db):
+    result = horizons_service.get_comet_approach_events('Halley', datetime(1986, 4, 1), 20)
+
+    assert "error" not in result
+    assert len(result["data"]) == 21
+    assert result["data"][0]["time"] == "1986-Apr-01 00:00"
+    assert result["columns"]["skipped"] == 0
+    assert result["columns"]["delta"].shape == (21,)
+
+    # 레코드 번호 검색 1건 + 천체력 1건, 레코드 번호는 DB에 저장됨
+    stats = requests.get(f'{fake_upstream}/_fake/stats', timeout=5).json()
+    assert stats["requests"] == 2
+    assert comet_record_service.get_stored_comet_record_number('1P')
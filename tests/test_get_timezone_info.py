@@ -0,0 +1,61 @@
+# tests/test_get_timezone_info.py
+
+from datetime import datetime, timezone
+
+import pytest
+from conftest import require_ephemeris
+
+require_ephemeris()
+
+from app.services import get_timezone_info as timezone_info_module  # noqa: E402
+
+SUMMER_2024 = int(datetime(2024, 7, 1, tzinfo=timezone.utc).timestamp())
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.text = str(payload)
+
+    def json(self):
+        return self.payload
+
+
+@pytest.fixture
+def google_requests(monkeypatch):
+    calls = []
+
+    def fake_get(url, params=None, timeout=None):
+        calls.append({"url": url, "params": params, "timeout": timeout})
+        return FakeResponse({"status": "OK", "timeZoneId": "Etc/GMT", "timeZoneName": "GMT",
+                             "rawOffset": 0, "dstOffset": 0})
+
+    monkeypatch.setattr(timezone_info_module, 'TIMEZONE_RESOLVER', 'local')
+    monkeypatch.setattr(timezone_info_module.requests, 'get', fake_get)
+    monkeypatch.setenv('GOOGLE_TIMEZONE_API_KEY', 'test-key')
+    return calls
+
+
+def test_known_coordinate_resolves_locally(google_requests):
+    pytest.importorskip("timezonefinder")
+
+    info = timezone_info_module.get_timezone_info.uncached(40.7128, -74.006, SUMMER_2024)
+
+    assert info["timeZoneId"] == "America/New_York"
+    assert info["rawOffset"] == -5 * 3600
+    assert info["dstOffset"] == 3600
+    assert google_requests == []
+
+
+def test_unresolved_coordinate_falls_back_to_google(google_requests, monkeypatch):
+    monkeypatch.setattr(timezone_info_module, 'resolve_timezone_id', lambda lat, lon: None)
+
+    info = timezone_info_module.get_timezone_info.uncached(0.0, -150.0, SUMMER_2024)
+
+    assert info["timeZoneId"] == "Etc/GMT"
+    assert len(google_requests) == 1
+    assert google_requests[0]["params"]["location"] == "0.0,-150.0"
+    assert google_requests[0]["timeout"] == (timezone_info_module.GOOGLE_TIMEZONE_CONNECT_TIMEOUT,
+                                             timezone_info_module.GOOGLE_TIMEZONE_READ_TIMEOUT)
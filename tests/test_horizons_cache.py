@@ -0,0 +1,131 @@
+# tests/test_horizons_cache.py
+
+import os
+
+import pytest
+
+from conftest import require_ephemeris
+
+require_ephemeris()
+
+from app.services import horizons_cache_service as cache_service  # noqa: E402
+from app.services import horizons_service  # noqa: E402
+
+
+def ephemeris_params(day):
+    return {"format": "json", "COMMAND": "'499'", "MAKE_EPHEM": "YES", "START_TIME": f"'2024-01-{day:02d}'"}
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_service, 'HORIZONS_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(cache_service, '_index', {})
+    monkeypatch.setattr(cache_service, '_index_loaded', False)
+    monkeypatch.setattr(cache_service, '_total_bytes', 0)
+    monkeypatch.setattr(cache_service, '_written_since_scan', 0)
+    monkeypatch.setattr(cache_service, '_cache_stats', dict.fromkeys(cache_service._cache_stats, 0))
+    return tmp_path
+
+
+def store(day, body="x" * 2000):
+    cache_service.store_horizons_response(ephemeris_params(day), 200, 'application/json', 'http://test', body)
+
+
+def set_last_used(day, timestamp):
+    path = cache_service._cache_path(cache_service.horizons_cache_key(ephemeris_params(day)))
+    os.utime(path, (timestamp, timestamp))
+    cache_service._index[cache_service.horizons_cache_key(ephemeris_params(day))] = (os.path.getsize(path), timestamp)
+
+
+def test_round_trip(cache_dir):
+    store(1, body='{"result": "$$SOE"}')
+
+    cached = cache_service.get_cached_horizons_response(ephemeris_params(1))
+
+    assert cached == {"status_code": 200, "content_type": "application/json", "url": "http://test",
+                      "body": '{"result": "$$SOE"}'}
+    assert cache_service.get_cached_horizons_response(ephemeris_params(2)) is None
+
+
+def test_least_recently_used_entry_is_evicted(cache_dir, monkeypatch):
+    for day in (1, 2, 3):
+        store(day)
+    for day, timestamp in ((1, 1000), (2, 2000), (3, 3000)):
+        set_last_used(day, timestamp)
+
+    # 1일 응답을 사용해 가장 최근 사용으로 갱신
+    assert cache_service.get_cached_horizons_response(ephemeris_params(1)) is not None
+
+    # 항목 3개 크기만 허용 → 4번째 저장 시 가장 오래 사용하지 않은 2일 응답부터 삭제
+    entry_size = max(size for size, _ in cache_service._index.values())
+    monkeypatch.setattr(cache_service, 'HORIZONS_CACHE_MAX_BYTES', entry_size * 3 + entry_size // 2)
+    store(4)
+
+    assert cache_service.get_cached_horizons_response(ephemeris_params(2)) is None
+    for day in (1, 3, 4):
+        assert cache_service.get_cached_horizons_response(ephemeris_params(day)) is not None
+    assert cache_service.get_horizons_cache_stats()["evictions"] == 1
+
+
+def test_hit_survives_entry_removed_after_read(cache_dir, monkeypatch):
+    store(1)
+
+    def removed(path, times=None):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(cache_service.os, 'utime', removed)
+
+    assert cache_service.get_cached_horizons_response(ephemeris_params(1)) is not None
+
+
+def test_failed_write_leaves_no_temp_file(cache_dir, monkeypatch):
+    def failing_dump(obj, f):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cache_service.json, 'dump', failing_dump)
+    store(1)
+
+    files = [name for _, _, names in os.walk(cache_dir) for name in names]
+    assert files == []
+    assert cache_service.get_horizons_cache_stats()["errors"] == 1
+
+
+def test_writes_from_other_workers_count_toward_the_limit(cache_dir, monkeypatch):
+    for day in (1, 2, 3):
+        store(day)
+    for day, timestamp in ((1, 1000), (2, 2000), (3, 3000)):
+        set_last_used(day, timestamp)
+    entry_size = max(size for size, _ in cache_service._index.values())
+
+    # 다른 워커: 디렉터리가 비어 있을 때 인덱스를 구성해 위 3개 항목을 모르는 상태
+    monkeypatch.setattr(cache_service, '_index', {})
+    monkeypatch.setattr(cache_service, '_total_bytes', 0)
+    monkeypatch.setattr(cache_service, '_written_since_scan', 0)
+    monkeypatch.setattr(cache_service, 'HORIZONS_CACHE_MAX_BYTES', entry_size * 3 + entry_size // 2)
+    store(4)
+
+    # 디렉터리를 다시 훑어 실제 크기 기준으로 가장 오래 사용하지 않은 1일 응답 삭제
+    assert cache_service.get_cached_horizons_response(ephemeris_params(1)) is None
+    total_bytes = sum(os.path.getsize(os.path.join(root, name))
+                      for root, _, names in os.walk(cache_dir) for name in names)
+    assert total_bytes <= cache_service.HORIZONS_CACHE_MAX_BYTES
+    assert cache_service.get_horizons_cache_stats()["total_bytes"] == total_bytes
+
+
+def test_error_bodies_are_not_cached(cache_dir, monkeypatch):
+    bodies = iter(['{"error": "Cannot interpret date"}', '{"result": "$$SOE"}'])
+
+    def fake_fetch(params):
+        response = horizons_service.requests.Response()
+        response.status_code = 200
+        response.encoding = 'utf-8'
+        response._content = next(bodies).encode('utf-8')
+        return response
+
+    monkeypatch.setattr(horizons_service, 'fetch_horizons', fake_fetch)
+
+    assert "error" in horizons_service.request_horizons(ephemeris_params(1)).json()
+    assert cache_service.get_cached_horizons_response(ephemeris_params(1)) is None
+
+    assert horizons_service.request_horizons(ephemeris_params(1)).json() == {"result": "$$SOE"}
+    assert cache_service.get_cached_horizons_response(ephemeris_params(1))["body"] == '{"result": "$$SOE"}'
@@ -0,0 +1,75 @@
+# tests/test_horizons_utils.py
+
+import numpy as np
+import pytest
+
+from conftest import require_ephemeris
+
+require_ephemeris()
+
+from app.services.horizons_utils import parse_horizons_ephemeris  # noqa: E402
+
+COMET_RESULT = """*******************************************************************************
+ Date__(UT)__HR:MN     R.A._____(ICRF)_____DEC  R.A.__(a-apparent)__DEC            r        rdot            delta      deldot    S-O-T /r
+$$SOE
+ 1986-Apr-10 00:00     16 36 49.61 -45 38 40.4  16 38 04.92 -45 41 09.7  1.2330 22.5 0.41847 -0.73   115.01 /L
+ 1986-Apr-11 00:00     16 26 22.05 -46 51 40.1  16 27 39.96 -46 54 06.6  1.2495 22.6 0.41739 -0.13   116.75 /L
+ 1986-Apr-12 00:00     16 14 17.33 -00 06 26.8  16 15 38.14 -00 08 50.7  1.2659 22.7 0.41745 n.a.    118.41 /L
+ short row
+$$EOE
+*******************************************************************************
+"""
+
+PLANET_RESULT = """$$SOE
+ 2025-Jan-01 00:00     07 57 05.41 +26 01 54.8  0.64289  -2.71   155.42 /L
+ 2025-Jan-02 00:00     07 54 29.37 +26 07 38.9  0.64174  -2.56   156.93 /L
+$$EOE
+"""
+
+
+def test_comet_layout_columns():
+    parsed = parse_horizons_ephemeris(COMET_RESULT, 'comet')
+
+    np.testing.assert_array_equal(parsed["time"], np.array(['1986-04-10T00:00', '1986-04-11T00:00',
+                                                            '1986-04-12T00:00'], dtype='datetime64[m]'))
+    assert parsed["ra"][0] == pytest.approx(16 + 36 / 60 + 49.61 / 3600)
+    assert parsed["dec"][1] == pytest.approx(-(46 + 51 / 60 + 40.1 / 3600))
+    np.testing.assert_allclose(parsed["delta"], [0.41847, 0.41739, 0.41745])
+    np.testing.assert_allclose(parsed["s-o-t"], [115.01, 116.75, 118.41])
+    assert parsed["skipped"] == 1
+    assert "text" not in parsed
+
+
+def test_negative_zero_degree_declination_keeps_sign():
+    parsed = parse_horizons_ephemeris(COMET_RESULT, 'comet')
+
+    assert parsed["dec"][2] == pytest.approx(-(6 / 60 + 26.8 / 3600))
+
+
+def test_unavailable_values_become_nan():
+    parsed = parse_horizons_ephemeris(COMET_RESULT, 'comet')
+
+    assert parsed["deldot"][:2].tolist() == [-0.73, -0.13]
+    assert np.isnan(parsed["deldot"][2])
+    assert parsed["delta"][2] == pytest.approx(0.41745)
+
+
+def test_planet_layout_with_text():
+    parsed = parse_horizons_ephemeris(PLANET_RESULT, 'planet', keep_text=True)
+
+    assert parsed["dec"].tolist() == pytest.approx([26 + 1 / 60 + 54.8 / 3600, 26 + 7 / 60 + 38.9 / 3600])
+    np.testing.assert_allclose(parsed["deldot"], [-2.71, -2.56])
+    assert parsed["skipped"] == 0
+    assert parsed["text"]["time"] == ["2025-Jan-01 00:00", "2025-Jan-02 00:00"]
+    assert parsed["text"]["ra"] == ["07 57 05.41", "07 54 29.37"]
+    assert parsed["text"]["dec"] == ["+26 01 54.8", "+26 07 38.9"]
+    assert parsed["text"]["delta"] == ["0.64289", "0.64174"]
+
+
+def test_result_without_table_is_empty():
+    parsed = parse_horizons_ephemeris("No ephemeris for target", 'comet', keep_text=True)
+
+    assert parsed["time"].size == 0
+    assert parsed["delta"].size == 0
+    assert parsed["skipped"] == 0
+    assert parsed["text"]["ra"] == []
@@ -0,0 +1,127 @@
+# tests/test_layered_cache.py
+
+import time
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from app.layered_cache import LayeredRedisCache  # noqa: E402
+
+
+def make_cache(server, **kwargs):
+    """같은 가짜 Redis 서버를 쓰는 캐시 (워커 프로세스 하나에 해당)"""
+    cache = LayeredRedisCache(key_prefix="test_", **kwargs)
+    client = fakeredis.FakeRedis(server=server)
+    cache._write_client = cache._read_client = client
+    return cache
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def cache(server):
+    cache = make_cache(server)
+    cache.get("warmup")  # 무효화 구독 스레드 시작
+    assert wait_until(lambda: cache._subscribed)
+    return cache
+
+
+def test_repeated_get_is_served_locally(cache):
+    cache.set("key", {"value": 1})
+    assert cache.get("key") == {"value": 1}  # Redis 적중 후 로컬 저장
+
+    # Redis에서 직접 지워도 로컬 유효 시간 동안은 로컬 값을 반환
+    cache._write_client.delete("test_key")
+    assert cache.get("key") == {"value": 1}
+    assert cache.get_local_stats()["functions"]["other"]["local_hits"] == 1
+
+
+def test_local_cache_evicts_least_recently_used(server):
+    payload = "x" * 100
+    size = len(LayeredRedisCache(key_prefix="test_").serializer.dumps(payload))
+    cache = make_cache(server, local_max_bytes=int(size * 4.5))
+    cache.get("warmup")
+    assert wait_until(lambda: cache._subscribed)
+
+    for key in ("a", "b", "c", "d"):
+        cache.set(key, payload)
+        cache.get(key)
+    cache.get("a")  # a를 가장 최근 사용으로 이동
+    cache.set("e", payload)
+    cache.get("e")
+
+    assert list(cache._local) == ["c", "d", "a", "e"]
+    stats = cache.get_local_stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == size * 4
+
+
+def test_large_entries_are_not_kept_locally(server):
+    cache = make_cache(server, local_max_bytes=1000)
+    cache.get("warmup")
+    assert wait_until(lambda: cache._subscribed)
+
+    cache.set("large", "x" * 500)
+    assert cache.get("large") == "x" * 500
+    assert "large" not in cache._local
+
+
+def test_writes_in_other_process_invalidate_local_entry(server, cache):
+    other = make_cache(server)
+    other.get("warmup")
+    assert wait_until(lambda: other._subscribed)
+
+    cache.set("key", "old")
+    assert cache.get("key") == "old"
+    assert "key" in cache._local
+
+    other.set("key", "new")
+    assert wait_until(lambda: "key" not in cache._local)
+    assert cache.get("key") == "new"
+
+    other.clear()
+    assert wait_until(lambda: not cache._local)
+    assert cache.get("key") is None
+
+
+def test_local_cache_is_bypassed_when_disabled(server):
+    cache = make_cache(server, local_enabled=False)
+
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    assert not cache._local
+    cache._write_client.delete("test_key")
+    assert cache.get("key") is None
+
+
+def test_local_hits_return_independent_copies(cache):
+    cache.set("key", {"values": [1, 2]})
+    first = cache.get("key")
+    first["values"].append(3)  # 호출부에서 결과를 수정해도
+
+    second = cache.get("key")
+    assert second == {"values": [1, 2]}  # 로컬 적중 값에 영향 없음
+    assert second is not cache.get("key")
+    assert cache.get_many("key")[0] == {"values": [1, 2]}
+    assert cache.get_local_stats()["functions"]["other"]["local_hits"] == 2
+
+
+def test_has_starts_subscriber(server):
+    cache = make_cache(server)
+    cache.set("key", "value")
+
+    assert cache.has("key")
+    assert wait_until(lambda: cache._subscribed)
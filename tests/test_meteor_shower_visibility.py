@@ -0,0 +1,59 @@
+# tests/test_meteor_shower_visibility.py
+
+from datetime import datetime, timedelta
+
+import pytest
+from conftest import require_ephemeris
+
+require_ephemeris()
+
+from app.services.comets.commet_utils import calculate_altitude_azimuth  # noqa: E402
+from app.services.comets.meteor_shower_visibility_service import find_best_peak_date  # noqa: E402
+from app.services.moon_phase_service import get_moon_phase_for_date  # noqa: E402
+
+PREFERRED_PHASES = {"New Moon": 15, "Waxing Crescent": 10, "Waning Crescent": 10, "First Quarter": 5,
+                    "Last Quarter": 5, "Waxing Gibbous": -3, "Waning Gibbous": -3, "Full Moon": -5}
+
+
+def per_hour_best_peak(start_date, end_date, ra, dec, distance, latitude, longitude):
+    # 시각마다 고도와 달의 위상을 따로 계산해 점수를 비교하던 기존 계산
+    mid_date = start_date + (end_date - start_date) / 2
+    best_time, best_conditions = None, {"score": -1}
+    current_date = start_date
+    while current_date <= end_date:
+        for hour in range(24):
+            observation_time = current_date + timedelta(hours=hour)
+            altitude, azimuth = calculate_altitude_azimuth(ra, dec, distance, latitude, longitude, 0,
+                                                           observation_time)
+            moon_phase_info = get_moon_phase_for_date(observation_time)
+            altitude_weight = 15 if altitude > 60 else 10 if altitude > 50 else 5 if altitude > 30 else 0
+            score = (altitude + PREFERRED_PHASES.get(moon_phase_info["phase_description"], 0)
+                     + max(0, (1 - moon_phase_info["illumination"]) * 10) + altitude_weight
+                     + max(0, 10 - abs((current_date - mid_date).days)))
+            if score > best_conditions["score"]:
+                best_time = observation_time
+                best_conditions = {"altitude": altitude, "phase_description": moon_phase_info["phase_description"],
+                                   "score": score}
+        current_date += timedelta(days=1)
+    return best_time, best_conditions
+
+
+def test_vectorized_scoring_matches_per_hour_loop():
+    # 페르세우스자리 유성우 복사점, 월 경계를 넘는 피크 기간
+    args = (datetime(2024, 7, 29), datetime(2024, 8, 3), "03 12 00", "+58 00 00", 0.0, 37.5665, 126.978)
+
+    result = find_best_peak_date.uncached(*args)
+    expected_time, expected_conditions = per_hour_best_peak(*args)
+
+    assert result["best_date"] == expected_time
+    assert result["conditions"]["altitude"] == pytest.approx(expected_conditions["altitude"], abs=1e-6)
+    assert result["conditions"]["phase_description"] == expected_conditions["phase_description"]
+    assert result["conditions"]["score"] == pytest.approx(expected_conditions["score"], abs=1e-6)
+
+
+def test_empty_peak_window_has_no_best_date():
+    result = find_best_peak_date.uncached(datetime(2024, 8, 3), datetime(2024, 8, 1), "03 12 00", "+58 00 00",
+                                          0.0, 37.5665, 126.978)
+
+    assert result["best_date"] is None
+    assert result["conditions"]["score"] == -1
@@ -0,0 +1,52 @@
+# tests/test_moon_phase.py
+
+from datetime import datetime, timedelta
+
+import numpy as np
+from conftest import require_ephemeris
+
+require_ephemeris()
+
+from skyfield import almanac  # noqa: E402
+from app.global_resources import ts, planets  # noqa: E402
+from app.services.moon_phase_service import (  # noqa: E402
+    interpolate_moon_phase_degrees, get_moon_phase, get_moon_phase_for_range
+)
+
+# 월령 테이블 보간 허용 오차 (도)
+LUNATION_TOLERANCE_DEG = 0.1
+
+
+def angle_errors(actual, expected):
+    # 0/360 경계를 고려한 각도 차이
+    return np.mod(actual - expected + 180.0, 360.0) - 180.0
+
+
+def test_interpolated_phase_matches_skyfield_within_tolerance():
+    # 10년 구간 경계(2029 → 2030)를 포함해 약 2.3일 간격으로 비교
+    times = ts.tt_jd(np.linspace(ts.utc(2028, 1, 1).tt, ts.utc(2031, 12, 31).tt, 600))
+
+    interpolated = interpolate_moon_phase_degrees(times)
+    expected = almanac.moon_phase(planets, times).degrees
+
+    assert np.max(np.abs(angle_errors(interpolated, expected))) < LUNATION_TOLERANCE_DEG
+
+
+def test_interpolated_phase_is_within_0_and_360():
+    times = ts.utc(2024, 1, np.arange(1, 60))
+
+    degrees = interpolate_moon_phase_degrees(times)
+
+    assert np.all((degrees >= 0) & (degrees < 360))
+
+
+def test_range_matches_single_date_for_every_day():
+    # 연도/10년 구간 경계를 넘는 범위
+    start_date = datetime(2029, 12, 20)
+    end_date = datetime(2030, 1, 20)
+
+    range_result = get_moon_phase_for_range(start_date, end_date)
+
+    assert len(range_result) == (end_date - start_date).days + 1
+    for offset, day_result in enumerate(range_result):
+        assert day_result == get_moon_phase(start_date + timedelta(days=offset))
@@ -0,0 +1,61 @@
+# tests/test_planet_event_backfill.py
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from conftest import require_ephemeris
+
+require_ephemeris()
+
+from app.db import db_utils  # noqa: E402
+from app.db.session_manager import Session  # noqa: E402
+from app.models import PlanetEphemeris  # noqa: E402
+from app.services.planets import planet_event_storage_service as storage_service  # noqa: E402
+from app.services.planets.planet_opposition_service import predict_opposition_events  # noqa: E402
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    PlanetEphemeris.__table__.create(engine)
+    # 인덱스 테이블 추가 이전에 적재된 원시 데이터 (2023년, 2024년 일부)
+    with engine.begin() as connection:
+        connection.execute(PlanetEphemeris.__table__.insert(), [
+            {"planet_name": planet, "reg_date": start + timedelta(days=day), "distance": 1.0, "s_o_t": 90.0}
+            for planet in storage_service.RAW_DATA_PLANETS
+            for start in (date(2023, 12, 30), date(2024, 6, 1))
+            for day in range(3)
+        ])
+
+    monkeypatch.setattr(db_utils.time, 'sleep', lambda s: None)
+    Session.remove()
+    Session.configure(bind=engine)
+    yield engine
+    Session.remove()
+    engine.dispose()
+
+
+def test_backfill_fills_years_without_events(engine, monkeypatch):
+    detected = []
+    detect_planet_events = storage_service.detect_planet_events
+
+    def counting_detect(planet_name, year):
+        detected.append((planet_name, year))
+        return detect_planet_events(planet_name, year)
+
+    monkeypatch.setattr(storage_service, 'detect_planet_events', counting_detect)
+
+    storage_service.backfill_planet_events()
+
+    assert sorted({year for _, year in detected}) == [2023, 2024]
+    jupiter = predict_opposition_events.uncached('Jupiter', 2023)
+    opposition = next(event for event in jupiter if event["event_type"] == "planet opposition")
+    assert opposition["closest_date"] == "2023-11-03"
+
+    # 이미 채워진 연도는 다시 계산하지 않음
+    detected.clear()
+    storage_service.backfill_planet_events()
+    assert detected == []
@@ -0,0 +1,56 @@
+# tests/test_planet_routes.py
+
+import pytest
+from flask import Flask
+from conftest import require_ephemeris
+
+require_ephemeris()
+
+from app.routes import planet_routes  # noqa: E402
+from app.services.planets.planet_event_storage_service import get_raw_data_year_range  # noqa: E402
+
+
+@pytest.fixture
+def client(monkeypatch):
+    updated = []
+    monkeypatch.setattr(planet_routes, 'update_raw_data', updated.append)
+    app = Flask(__name__)
+    app.register_blueprint(planet_routes.planet_blueprint)
+    client = app.test_client()
+    client.updated = updated
+    return client
+
+
+def test_raw_data_update_accepts_range_within_limits(client):
+    first_year, _ = get_raw_data_year_range()
+
+    response = client.post('/api/planets/update_raw_data',
+                           query_string={"start_year": first_year, "end_year": first_year + 49})
+
+    assert response.status_code == 200
+    assert client.updated == [list(range(first_year, first_year + 50))]
+
+
+@pytest.mark.parametrize("offsets", [
+    (0, 50),  # 51년
+    (5, 4),  # 종료 연도가 시작 연도보다 앞섬
+])
+def test_raw_data_update_rejects_invalid_span(client, offsets):
+    first_year, _ = get_raw_data_year_range()
+
+    response = client.post('/api/planets/update_raw_data',
+                           query_string={"start_year": first_year + offsets[0], "end_year": first_year + offsets[1]})
+
+    assert response.status_code == 400
+    assert client.updated == []
+
+
+def test_raw_data_update_rejects_years_outside_ephemeris(client):
+    first_year, last_year = get_raw_data_year_range()
+
+    for start_year, end_year in ((first_year - 1, first_year), (last_year, last_year + 1)):
+        response = client.post('/api/planets/update_raw_data',
+                               query_string={"start_year": start_year, "end_year": end_year})
+        assert response.status_code == 400
+        assert "ephemeris" in response.get_json()["error"]
+    assert client.updated == []
@@ -0,0 +1,95 @@
+# tests/test_planet_visibility.py
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from conftest import require_ephemeris
+
+require_ephemeris()
+
+from skyfield import almanac  # noqa: E402
+from skyfield.api import Topos  # noqa: E402
+from app.data.data import get_skyfield_planet_code  # noqa: E402
+from app.db.session_manager import Session  # noqa: E402
+from app.global_resources import ts, planets, earth  # noqa: E402
+from app.models import PlanetEphemeris  # noqa: E402
+from app.services.planets import planet_visibility_service  # noqa: E402
+from app.services.sunrise_sunset_service import calculate_sunrise_sunset_for_range  # noqa: E402
+
+NEW_YORK = (40.7128, -74.006)
+
+
+@pytest.fixture
+def jupiter_rows(monkeypatch):
+    engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    PlanetEphemeris.__table__.create(engine)
+    with engine.begin() as connection:
+        connection.execute(PlanetEphemeris.__table__.insert(), [
+            {"planet_name": "Jupiter", "reg_date": date(2024, 3, 7) + timedelta(days=day), "distance": 5.1 + day / 100,
+             "s_o_t": 30.0}
+            for day in range(6)
+        ])
+
+    Session.remove()
+    Session.configure(bind=engine)
+    # 타임존 조회 없이 뉴욕 기준 일출/일몰 계산 (날짜별 오프셋은 서비스가 계산)
+    monkeypatch.setattr(planet_visibility_service, 'calculate_sunrise_sunset_for_range',
+                        lambda latitude, longitude, start_date, end_date: calculate_sunrise_sunset_for_range.uncached(
+                            latitude, longitude, start_date, end_date, -18000, 'America/New_York'))
+    yield engine
+    Session.remove()
+    engine.dispose()
+
+
+def test_rise_times_use_each_days_offset_across_dst(jupiter_rows):
+    # 2024-03-10 미국 동부 서머타임 시작 (-05:00 → -04:00)
+    start = datetime(2024, 3, 7)
+
+    results = planet_visibility_service.calculate_planet_info.uncached('Jupiter', *NEW_YORK, start, 6)
+
+    assert [result["offset_sec"] for result in results] == [-18000, -18000, -18000, -14400, -14400, -14400]
+
+    location = Topos(round(NEW_YORK[0], 4), round(NEW_YORK[1], 4))
+    reg_dates = [date(2024, 3, 7) + timedelta(days=day) for day in range(6)]
+    _, _, first_rises = planet_visibility_service.calculate_planet_visibility_for_dates(
+        planets[get_skyfield_planet_code('Jupiter')], location, reg_dates)
+    assert any(result["visible"] for result in results)
+    for result, rise_time in zip(results, first_rises):
+        if result["visible"]:
+            expected = rise_time + timedelta(seconds=result["offset_sec"])
+            assert result["best_time"] == expected.strftime("%H:%M")
+
+
+def per_day_visibility(planet, location, reg_date):
+    # 날짜마다 떠오름/짐을 따로 탐색하던 기존 계산
+    t0 = ts.utc(reg_date.year, reg_date.month, reg_date.day, 0, 0, 0)
+    t1 = ts.utc(reg_date.year, reg_date.month, reg_date.day, 23, 59, 59)
+    times, events = almanac.find_discrete(t0, t1, almanac.risings_and_settings(planets, planet, location))
+    rise_time = next((t.utc_datetime() for t, event in zip(times, events) if event == 1), None)
+    alt, az, _ = (earth + location).at(t0).observe(planet).apparent().altaz()
+    return alt.degrees, az.degrees, rise_time
+
+
+@pytest.mark.parametrize("planet_name, latitude, longitude", [
+    ('Mars', 37.5665, 126.978),
+    ('Jupiter', 40.7128, -74.006),
+])
+def test_range_search_matches_per_day_search(planet_name, latitude, longitude):
+    planet = planets[get_skyfield_planet_code(planet_name)]
+    location = Topos(latitude, longitude)
+    reg_dates = [date(2024, 1, 28) + timedelta(days=day) for day in range(8)]  # 월 경계
+
+    altitudes, azimuths, first_rises = planet_visibility_service.calculate_planet_visibility_for_dates(
+        planet, location, reg_dates)
+
+    for reg_date, altitude, azimuth, rise_time in zip(reg_dates, altitudes, azimuths, first_rises):
+        expected_altitude, expected_azimuth, expected_rise = per_day_visibility(planet, location, reg_date)
+        assert altitude == pytest.approx(expected_altitude, abs=1e-9)
+        assert azimuth == pytest.approx(expected_azimuth, abs=1e-9)
+        assert (rise_time is None) == (expected_rise is None)
+        if rise_time is not None:
+            # 탐색 구간이 달라 생기는 수치 오차만 허용 (1초)
+            assert abs((rise_time - expected_rise).total_seconds()) < 1
@@ -0,0 +1,97 @@
+# tests/test_sky_tonight.py
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from flask import Flask
+from conftest import require_ephemeris
+
+require_ephemeris()
+
+from skyfield.api import Topos, N, E  # noqa: E402
+from app.data.data import get_skyfield_planet_code  # noqa: E402
+from app.global_resources import ts, planets, earth, moon, constellation_map  # noqa: E402
+from app.routes import sky_routes  # noqa: E402
+from app.services import sky_tonight_service  # noqa: E402
+from app.services.directions_utils import azimuth_to_direction  # noqa: E402
+from app.services.moon_phase_service import get_moon_phase_for_date  # noqa: E402
+from app.services.sunrise_sunset_service import calculate_sunrise_sunset_for_range  # noqa: E402
+from app.services.timezone_conversion_service import convert_utc_to_local_time  # noqa: E402
+
+SEOUL = (37.5665, 126.978)
+NIGHT = datetime(2024, 8, 12)
+
+
+@pytest.fixture(autouse=True)
+def seoul_sunrise_sunset(monkeypatch):
+    # 타임존 조회 없이 서울 기준 일출/일몰 계산
+    monkeypatch.setattr(sky_tonight_service, 'calculate_sunrise_sunset_for_range',
+                        lambda latitude, longitude, start_date, end_date: calculate_sunrise_sunset_for_range.uncached(
+                            latitude, longitude, start_date, end_date, 32400, 'Asia/Seoul'))
+
+
+def per_body_tonight(body, location, sunset, sunrise, offset_sec):
+    # 천체마다 관측자 위치를 따로 계산하는 방식
+    sunset_utc = sunset - timedelta(seconds=offset_sec)
+    minutes = np.arange(0, (sunrise - sunset).total_seconds() / 60 + 1e-9, sky_tonight_service.SKY_TONIGHT_STEP_MINUTES)
+    t = ts.utc(sunset_utc.year, sunset_utc.month, sunset_utc.day, sunset_utc.hour, sunset_utc.minute + minutes,
+               sunset_utc.second)
+    apparent = (earth + location).at(t).observe(body).apparent()
+    alt, az, distance = apparent.altaz()
+    best = int(np.argmax(alt.degrees))
+    return {
+        "max_altitude": f"{alt.degrees[best]:.2f}°",
+        "best_time": convert_utc_to_local_time(t[best].utc_datetime(), offset_sec).strftime("%H:%M"),
+        "azimuth": azimuth_to_direction(float(az.degrees[best])),
+        "constellation": str(constellation_map(apparent[best])),
+        "distance_to_earth": f"{distance.au[best]:.4f} AU",
+        "visible": bool(alt.degrees[best] > 0),
+    }
+
+
+def test_sky_tonight_matches_per_body_observation():
+    result = sky_tonight_service.get_sky_tonight.uncached(*SEOUL, NIGHT)
+
+    location = Topos(SEOUL[0] * N, SEOUL[1] * E)
+    sunset = datetime.fromisoformat(result["sunset"]).replace(tzinfo=None)
+    sunrise = datetime.fromisoformat(result["sunrise"]).replace(tzinfo=None)
+    assert sunset.date() == NIGHT.date() and sunrise.date() == NIGHT.date() + timedelta(days=1)
+
+    assert [body["name"] for body in result["planets"]] == sky_tonight_service.SKY_TONIGHT_PLANETS
+    for body in result["planets"]:
+        expected = per_body_tonight(planets[get_skyfield_planet_code(body["name"])], location, sunset, sunrise,
+                                    32400)
+        if not expected["visible"]:
+            expected["best_time"] = "N/A"
+        assert {key: body[key] for key in expected} == expected
+
+    expected_moon = per_body_tonight(moon, location, sunset, sunrise, 32400)
+    if not expected_moon["visible"]:
+        expected_moon["best_time"] = "N/A"
+    assert {key: result["moon"][key] for key in expected_moon} == expected_moon
+    assert result["moon"]["phase_description"] == get_moon_phase_for_date(NIGHT)["phase_description"]
+
+    # 천정 별자리: 밤 한가운데 시점의 고도 90° 방향
+    zenith_time = datetime.strptime(f"{NIGHT:%Y-%m-%d} {result['constellation']['time']}", "%Y-%m-%d %H:%M")
+    if zenith_time < sunset:
+        zenith_time += timedelta(days=1)
+    zenith_utc = zenith_time - timedelta(seconds=32400)
+    t = ts.utc(zenith_utc.year, zenith_utc.month, zenith_utc.day, zenith_utc.hour, zenith_utc.minute)
+    zenith = (earth + location).at(t).from_altaz(alt_degrees=90, az_degrees=0)
+    assert result["constellation"]["zenith"] == str(constellation_map(zenith))
+
+
+def test_tonight_route_returns_service_result(monkeypatch):
+    monkeypatch.setattr(sky_routes, 'get_sky_tonight', sky_tonight_service.get_sky_tonight.uncached)
+    app = Flask(__name__)
+    app.register_blueprint(sky_routes.sky_blueprint)
+    client = app.test_client()
+
+    response = client.get('/api/sky/tonight', query_string={"lat": SEOUL[0], "lon": SEOUL[1], "date": "2024-08-12"})
+
+    assert response.status_code == 200
+    assert response.get_json() == sky_tonight_service.get_sky_tonight.uncached(*SEOUL, NIGHT)
+
+    response = client.get('/api/sky/tonight', query_string={"lon": SEOUL[1]})
+    assert response.status_code == 400
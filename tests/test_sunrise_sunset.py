@@ -0,0 +1,61 @@
+# tests/test_sunrise_sunset.py
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from conftest import require_ephemeris
+
+require_ephemeris()
+
+from skyfield import almanac  # noqa: E402
+from skyfield.api import Topos, N, E  # noqa: E402
+from app.global_resources import ts, planets  # noqa: E402
+from app.services.sunrise_sunset_service import find_sunrise_sunset_events  # noqa: E402
+from app.services.timezone_conversion_service import get_daily_utc_offsets  # noqa: E402
+
+
+def per_day_events(location, date, offset):
+    # 날짜마다 따로 탐색하는 계산: 현지 날짜의 첫 일출과 그 뒤 첫 일몰
+    t0 = ts.utc(date.year, date.month, date.day, 0, 0, -offset)
+    t1 = ts.tt_jd(t0.tt + 2)
+    times, events = almanac.find_discrete(t0, t1, almanac.sunrise_sunset(planets, location))
+
+    sunrise = sunset = None
+    for t, event in zip(times, events):
+        if event == 1 and sunrise is None and t.tt < t0.tt + 1:
+            sunrise = t.tt
+        elif event == 0 and sunset is None and sunrise is not None:
+            sunset = t.tt
+    return sunrise, sunset
+
+
+@pytest.mark.parametrize("latitude, longitude, timezone_id, start_date, num_days", [
+    (37.5665, 126.978, 'Asia/Seoul', datetime(2024, 1, 25), 14),  # 월 경계
+    (40.7128, -74.006, 'America/New_York', datetime(2024, 3, 5), 10),  # 서머타임 시작 (3월 10일)
+])
+def test_range_search_matches_per_day_search(latitude, longitude, timezone_id, start_date, num_days):
+    location = Topos(latitude * N, longitude * E)
+    end_date = start_date + timedelta(days=num_days - 1)
+    offsets = get_daily_utc_offsets(timezone_id, start_date, num_days, 0)
+
+    dates, sunrise_index, sunset_index, times = find_sunrise_sunset_events(location, start_date, end_date, offsets)
+
+    assert dates == [start_date + timedelta(days=i) for i in range(num_days)]
+    for date, rise_i, set_i, offset in zip(dates, sunrise_index, sunset_index, offsets.tolist()):
+        expected_sunrise, expected_sunset = per_day_events(location, date, offset)
+        assert rise_i >= 0 and set_i >= 0
+        # 탐색 구간이 달라 생기는 수치 오차만 허용 (1초)
+        assert times.tt[rise_i] == pytest.approx(expected_sunrise, abs=1 / 86400)
+        assert times.tt[set_i] == pytest.approx(expected_sunset, abs=1 / 86400)
+
+
+def test_polar_night_days_have_no_events():
+    location = Topos(78.2232 * N, 15.6267 * E)  # 스발바르 (12월 극야)
+    start_date = datetime(2024, 12, 10)
+
+    _, sunrise_index, sunset_index, _ = find_sunrise_sunset_events(
+        location, start_date, start_date + timedelta(days=4), np.full(5, 3600))
+
+    assert np.all(sunrise_index == -1)
+    assert np.all(sunset_index == -1)
@@ -0,0 +1,47 @@
+# tests/test_timezone_conversion.py
+
+from datetime import datetime
+
+from conftest import require_ephemeris
+
+# app.services 패키지 임포트 시 일출/일몰 서비스가 천체력을 로드함
+require_ephemeris()
+
+from app.services.timezone_conversion_service import get_daily_utc_offsets  # noqa: E402
+
+EST = -5 * 3600
+EDT = -4 * 3600
+
+
+def test_offsets_follow_dst_transitions():
+    # 2024-03-10 서머타임 시작, 2024-11-03 서머타임 종료 (현지 정오 기준)
+    spring = get_daily_utc_offsets('America/New_York', datetime(2024, 3, 9), 3)
+    autumn = get_daily_utc_offsets('America/New_York', datetime(2024, 11, 2), 3)
+
+    assert spring.tolist() == [EST, EDT, EDT]
+    assert autumn.tolist() == [EDT, EST, EST]
+
+
+def test_offsets_after_2037():
+    offsets = get_daily_utc_offsets('America/New_York', datetime(2040, 7, 1), 2)
+
+    assert offsets.tolist() == [EDT, EDT]
+
+
+def test_year_long_range_has_one_offset_per_day():
+    offsets = get_daily_utc_offsets('Europe/Berlin', datetime(2024, 1, 1), 366)
+
+    assert len(offsets) == 366
+    assert set(offsets.tolist()) == {3600, 7200}
+
+
+def test_fixed_offset_zone():
+    offsets = get_daily_utc_offsets('Asia/Seoul', datetime(2024, 1, 1), 3)
+
+    assert offsets.tolist() == [32400] * 3
+
+
+def test_unknown_zone_uses_fallback_offset():
+    assert get_daily_utc_offsets('Not/AZone', datetime(2024, 1, 1), 2, 3600).tolist() == [3600, 3600]
+    assert get_daily_utc_offsets(None, datetime(2024, 1, 1), 1, -7200).tolist() == [-7200]
+    assert get_daily_utc_offsets('Asia/Seoul', datetime(2024, 1, 1), 0).tolist() == []